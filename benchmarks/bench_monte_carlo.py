@@ -0,0 +1,100 @@
+"""
+Validation and throughput of the Monte Carlo engine (models.monte_carlo).
+
+- European calls and puts must agree with BlackScholes within Z_LIMIT standard errors.
+- A seed must give bit-identical results serially and on a process pool.
+- Every payoff is priced with and without variance reduction, reporting the standard error,
+  paths/second and the efficiency gain (variance x time, relative to plain sampling).
+
+Run from the project root:
+    python -m benchmarks.bench_monte_carlo
+    python -m benchmarks.bench_monte_carlo --paths 4000000 --workers 8
+
+Exits with a non-zero status if a check fails.
+"""
+import argparse
+import os
+import sys
+
+from models.bsm_model import BlackScholes
+from models.monte_carlo import PAYOFFS, monte_carlo_price
+
+INPUTS = dict(T=1.0, K=100.0, S=120.0, v=20.0, r=5.0, q=2.0)
+BARRIERS = {"up-and-out": 160.0, "down-and-out": 100.0}
+Z_LIMIT = 4.0
+SEED = 2024
+
+
+def check_european(paths: int) -> bool:
+    """
+    Simulated European prices against the closed form, with every combination of variance reduction.
+    """
+    record = BlackScholes(**INPUTS)
+    passed = True
+    for option_type, exact in (("call", record.call_price), ("put", record.put_price)):
+        for antithetic, control_variate in ((False, False), (True, False), (True, True)):
+            result = monte_carlo_price(
+                **INPUTS, option_type=option_type, paths=paths,
+                antithetic=antithetic, control_variate=control_variate, seed=SEED
+            )
+            z = (result.price - exact) / result.standard_error
+            status = "ok" if abs(z) <= Z_LIMIT else "FAIL"
+            passed &= abs(z) <= Z_LIMIT
+            print(
+                f"european {option_type:<4} antithetic={antithetic!s:<5} control={control_variate!s:<5} "
+                f"{result.price:10.5f} ± {result.standard_error:.5f} (closed form {exact:.5f}, z {z:+.2f}) {status}"
+            )
+    return passed
+
+
+def check_reproducible(paths: int, workers: int) -> bool:
+    """
+    The same seed serially and on a pool of workers.
+    """
+    options = dict(**INPUTS, option_type="put", payoff="asian", paths=paths, chunk_size=max(paths // 8, 2), seed=SEED)
+    serial = monte_carlo_price(**options)
+    parallel = monte_carlo_price(**options, workers=workers)
+    identical = serial.price == parallel.price and serial.standard_error == parallel.standard_error
+    print(
+        f"reproducible with {workers} workers: {'ok' if identical else 'FAIL'} "
+        f"(serial {serial.paths_per_second:,.0f} paths/s, pool {parallel.paths_per_second:,.0f} paths/s)"
+    )
+    return identical
+
+
+def variance_reduction(paths: int) -> None:
+    """
+    Standard error, throughput and efficiency gain of the variance reduction for every payoff.
+    """
+    print(f"\n{'payoff':<14}{'method':<22}{'price':>10}{'std err':>10}{'paths/s':>14}{'efficiency':>12}")
+    for payoff in PAYOFFS:
+        baseline = None
+        for label, antithetic, control_variate in (("plain", False, False), ("antithetic", True, False), ("antithetic + control", True, True)):
+            result = monte_carlo_price(
+                **INPUTS, payoff=payoff, barrier=BARRIERS.get(payoff), paths=paths,
+                antithetic=antithetic, control_variate=control_variate, seed=SEED
+            )
+            # work-normalised variance: lower is better, so the gain is baseline / this
+            cost = result.standard_error**2 * result.seconds
+            baseline = baseline or cost
+            print(
+                f"{payoff:<14}{label:<22}{result.price:10.4f}{result.standard_error:10.5f}"
+                f"{result.paths_per_second:14,.0f}{baseline / cost if cost else float('inf'):11.1f}x"
+            )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Validate and time the Monte Carlo engine.")
+    parser.add_argument("--paths", type=int, default=1_000_000, help="paths per European check")
+    parser.add_argument("--path-dependent-paths", type=int, default=200_000, help="paths per path-dependent run")
+    parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 4))
+    args = parser.parse_args(argv)
+
+    passed = check_european(args.paths)
+    passed &= check_reproducible(args.path_dependent_paths, max(args.workers, 2))
+    variance_reduction(args.path_dependent_paths)
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Microbenchmark of models.normal against scipy.stats.norm.
+Their accuracy against scipy is checked by tests/test_normal.py.
+
+Run from the project root:
+    python -m benchmarks.bench_normal
+"""
+import timeit
+
+import numpy as np
+from scipy.stats import norm
+
+from models.bsm_model import BlackScholes
+from models.normal import norm_cdf, norm_pdf
+
+
+def microbenchmark() -> None:
+    """
+    Per-call cost of the scalar paths, per-element cost of the array paths, and a full scalar theta().
+    """
+    x_scalar = 0.3721
+    x_array = np.random.default_rng(1).normal(size=1_000_000)
+
+    cases = [
+        ("cdf scalar", lambda: norm.cdf(x_scalar), lambda: norm_cdf(x_scalar), 20_000),
+        ("pdf scalar", lambda: norm.pdf(x_scalar), lambda: norm_pdf(x_scalar), 20_000),
+        ("cdf 1e6 array", lambda: norm.cdf(x_array), lambda: norm_cdf(x_array), 5),
+        ("pdf 1e6 array", lambda: norm.pdf(x_array), lambda: norm_pdf(x_array), 5),
+    ]
+
+    print(f"\n{'case':<16}{'scipy.stats':>14}{'models.normal':>16}{'speedup':>10}")
+    for name, reference, kernel, number in cases:
+        reference_time = min(timeit.repeat(reference, number=number, repeat=3)) / number
+        kernel_time = min(timeit.repeat(kernel, number=number, repeat=3)) / number
+        print(f"{name:<16}{reference_time * 1e6:>11.2f} us{kernel_time * 1e6:>13.2f} us{reference_time / kernel_time:>9.1f}x")
+
+    model = BlackScholes(1.0, 100.0, 120.0, 20.0, 5.0, 1.0)
+    theta_time = min(timeit.repeat(model.theta, number=20_000, repeat=3)) / 20_000
+    print(f"\nBlackScholes.theta(): {theta_time * 1e6:.2f} us per call")
+
+
+if __name__ == "__main__":
+    microbenchmark()
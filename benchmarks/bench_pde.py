@@ -0,0 +1,163 @@
+"""
+Accuracy and cost of the Crank-Nicolson PDE engine (models.pde).
+
+Accuracy, at the default grid:
+- European prices and Greeks against BlackScholes, and Leland prices against BlackScholesLeland
+- down-and-out calls against the closed-form (continuously monitored) barrier price
+- American puts and dividend-paying calls against a 20,000-step binomial tree
+Cost:
+- one solve for the whole spot grid vs one solve per spot
+- one solve for a strip of strikes vs one solve per strike
+
+Run from the project root:
+    python -m benchmarks.bench_pde
+
+Exits with a non-zero status if an error is past its tolerance; tests/test_pde.py runs the same checks.
+"""
+import sys
+import time
+
+import numpy as np
+
+from models.bsm_model import BlackScholes
+from models.bsm_leland_model import BlackScholesLeland
+from models.normal import norm_cdf
+from models.pde import pde_price
+
+EUROPEAN_TOLERANCE = 1e-3
+AMERICAN_TOLERANCE = 1e-2
+BINOMIAL_STEPS = 20_000
+
+
+def binomial_price(T, K, S, v, r, q, is_call: bool, steps: int = BINOMIAL_STEPS) -> float:
+    """
+    Cox-Ross-Rubinstein price of an American option (inputs as in BlackScholes), the reference for early exercise.
+    """
+    v, r, q = v / 100, r / 100, q / 100
+    step = T / steps
+    up = np.exp(v * np.sqrt(step))
+    probability = (np.exp((r - q) * step) - 1 / up) / (up - 1 / up)
+    discount = np.exp(-r * step)
+
+    spots = S * up ** np.arange(steps, -steps - 1, -2.0)
+    values = np.maximum(spots - K, 0.0) if is_call else np.maximum(K - spots, 0.0)
+    for _ in range(steps):
+        spots = spots[:-1] / up
+        values = discount * (probability * values[:-1] + (1 - probability) * values[1:])
+        values = np.maximum(values, spots - K if is_call else K - spots)
+    return float(values[0])
+
+
+def down_and_out_call(T, K, S, v, r, q, barrier) -> float:
+    """
+    Closed-form down-and-out call (barrier below the strike, no rebate).
+    """
+    v, r, q = v / 100, r / 100, q / 100
+    power = (r - q + v**2 / 2) / v**2
+    vol_sqrt_T = v * np.sqrt(T)
+    y = np.log(barrier**2 / (S * K)) / vol_sqrt_T + power * vol_sqrt_T
+    down_and_in = (
+        S * np.exp(-q * T) * (barrier / S) ** (2 * power) * norm_cdf(y)
+        - K * np.exp(-r * T) * (barrier / S) ** (2 * power - 2) * norm_cdf(y - vol_sqrt_T)
+    )
+    return BlackScholes(T, K, S, v * 100, r * 100, q * 100).call_price - down_and_in
+
+
+def accuracy_cases() -> list:
+    """
+    (label, pde value, reference value, tolerance) for every accuracy check, as zero-argument callables
+    so the binomial references are only built when a case runs (also collected by tests/test_pde.py).
+    """
+    T, K, S, v, r, q = 1.0, 100.0, 120.0, 20.0, 5.0, 2.0
+    record = BlackScholes(T, K, S, v, r, q)
+    cases = []
+
+    for option_type, index in (("call", 0), ("put", 1)):
+        european = lambda option_type=option_type: pde_price(T, K, S, v, r, q, option_type)
+        cases += [
+            (f"european {option_type} price", lambda european=european: european().price, lambda index=index: record.prices[index], EUROPEAN_TOLERANCE),
+            (f"european {option_type} delta", lambda european=european: european().delta, lambda index=index: record.delta()[index], EUROPEAN_TOLERANCE),
+            (f"european {option_type} gamma", lambda european=european: european().gamma, record.gamma, EUROPEAN_TOLERANCE),
+            (f"european {option_type} theta", lambda european=european: european().theta, lambda index=index: record.theta()[index], EUROPEAN_TOLERANCE),
+        ]
+
+    cases.append((
+        "leland call price (k=1%, dt=5)",
+        lambda: pde_price(T, K, S, v, r, q, "call", k=1.0, dt=5.0).price,
+        lambda: BlackScholesLeland(T, K, S, v, r, q, 1.0, 5.0).call_price,
+        EUROPEAN_TOLERANCE,
+    ))
+    cases.append((
+        "down-and-out call (H=90)",
+        lambda: pde_price(T, K, 100.0, v, r, q, "call", barrier=90.0, barrier_type="down-and-out").price,
+        lambda: down_and_out_call(T, K, 100.0, v, r, q, 90.0),
+        EUROPEAN_TOLERANCE,
+    ))
+
+    for spot in (90.0, 100.0, 110.0):
+        cases.append((
+            f"american put (S={spot:.0f})",
+            lambda spot=spot: pde_price(T, K, spot, v, r, 0.0, "put", "american").price,
+            lambda spot=spot: binomial_price(T, K, spot, v, r, 0.0, is_call=False),
+            AMERICAN_TOLERANCE,
+        ))
+    cases.append((
+        "american call (S=100, q=3%)",
+        lambda: pde_price(T, K, 100.0, v, r, 3.0, "call", "american").price,
+        lambda: binomial_price(T, K, 100.0, v, r, 3.0, is_call=True),
+        AMERICAN_TOLERANCE,
+    ))
+    return cases
+
+
+def check_accuracy() -> bool:
+    print(f"{'case':<42}{'pde':>12}{'reference':>12}{'abs error':>11}")
+    passed = True
+    for label, value, reference, tolerance in accuracy_cases():
+        value, reference = value(), reference()
+        error = abs(value - reference)
+        print(f"{label:<42}{value:12.6f}{reference:12.6f}{error:11.2e}  {'ok' if error <= tolerance else 'FAIL'}")
+        passed &= error <= tolerance
+    return passed
+
+
+def measure_cost() -> None:
+    T, K, v, r, q = 1.0, 100.0, 20.0, 5.0, 0.0
+    pde_price(T, K, 100.0, v, r, q, "put", "american")  # warm-up (imports LAPACK)
+
+    spots = np.linspace(60, 160, 101)
+    start = time.perf_counter()
+    grid = pde_price(T, K, 100.0, v, r, q, "put", "american")
+    one_solve = time.perf_counter() - start
+    start = time.perf_counter()
+    for spot in spots:
+        pde_price(T, K, spot, v, r, q, "put", "american")
+    per_spot = time.perf_counter() - start
+    print(
+        f"\n{len(spots)} spots, American put: one grid solve {one_solve * 1e3:.1f} ms "
+        f"({len(grid.spots)} spots with delta/gamma/theta) vs one solve per spot {per_spot * 1e3:.0f} ms "
+        f"({per_spot / one_solve:.0f}x)"
+    )
+
+    strikes = np.linspace(80, 140, 61)
+    start = time.perf_counter()
+    pde_price(T, strikes, 110.0, v, r, q, "put", "american")
+    together = time.perf_counter() - start
+    start = time.perf_counter()
+    for strike in strikes:
+        pde_price(T, strike, 110.0, v, r, q, "put", "american")
+    separately = time.perf_counter() - start
+    print(
+        f"{len(strikes)} strikes, American put: one solve {together * 1e3:.0f} ms vs one per strike "
+        f"{separately * 1e3:.0f} ms ({separately / together:.1f}x)"
+    )
+
+
+def main() -> int:
+    passed = check_accuracy()
+    measure_cost()
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
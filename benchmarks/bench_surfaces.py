@@ -0,0 +1,145 @@
+"""
+Benchmark for surface generation: per-point np.vectorize evaluation vs one broadcast call over the grid.
+
+Run from the project root:
+    python -m benchmarks.bench_surfaces
+    python -m benchmarks.bench_surfaces --sizes 30 100 500
+    python -m benchmarks.bench_surfaces --accuracy --sizes 20 30 60   # uniform vs adaptive mesh error
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from models.bsm_model import BlackScholes
+from models.bsm_leland_model import BlackScholesLeland
+from graphPlots.plot_option_bsm import PlotOptionBSM
+from graphPlots.plot_option_bsml import PlotOptionBSML
+from graphPlots.plot_bsmVsbsml import PlotBsmVsBsml
+from core.surfaces import compute_bsm_surface, compute_leland_surface, compute_bsm_vs_leland_surface
+
+# resolution of the reference surface the coarse meshes are interpolated against
+REFERENCE_RESOLUTION = 800
+
+# sidebar defaults from views/bsm.py, with a non-zero hedging interval so Leland is defined
+S, v, r, q, k, dt = 120.0, 20.0, 5.0, 0.0, 1.0, 5.0
+STRIKE_MIN, STRIKE_MAX = S * 0.8, S * 1.2
+MATURITY_MIN, MATURITY_MAX = 0.1, 2.0
+
+
+def legacy_bsm(K_val, T_val) -> tuple:
+    """
+    The previous per-point evaluation: one BlackScholes object per grid point.
+    """
+    return BlackScholes(T_val, K_val, S, v, r, q).calculate_prices()
+
+
+def legacy_leland(K_val, T_val) -> tuple:
+    """
+    The previous per-point evaluation: one BlackScholesLeland object per grid point.
+    """
+    return BlackScholesLeland(T_val, K_val, S, v, r, q, k, dt).calculate_prices()
+
+
+def legacy_difference(K_val, T_val) -> tuple:
+    """
+    The previous per-point difference (without the st.cache_data hashing it also paid).
+    """
+    bsm_call, bsm_put = legacy_bsm(K_val, T_val)
+    l_call, l_put = legacy_leland(K_val, T_val)
+    return l_call - bsm_call, l_put - bsm_put
+
+
+def time_call(func, *args, repeat: int = 3) -> float:
+    """
+    Returns the best wall-clock time of `repeat` runs, in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, repeat: int) -> None:
+    bsm = PlotOptionBSM(STRIKE_MIN, STRIKE_MAX, MATURITY_MIN, MATURITY_MAX, S, v, r, q)
+    leland = PlotOptionBSML(STRIKE_MIN, STRIKE_MAX, MATURITY_MIN, MATURITY_MAX, S, v, r, q, k, dt)
+    difference = PlotBsmVsBsml(STRIKE_MIN, STRIKE_MAX, MATURITY_MIN, MATURITY_MAX, S, v, r, q, k, dt)
+
+    cases = [
+        ("PlotOptionBSM", legacy_bsm, bsm.compute_option_price),
+        ("PlotOptionBSML", legacy_leland, leland.compute_option_price),
+        ("PlotBsmVsBsml", legacy_difference, difference.compute_difference),
+    ]
+
+    print(f"{'surface':<16}{'grid':>10}{'np.vectorize (s)':>18}{'broadcast (s)':>16}{'speedup':>10}")
+    for size in sizes:
+        strikes = np.linspace(STRIKE_MIN, STRIKE_MAX, size)
+        maturities = np.linspace(MATURITY_MIN, MATURITY_MAX, size)
+        K_grid, T_grid = np.meshgrid(strikes, maturities)
+
+        for name, legacy, vectorized in cases:
+            # the legacy path is slow at large sizes, so it only runs once there
+            legacy_time = time_call(np.vectorize(legacy), K_grid, T_grid, repeat=repeat if size <= 100 else 1)
+            vectorized_time = time_call(vectorized, K_grid, T_grid, repeat=repeat)
+            print(f"{name:<16}{f'{size}x{size}':>10}{legacy_time:>18.4f}{vectorized_time:>16.5f}{legacy_time / vectorized_time:>9.0f}x")
+
+
+def interpolation_error(surface, reference) -> float:
+    """
+    Largest absolute error of the bilinear interpolation of a (possibly non-uniform) surface, over the reference grid.
+    """
+    from scipy.interpolate import RegularGridInterpolator
+
+    K_grid, T_grid, *values = surface
+    K_ref, T_ref, *reference_values = reference
+    points = np.stack([T_ref.ravel(), K_ref.ravel()], axis=1)
+    error = 0.0
+    for grid, exact in zip(values, reference_values):
+        interpolated = RegularGridInterpolator((T_grid[:, 0], K_grid[0]), grid)(points).reshape(K_ref.shape)
+        error = max(error, np.nanmax(np.abs(interpolated - exact)))
+    return error
+
+
+def run_accuracy(sizes) -> None:
+    """
+    Uniform vs adaptive mesh: points used and worst interpolation error against a fine reference surface,
+    for the default range and one reaching down to a few trading days.
+    """
+    cases = [
+        ("bsm", compute_bsm_surface, (S, v, r, q)),
+        ("leland", compute_leland_surface, (S, v, r, q, k, dt)),
+        ("leland - bsm", compute_bsm_vs_leland_surface, (S, v, r, q, k, dt)),
+    ]
+    ranges = [(STRIKE_MIN, STRIKE_MAX, MATURITY_MIN, MATURITY_MAX), (STRIKE_MIN, STRIKE_MAX, 0.01, MATURITY_MAX)]
+
+    print(f"{'surface':<14}{'maturities':>12}{'res':>6}{'uniform pts':>13}{'max error':>11}{'adaptive pts':>14}{'max error':>11}{'gain':>7}")
+    for plot_range in ranges:
+        for name, compute, inputs in cases:
+            reference = compute(*plot_range, *inputs, resolution=REFERENCE_RESOLUTION)
+            for size in sizes:
+                uniform = compute(*plot_range, *inputs, resolution=size)
+                adaptive = compute(*plot_range, *inputs, resolution=size, adaptive=True)
+                uniform_error = interpolation_error(uniform, reference)
+                adaptive_error = interpolation_error(adaptive, reference)
+                print(
+                    f"{name:<14}{f'{plot_range[2]}-{plot_range[3]}':>12}{size:>6}"
+                    f"{uniform[0].size:>13}{uniform_error:>11.4f}{adaptive[0].size:>14}{adaptive_error:>11.4f}"
+                    f"{uniform_error / adaptive_error:>6.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark option surface grid evaluation.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[30, 500], help="grid sizes (N for an N x N grid)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best time is reported)")
+    parser.add_argument("--accuracy", action="store_true", help="compare uniform and adaptive mesh interpolation error instead of timing")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", RuntimeWarning)
+    if args.accuracy:
+        run_accuracy(args.sizes)
+    else:
+        run(args.sizes, args.repeat)
@@ -0,0 +1,141 @@
+"""
+Import-time profile of the app's entry points, and a check that heavy packages stay lazy.
+
+Every measurement runs in a fresh interpreter, like a cold server start:
+- modules are imported under `python -X importtime` and their cumulative import time is reported;
+- pages are run once with streamlit's AppTest (pre-warm and disk cache off), timing the first render.
+Both list which heavy packages ended up loaded. scipy, matplotlib and friends should only load
+when a page actually prices arrays or draws a surface, not when the app or an info page starts.
+
+Run from the project root:
+    python -m benchmarks.import_time                # print the profile
+    python -m benchmarks.import_time --check        # also exit 1 if an eager heavy import came back
+    python -m benchmarks.import_time --repeat 5     # median of 5 cold runs per entry
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ("scipy", "matplotlib", "mpl_toolkits", "pandas", "pyarrow", "numpy")
+PLOTTING = ("scipy", "matplotlib", "mpl_toolkits", "pandas", "pyarrow")
+
+# entry module -> heavy packages it must not load on import
+MODULES = {
+    "functions.prewarm": HEAVY,           # imported by streamlit_app.py at server start
+    "functions.assets": HEAVY,            # the only project import of the info pages
+    "functions.helper": PLOTTING,
+    "functions.computations": PLOTTING,
+    "functions.graph_surface_helper": PLOTTING,
+    "graphPlots.plot_option_bsm": PLOTTING,
+    "graphPlots.plot_option_bsml": PLOTTING,
+    "graphPlots.plot_bsmVsbsml": PLOTTING,
+    "graphPlots.plot_surface": PLOTTING,
+    "core": PLOTTING,
+}
+
+# page script -> heavy packages its first render must not load (streamlit itself brings in numpy for st.image)
+PAGES = {
+    "streamlit_app.py": PLOTTING,         # the default page
+    "views/about_me.py": PLOTTING,
+    "views/bsm_info.py": PLOTTING,
+    "views/bsm.py": (),                   # prices and draws on first load; reported, not checked
+}
+
+_PAGE_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({path!r}, default_timeout=300)
+app.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1e3, "errors": [str(error.value) for error in app.exception],
+                  "loaded": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+def _environment() -> dict:
+    return {**os.environ, "PYTHONPATH": ROOT, "MPLBACKEND": "Agg", "BSM_PREWARM": "0", "BSM_DISK_CACHE_MB": "0"}
+
+
+def profile_module(module: str) -> dict:
+    """
+    Cumulative import time of a module in a fresh interpreter, and the heavy packages it loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=_environment(), capture_output=True, text=True, check=True
+    )
+    # lines look like "import time:  self [us] | cumulative | imported package", nested packages indented
+    cumulative, loaded = {}, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        cumulative[name] = int(total)
+        loaded.add(name.split(".")[0])
+    return {"ms": cumulative.get(module, 0) / 1e3, "loaded": [name for name in HEAVY if name in loaded]}
+
+
+def profile_page(path: str) -> dict:
+    """
+    Wall time of a page's first run (including streamlit's own imports) in a fresh interpreter.
+    """
+    snippet = _PAGE_SNIPPET.format(path=os.path.join(ROOT, path), heavy=HEAVY)
+    result = subprocess.run(
+        [sys.executable, "-c", snippet], cwd=ROOT, env=_environment(), capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(repeat: int) -> tuple:
+    """
+    Profiles every module and page (median of repeat cold runs) and returns (rows, violations).
+    """
+    rows, violations = [], []
+    entries = [("module", name, forbidden, profile_module) for name, forbidden in MODULES.items()]
+    entries += [("page", name, forbidden, profile_page) for name, forbidden in PAGES.items()]
+
+    print(f"{'entry':<40}{'cold ms':>10}  heavy packages loaded")
+    for kind, name, forbidden, profile in entries:
+        runs = [profile(name) for _ in range(repeat)]
+        loaded = runs[-1]["loaded"]
+        eager = [package for package in loaded if package in forbidden]
+        errors = runs[-1].get("errors")
+        ms = statistics.median(run["ms"] for run in runs)
+        rows.append({"kind": kind, "entry": name, "ms": round(ms, 1), "loaded": loaded})
+
+        flag = f"  EAGER: {', '.join(eager)}" if eager else ""
+        print(f"{name:<40}{ms:>10.0f}  {', '.join(loaded) or '-'}{flag}", flush=True)
+        if eager:
+            violations.append(f"{name} loads {', '.join(eager)}")
+        if errors:
+            violations.append(f"{name} raised {errors}")
+    return rows, violations
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Profile cold import times and check that heavy imports stay lazy.")
+    parser.add_argument("--repeat", type=int, default=1, help="cold runs per entry (the median is reported)")
+    parser.add_argument("--check", action="store_true", help="exit 1 if an entry point eagerly loads a forbidden package")
+    parser.add_argument("--output", help="write the profile to this JSON file")
+    args = parser.parse_args(argv)
+
+    rows, violations = run(args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"python": sys.version.split()[0], "entries": rows}, output_file, indent=2)
+
+    if args.check and violations:
+        print("\n" + "\n".join(violations), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Benchmark suite for pricing, Greeks, implied volatility and surface generation.
+
+Every case is timed at several problem sizes, the results are written as JSON, and (optionally)
+compared against a stored baseline so regressions fail loudly.
+
+Run from the project root:
+    python -m benchmarks.run_benchmarks                                   # run and print
+    python -m benchmarks.run_benchmarks --output results.json             # also save the results
+    python -m benchmarks.run_benchmarks --compare benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks.run_benchmarks --quick --output benchmarks/baseline.json   # refresh the baseline
+
+Case names are "<case>[<path>,<size>]". The scalar path loops over the model classes one contract
+at a time; the vectorized path prices the same contracts with one array call.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import warnings
+from datetime import datetime, timezone
+
+import numpy as np
+
+from models.bsm_model import BlackScholes
+from models.bsm_leland_model import BlackScholesLeland
+from models.bsm_vectorized import batch_greeks, batch_prices
+from models.bsm_leland_vectorized import batch_leland
+from models.contracts import OptionContracts
+from models.implied_volatility import implied_volatility_batch
+from core.surfaces import build_grid
+
+DEFAULT_SIZES = [1, 1_000, 1_000_000]
+DEFAULT_GRIDS = [30, 100, 300, 1000]
+QUICK_SIZES = [1, 1_000, 100_000]
+QUICK_GRIDS = [30, 100, 300]
+
+# the scalar path costs microseconds per contract, so it is only timed up to this many contracts
+SCALAR_MAX = 1_000
+
+# surface inputs match the sidebar defaults in views/bsm.py, with Leland enabled
+S, v, r, q, k, dt = 120.0, 20.0, 5.0, 0.0, 1.0, 5.0
+STRIKE_MIN, STRIKE_MAX = S * 0.8, S * 1.2
+MATURITY_MIN, MATURITY_MAX = 0.1, 2.0
+
+
+def make_contracts(n: int, seed: int = 0) -> dict:
+    """
+    A reproducible book of n contracts with mixed calls and puts and their model prices as quotes.
+    """
+    rng = np.random.default_rng(seed)
+    book = {
+        "T": rng.uniform(0.05, 2.0, n),
+        "K": rng.uniform(80.0, 160.0, n),
+        "S": np.full(n, S),
+        "v": rng.uniform(10.0, 50.0, n),
+        "r": rng.uniform(0.0, 8.0, n),
+        "q": rng.uniform(0.0, 3.0, n),
+        "k": np.full(n, k),
+        "dt": np.full(n, dt),
+        "option_type": np.where(rng.random(n) < 0.5, "call", "put"),
+    }
+    call, put = batch_prices(book["T"], book["K"], book["S"], book["v"], book["r"], book["q"])
+    book["market_price"] = np.where(book["option_type"] == "call", call, put)
+    leland = batch_leland(book["T"], book["K"], book["S"], book["v"], book["r"], book["q"], book["k"], book["dt"])
+    book["leland_price"] = np.where(book["option_type"] == "call", leland.call_price, leland.put_price)
+    return book
+
+
+def time_case(func, min_time: float = 0.2, repeat: int = 3) -> float:
+    """
+    Best seconds per call: calls are batched until a batch takes at least min_time, then repeated.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def scalar_rows(book: dict) -> list:
+    keys = ["T", "K", "S", "v", "r", "q"]
+    return [tuple(float(book[key][i]) for key in keys) for i in range(len(book["T"]))]
+
+
+def contract_cases(n: int) -> dict:
+    """
+    Scalar and vectorized cases for a book of n contracts.
+    """
+    book = make_contracts(n)
+    T, K, S_, v_, r_, q_ = (book[key] for key in ["T", "K", "S", "v", "r", "q"])
+    cases = {}
+
+    if n <= SCALAR_MAX:
+        rows = scalar_rows(book)
+        leland_rows = [row + (k, dt) for row in rows]
+        # the scalar solvers start from the model's volatility, so start them from a flat 20% rather than the answer
+        iv_rows = [row[:3] + (20.0,) + row[4:] for row in rows]
+        quotes = list(zip(book["option_type"], book["market_price"].tolist()))
+        leland_quotes = list(zip(book["option_type"], book["leland_price"].tolist()))
+
+        cases["BlackScholes.__init__"] = lambda: [BlackScholes(*row) for row in rows]
+        cases["BlackScholes.calculate_prices"] = lambda: [BlackScholes(*row).calculate_prices() for row in rows]
+        # each repeat builds fresh records: reused ones would serve d1/d2 and discounts from their lazy caches
+        for greek in ["vega", "gamma", "delta", "theta", "rho"]:
+            cases[f"BlackScholes.{greek}"] = lambda greek=greek: [getattr(BlackScholes(*row), greek)() for row in rows]
+        cases["BlackScholesLeland.__init__"] = lambda: [BlackScholesLeland(*row) for row in leland_rows]
+        cases["BlackScholesLeland.calculate_prices"] = lambda: [BlackScholesLeland(*row).calculate_prices() for row in leland_rows]
+        cases["BlackScholes.implied_volatility"] = lambda: [
+            BlackScholes(*row).implied_volatility(option_type, price) for row, (option_type, price) in zip(iv_rows, quotes)
+        ]
+        cases["BlackScholesLeland.implied_volatility"] = lambda: [
+            BlackScholesLeland(*row, k, dt).implied_volatility(option_type, price) for row, (option_type, price) in zip(iv_rows, leland_quotes)
+        ]
+        cases = {f"{name}[scalar,n={n}]": func for name, func in cases.items()}
+
+    vectorized = {
+        "OptionContracts.__init__": lambda: OptionContracts(T, K, S_, v_, r_, q_, book["k"], book["dt"]),
+        "BlackScholes.calculate_prices": lambda: batch_prices(T, K, S_, v_, r_, q_),
+        "BlackScholes.greeks": lambda: batch_greeks(T, K, S_, v_, r_, q_),
+        "BlackScholesLeland.greeks": lambda: batch_leland(T, K, S_, v_, r_, q_, book["k"], book["dt"]),
+        "BlackScholes.implied_volatility": lambda: implied_volatility_batch(book["option_type"], book["market_price"], T, K, S_, r_, q_),
+        "BlackScholesLeland.implied_volatility": lambda: implied_volatility_batch(
+            book["option_type"], book["leland_price"], T, K, S_, r_, q_, book["k"], book["dt"]
+        ),
+    }
+    cases.update({f"{name}[vectorized,n={n}]": func for name, func in vectorized.items()})
+    return cases
+
+
+def surface_cases(size: int) -> dict:
+    """
+    Grid evaluation of the three graphPlots surface builders on a size x size grid,
+    plus the full matplotlib render at the default resolution.
+    """
+    from graphPlots.plot_option_bsm import PlotOptionBSM
+    from graphPlots.plot_option_bsml import PlotOptionBSML
+    from graphPlots.plot_bsmVsbsml import PlotBsmVsBsml
+
+    K_grid, T_grid = build_grid(STRIKE_MIN, STRIKE_MAX, MATURITY_MIN, MATURITY_MAX, size)
+    plotters = {
+        "PlotOptionBSM": PlotOptionBSM(STRIKE_MIN, STRIKE_MAX, MATURITY_MIN, MATURITY_MAX, S, v, r, q),
+        "PlotOptionBSML": PlotOptionBSML(STRIKE_MIN, STRIKE_MAX, MATURITY_MIN, MATURITY_MAX, S, v, r, q, k, dt),
+        "PlotBsmVsBsml": PlotBsmVsBsml(STRIKE_MIN, STRIKE_MAX, MATURITY_MIN, MATURITY_MAX, S, v, r, q, k, dt),
+    }
+
+    cases = {}
+    for name, plotter in plotters.items():
+        compute = plotter.compute_difference if name == "PlotBsmVsBsml" else plotter.compute_option_price
+        cases[f"{name}.grid[{size}x{size}]"] = lambda compute=compute: compute(K_grid, T_grid)
+
+    if size == 30:
+        import matplotlib.pyplot as plt
+
+        def render(plotter):
+            plt.close(plotter.plot_option_surface("Call", 20, 330))
+
+        for name, plotter in plotters.items():
+            cases[f"{name}.plot_option_surface[30x30]"] = lambda plotter=plotter: render(plotter)
+
+    return cases
+
+
+def run(sizes, grids) -> dict:
+    results = {}
+    groups = [contract_cases(n) for n in sizes] + [surface_cases(size) for size in grids]
+    for cases in groups:
+        for name, func in cases.items():
+            seconds = time_case(func)
+            results[name] = seconds
+            print(f"{name:<60}{seconds * 1e3:>14.4f} ms", flush=True)
+    return results
+
+
+def metadata() -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Cases that got slower than baseline * (1 + threshold). Cases missing from either side are skipped.
+    """
+    regressions = []
+    print(f"\n{'case':<60}{'baseline ms':>14}{'current ms':>14}{'change':>10}")
+    for name, seconds in results.items():
+        if name not in baseline:
+            continue
+        change = seconds / baseline[name] - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:<60}{baseline[name] * 1e3:>14.4f}{seconds * 1e3:>14.4f}{change:>+9.0%}{flag}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the pricing benchmark suite.")
+    parser.add_argument("--sizes", type=int, nargs="+", help=f"contract counts (default: {DEFAULT_SIZES})")
+    parser.add_argument("--grids", type=int, nargs="+", help=f"surface grid sizes N for N x N (default: {DEFAULT_GRIDS})")
+    parser.add_argument("--quick", action="store_true", help=f"smaller sizes ({QUICK_SIZES}, grids {QUICK_GRIDS})")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before a case counts as a regression (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    grids = args.grids or (QUICK_GRIDS if args.quick else DEFAULT_GRIDS)
+
+    warnings.simplefilter("ignore", RuntimeWarning)
+    results = run(sizes, grids)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"meta": metadata(), "results": results}, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}", file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
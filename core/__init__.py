@@ -0,0 +1,35 @@
+"""
+Headless pricing core: the models, the vectorized engines and the memoised computations.
+
+Nothing in this package imports Streamlit or matplotlib, so batch jobs and workers can
+`import core` without pulling in the web stack.
+"""
+from models.bsm_model import BlackScholes
+from models.bsm_leland_model import BlackScholesLeland
+from models.contracts import OptionContracts
+from models.bsm_vectorized import OptionGreeks, batch_prices, batch_greeks
+from models.bsm_leland_vectorized import LelandBatchResult, batch_leland
+from models.greeks import compute_all_greeks, compute_greeks_by_model
+from models.implied_volatility import implied_volatility_batch
+from models.monte_carlo import MonteCarloResult, monte_carlo_price
+from models.hedging import HedgingReport, HedgingResult, simulate_hedging
+from models.pde import PDEResult, pde_price
+
+from core.computations import (
+    get_bsm_prices,
+    get_leland_prices,
+    get_implied_volatility,
+    get_greeks,
+    get_greeks_by_model,
+    get_theta,
+    get_vega,
+    get_gamma,
+    get_delta,
+    get_rho
+)
+from core.surfaces import (
+    build_grid,
+    compute_bsm_surface,
+    compute_leland_surface,
+    compute_bsm_vs_leland_surface
+)
@@ -0,0 +1,184 @@
+"""
+Streaming batch pricer for files of option contracts.
+
+Reads the input in fixed-size chunks, prices each chunk with the vectorized engines and
+appends the results to the output file, so memory stays bounded by the chunk size.
+
+Usage (from the project root):
+    python -m core.batch contracts.csv priced.csv
+    python -m core.batch contracts.parquet priced.parquet --model leland --chunk-size 500000
+    python -m core.batch contracts.parquet priced.parquet --workers 32 --chunk-size 2000000
+
+Input columns (units as in BlackScholes / BlackScholesLeland):
+- T, K, S, v, r, q: required
+- k, dt: required for --model leland
+- option_type, market_price: optional; when both are present an implied_volatility column is added
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+import pandas as pd
+
+from models.bsm_vectorized import batch_greeks
+from models.bsm_leland_vectorized import batch_leland
+from models.implied_volatility import implied_volatility_batch
+from core.parallel import WorkerStats, format_worker_stats, parallel_greeks, parallel_implied_volatility
+
+BSM_COLUMNS = ["T", "K", "S", "v", "r", "q"]
+LELAND_COLUMNS = BSM_COLUMNS + ["k", "dt"]
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def _is_parquet(path: str) -> bool:
+    return path.lower().endswith((".parquet", ".pq"))
+
+
+def read_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Yields the input file as DataFrames of at most chunk_size rows.
+    """
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for record_batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield record_batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+def price_chunk(frame: pd.DataFrame, model: str = "bsm", pool: ProcessPoolExecutor = None, worker_stats: list = None, workers: int = None) -> pd.DataFrame:
+    """
+    Adds prices, Greeks and (if quotes are present) implied volatility columns to one chunk.
+    With a process pool the chunk is sharded across it and the per-worker stats are appended to worker_stats;
+    workers is the pool's size, which the shards are sized for.
+    """
+    required = LELAND_COLUMNS if model == "leland" else BSM_COLUMNS
+    missing = [column for column in required if column not in frame.columns]
+    if missing:
+        raise ValueError(f"Input is missing required columns for the {model} model: {missing}")
+
+    inputs = [frame[column].to_numpy(dtype=float) for column in required]
+
+    if pool is not None:
+        greeks, stats = parallel_greeks(*inputs, workers=workers, pool=pool)
+        _extend(worker_stats, stats)
+    elif model == "leland":
+        greeks = batch_leland(*inputs)
+    else:
+        greeks = batch_greeks(*inputs)
+
+    result = frame.copy()
+    # write the inputs back as float64: a chunk whose column happens to be all integers must not
+    # fix an int64 output schema that a later chunk with fractional values cannot be cast to
+    for column, values in zip(required, inputs):
+        result[column] = values
+    for field in greeks._fields:
+        result[field] = getattr(greeks, field)
+
+    if "option_type" in frame.columns and "market_price" in frame.columns:
+        T, K, S, _, r, q = inputs[:6]
+        k, dt = (inputs[6], inputs[7]) if model == "leland" else (None, None)
+        result["market_price"] = frame["market_price"].to_numpy(dtype=float)
+        quotes = (frame["option_type"].to_numpy(dtype=str), result["market_price"].to_numpy(), T, K, S, r, q, k, dt)
+        if pool is not None:
+            result["implied_volatility"], stats = parallel_implied_volatility(*quotes, workers=workers, pool=pool)
+            _extend(worker_stats, stats)
+        else:
+            result["implied_volatility"] = implied_volatility_batch(*quotes)
+
+    return result
+
+
+def _extend(worker_stats, stats) -> None:
+    if worker_stats is not None:
+        worker_stats.extend(stats)
+
+
+def price_stream(chunks: Iterator[pd.DataFrame], model: str = "bsm", pool: ProcessPoolExecutor = None, worker_stats: list = None, workers: int = None) -> Iterator[pd.DataFrame]:
+    """
+    Lazily prices each chunk as it is pulled through the pipeline.
+    """
+    for frame in chunks:
+        yield price_chunk(frame, model, pool, worker_stats, workers)
+
+
+def write_chunks(chunks: Iterator[pd.DataFrame], path: str) -> int:
+    """
+    Streams priced chunks to a CSV or Parquet file and returns the number of rows written.
+    Both formats go through pyarrow's incremental writers, which are far faster than DataFrame.to_csv.
+    """
+    import pyarrow as pa
+
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        writer_class = pq.ParquetWriter
+    else:
+        import pyarrow.csv as pa_csv
+        writer_class = pa_csv.CSVWriter
+
+    rows = 0
+    writer = None
+    schema = None
+    try:
+        for frame in chunks:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                schema = table.schema
+                writer = writer_class(path, schema)
+            else:
+                # price_chunk writes every numeric input back as float64, so this only aligns the
+                # pass-through columns (ids, tickers, ...) to the first chunk's schema
+                table = table.cast(schema)
+            writer.write_table(table)
+            rows += len(frame)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows
+
+
+def _merge_worker_stats(worker_stats: list) -> list:
+    """
+    Sums the stats of each worker process over every chunk and engine call.
+    """
+    merged = {}
+    for stat in worker_stats:
+        shards, rows, seconds = merged.get(stat.pid, (0, 0, 0.0))
+        merged[stat.pid] = (shards + stat.shards, rows + stat.rows, seconds + stat.seconds)
+    return [WorkerStats(pid, *values) for pid, values in sorted(merged.items())]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Price a CSV/Parquet file of option contracts in bounded memory.")
+    parser.add_argument("input", help="input .csv or .parquet file")
+    parser.add_argument("output", help="output .csv or .parquet file")
+    parser.add_argument("--model", choices=["bsm", "leland"], default="bsm", help="pricing model (default: bsm)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows per chunk (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=1, help="processes to shard each chunk across (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    worker_stats = []
+    start = time.perf_counter()
+    # one pool for the whole run, so worker processes are started once and reused by every chunk
+    pool = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    try:
+        chunks = price_stream(read_chunks(args.input, args.chunk_size), args.model, pool, worker_stats, args.workers)
+        rows = write_chunks(chunks, args.output)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    elapsed = time.perf_counter() - start
+
+    print(f"Priced {rows} contracts in {elapsed:.2f}s ({rows / max(elapsed, 1e-9):,.0f} rows/s)", file=sys.stderr)
+    if worker_stats:
+        print(format_worker_stats(_merge_worker_stats(worker_stats)), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
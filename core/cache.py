@@ -0,0 +1,239 @@
+"""
+Bounded, instrumented in-process cache.
+
+Every cache has an entry limit, a byte limit, an optional time-to-live and an eviction policy
+(LRU or LFU), and counts its hits, misses, evictions and resident bytes so a long-running server
+keeps predictable memory. Caches register themselves by name so their counters can be exported
+together with cache_stats().
+"""
+import functools
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
+
+from core.instrumentation import current_rerun
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def register_cache(cache) -> None:
+    """
+    Adds a cache (anything with a name and a stats() method) to the cache_stats() export.
+    """
+    with _registry_lock:
+        _registry[cache.name] = cache
+
+
+def estimate_bytes(value) -> int:
+    """
+    Approximate resident size of a cached value.
+    Arrays report their buffer size, containers are summed, anything else is measured by pickling.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (int, float, bool, str, bytes, np.generic)) or value is None:
+        return sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_bytes(item) for item in value)
+    if isinstance(value, (dict, MappingProxyType)):
+        return sys.getsizeof(value) + sum(estimate_bytes(key) + estimate_bytes(item) for key, item in value.items())
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+def freeze(value):
+    """
+    Read-only version of a value, so one cached object can be shared by every caller.
+    Arrays become non-writeable views (the function's own array stays writeable), dicts become
+    mappingproxies and lists become tuples; containers (including NamedTuples) are frozen recursively.
+    """
+    if isinstance(value, np.ndarray):
+        value = value.view()
+        value.flags.writeable = False
+        return value
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*(freeze(item) for item in value))
+    if isinstance(value, (tuple, list)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class BoundedCache:
+    """
+    Thread-safe key/value cache with size, byte and age limits.
+
+    Parameters:
+    - name: Name used in cache_stats()
+    - max_entries: Maximum number of entries (None for no limit)
+    - max_bytes: Maximum total estimated size of the values (None for no limit)
+    - ttl: Seconds an entry stays valid (None to never expire)
+    - policy: "lru" evicts the least recently used entry, "lfu" the least frequently used one
+    """
+    def __init__(self, name: str, max_entries: int = None, max_bytes: int = None, ttl: float = None, policy: str = "lru"):
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown cache eviction policy: {policy}")
+
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.policy = policy
+
+        # key -> [value, size, expires_at, use_count]; order is least to most recently used
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        register_cache(self)
+
+    def get(self, key) -> tuple:
+        """
+        Returns (True, value) on a hit and (False, None) on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            self.hits += 1
+            entry[3] += 1
+            self._entries.move_to_end(key)
+            return True, entry[0]
+
+    def set(self, key, value) -> None:
+        """
+        Stores a value, then evicts entries until the cache is back within its limits.
+        Values larger than max_bytes on their own are not stored.
+        """
+        size = estimate_bytes(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = [value, size, expires_at, 1]
+            self._bytes += size
+            self._evict(protect=key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the counters and current usage.
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "policy": self.policy,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _remove(self, key) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry[1]
+
+    def _over_limit(self) -> bool:
+        too_many = self.max_entries is not None and len(self._entries) > self.max_entries
+        too_big = self.max_bytes is not None and self._bytes > self.max_bytes
+        return too_many or too_big
+
+    def _evict(self, protect) -> None:
+        # expired entries go first, then the policy picks victims; the entry just stored is kept
+        if self.ttl is not None and self._over_limit():
+            now = time.monotonic()
+            for key in [key for key, entry in self._entries.items() if entry[2] <= now and key != protect]:
+                self._remove(key)
+                self.expirations += 1
+
+        while self._over_limit() and len(self._entries) > 1:
+            if self.policy == "lru":
+                victim = next(key for key in self._entries if key != protect)
+            else:
+                # ties go to the least recently used entry because min keeps the first minimum
+                victim = min((key for key in self._entries if key != protect), key=lambda key: self._entries[key][3])
+            self._remove(victim)
+            self.evictions += 1
+
+
+def bounded_cache(name: str = None, max_entries: int = None, max_bytes: int = None, ttl: float = None, policy: str = "lru"):
+    """
+    Decorator that memoises a function in a BoundedCache.
+    Arguments must be hashable; the cache is reachable as func.cache and func.cache_clear().
+    Results are frozen (see freeze) because every session shares them: a caller that needs to
+    modify one must copy it first.
+    While a rerun is being instrumented, every call is recorded with its time and hit/miss.
+    """
+    def decorator(func):
+        cache = BoundedCache(name or f"{func.__module__}.{func.__qualname__}", max_entries, max_bytes, ttl, policy)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            run = current_rerun()
+            if run is None:
+                return lookup(args, kwargs)
+
+            event = run.open_event(cache.name, "cache")
+            try:
+                return lookup(args, kwargs, event)
+            finally:
+                run.close_event()
+
+        def lookup(args, kwargs, event=None):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            hit, value = cache.get(key)
+            if event is not None:
+                event["cache"] = "hit" if hit else "miss"
+            if hit:
+                return value
+            value = freeze(func(*args, **kwargs))
+            cache.set(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def cache_stats() -> list:
+    """
+    Counters for every registered cache, for export to logs or dashboards.
+    """
+    with _registry_lock:
+        caches = list(_registry.values())
+    return [cache.stats() for cache in caches]
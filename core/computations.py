@@ -0,0 +1,113 @@
+from core.cache import bounded_cache
+from models.bsm_model import BlackScholes
+from models.bsm_leland_model import BlackScholesLeland
+from models.greeks import compute_all_greeks, compute_greeks_by_model
+
+# process-wide memoisation for scalar calls; arguments are plain floats/strings so they hash cheaply.
+# results are a few small floats, so the entry limit bounds memory and the TTL lets idle entries go
+CACHE_SIZE = 4096
+CACHE_TTL = 6 * 60 * 60
+
+
+@bounded_cache("get_bsm_prices", max_entries=CACHE_SIZE, ttl=CACHE_TTL)
+def get_bsm_prices(T, K, S, v, r, q) -> tuple:
+    """
+    Caches the Black-Scholes price calculation.
+    """
+    bs_model = BlackScholes(T, K, S, v, r, q)
+    return bs_model.calculate_prices()
+
+@bounded_cache("get_leland_prices", max_entries=CACHE_SIZE, ttl=CACHE_TTL)
+def get_leland_prices(T, K, S, v, r, q, k, dt) -> tuple:
+    """
+    Caches the Leland price calculation.
+    """
+    bsml_model = BlackScholesLeland(T, K, S, v, r, q, k, dt)
+    return bsml_model.calculate_prices()
+
+@bounded_cache("get_implied_volatility", max_entries=CACHE_SIZE, ttl=CACHE_TTL)
+def get_implied_volatility(T, K, S, v, r, q, k, dt, option_type, market_price, model_type) -> float:
+    """
+    Caches the implied volatility calculation.
+    """
+    if model_type == "Black-Scholes":
+        bs_model = BlackScholes(T, K, S, v, r, q)
+        return bs_model.implied_volatility(option_type, market_price)
+    
+    else:
+        bsml_model = BlackScholesLeland(T, K, S, v, r, q, k, dt)
+        return bsml_model.implied_volatility(option_type, market_price)
+
+@bounded_cache("get_greeks", max_entries=CACHE_SIZE, ttl=CACHE_TTL)
+def get_greeks(T, K, S, v, r, q, k, dt, model_type) -> tuple:
+    """
+    Caches the single-pass price and Greeks calculation.
+    """
+    return compute_all_greeks(T, K, S, v, r, q, k, dt, model_type)
+
+@bounded_cache("get_greeks_by_model", max_entries=CACHE_SIZE, ttl=CACHE_TTL)
+def get_greeks_by_model(T, K, S, v, r, q, k, dt) -> dict:
+    """
+    Caches the prices and Greeks of both models, computed in one vectorized call.
+    """
+    return compute_greeks_by_model(T, K, S, v, r, q, k, dt)
+
+@bounded_cache("get_vega", max_entries=CACHE_SIZE, ttl=CACHE_TTL)
+def get_vega(T, K, S, v, r, q, k, dt, model_type) -> float:
+    """
+    Caches the Vega calculation.
+    """
+    if model_type == "Black-Scholes":
+        bs_model = BlackScholes(T, K, S, v, r, q)
+        return bs_model.vega()
+    else:
+        bsml_model = BlackScholesLeland(T, K, S, v, r, q, k, dt)
+        return bsml_model.vega()
+
+@bounded_cache("get_gamma", max_entries=CACHE_SIZE, ttl=CACHE_TTL)
+def get_gamma(T, K, S, v, r, q, k, dt, model_type) -> float:
+    """
+    Caches the Gamma calculation.
+    """
+    if model_type == "Black-Scholes":
+        bs_model = BlackScholes(T, K, S, v, r, q)
+        return bs_model.gamma()
+    else:
+        bsml_model = BlackScholesLeland(T, K, S, v, r, q, k, dt)
+        return bsml_model.gamma()
+    
+@bounded_cache("get_delta", max_entries=CACHE_SIZE, ttl=CACHE_TTL)
+def get_delta(T, K, S, v, r, q, k, dt, model_type) -> tuple:
+    """
+    Caches the Delta calculation.
+    """
+    if model_type == "Black-Scholes":
+        bs_model = BlackScholes(T, K, S, v, r, q)
+        return bs_model.delta()
+    else:
+        bsml_model = BlackScholesLeland(T, K, S, v, r, q, k, dt)
+        return bsml_model.delta()
+    
+@bounded_cache("get_theta", max_entries=CACHE_SIZE, ttl=CACHE_TTL)
+def get_theta(T, K, S, v, r, q, k, dt, model_type) -> tuple:
+    """
+    Caches the Theta calculation.
+    """
+    if model_type == "Black-Scholes":
+        bs_model = BlackScholes(T, K, S, v, r, q)
+        return bs_model.theta()
+    else:
+        bsml_model = BlackScholesLeland(T, K, S, v, r, q, k, dt)
+        return bsml_model.theta()
+    
+@bounded_cache("get_rho", max_entries=CACHE_SIZE, ttl=CACHE_TTL)
+def get_rho(T, K, S, v, r, q, k, dt, model_type) -> tuple:
+    """
+    Caches the Rho calculation.
+    """
+    if model_type == "Black-Scholes":
+        bs_model = BlackScholes(T, K, S, v, r, q)
+        return bs_model.rho()
+    else:
+        bsml_model = BlackScholesLeland(T, K, S, v, r, q, k, dt)
+        return bsml_model.rho()
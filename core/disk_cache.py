@@ -0,0 +1,258 @@
+"""
+Persistent, content-addressed cache of NumPy results on local disk.
+
+Entries are .npz files named by a SHA-256 hash of the function name, a format version,
+the kind of payload stored and the call arguments, so every server process on a host (and every restart) shares them.
+Writes go to a temporary file that is atomically renamed into place, so readers never see a
+partial entry. Reads refresh the file's mtime, and when the directory grows past its byte cap
+the least recently used files are deleted.
+
+Configuration (environment variables):
+- BSM_DISK_CACHE_DIR: cache directory (default ~/.cache/black-scholes-visualisation)
+- BSM_DISK_CACHE_MB: size cap in megabytes (default 512; 0 disables the disk cache)
+- BSM_DISK_CACHE_COMPRESS: set to 1 to deflate entries. Price grids only shrink by ~7% while
+  reads get ~8x slower, so entries are stored uncompressed by default.
+"""
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zipfile
+
+import numpy as np
+
+from core.cache import register_cache
+from core.instrumentation import timed
+
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "black-scholes-visualisation")
+DEFAULT_MAX_MB = 512
+
+# bump whenever what any cached function stores changes (arrays, their order or their meaning),
+# so entries written by an older version are never read back
+# 2: grids store (strikes, maturities, call, put) axes and surfaces store palette PNG bytes
+FORMAT_VERSION = 2
+
+# other processes write to the same directory, so the local size estimate is refreshed from disk this often
+RESCAN_EVERY = 100
+
+
+class DiskCache:
+    """
+    Size-capped directory of .npz entries shared between processes.
+
+    Parameters:
+    - name: Name used in cache_stats()
+    - directory: Where the entries are stored (created on first write)
+    - max_bytes: Size cap; least recently used entries are deleted past it (0 disables the cache)
+    - compress: Deflate the entries (smaller files, slower reads)
+    """
+    def __init__(self, name: str, directory: str, max_bytes: int, compress: bool = False):
+        self.name = name
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compress = compress
+
+        self._lock = threading.Lock()
+        self._bytes = None
+        self._files = None
+        self._writes_since_scan = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+        register_cache(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, digest: str) -> str:
+        # two-character fan-out keeps directories small
+        return os.path.join(self.directory, digest[:2], digest + ".npz")
+
+    def load(self, digest: str) -> tuple | None:
+        """
+        Returns the stored arrays, or None on a miss. Unreadable entries are removed and count as misses.
+        """
+        path = self._path(digest)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = tuple(data[f"arr_{index}"] for index in range(len(data.files)))
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            self.errors += 1
+            self.misses += 1
+            _remove_quietly(path)
+            return None
+
+        self.hits += 1
+        return arrays
+
+    def store(self, digest: str, arrays: tuple) -> None:
+        """
+        Writes the arrays atomically, then evicts if the directory is over its cap.
+        Failures (read-only or full disk) are counted and otherwise ignored.
+        """
+        path = self._path(digest)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(handle, "wb") as temporary_file:
+                    (np.savez_compressed if self.compress else np.savez)(temporary_file, *arrays)
+                size = os.path.getsize(temporary)
+                os.replace(temporary, path)
+            except BaseException:
+                _remove_quietly(temporary)
+                raise
+        except OSError:
+            self.errors += 1
+            return
+
+        with self._lock:
+            self.writes += 1
+            self._writes_since_scan += 1
+            if self._bytes is None or self._writes_since_scan >= RESCAN_EVERY:
+                self._scan()
+            else:
+                self._bytes += size
+                self._files += 1
+
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list:
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for file_name in files:
+                if not file_name.endswith(".npz"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, file_name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, os.path.join(root, file_name)))
+        return entries
+
+    def _scan(self) -> None:
+        entries = self._entries()
+        self._bytes = sum(size for _, size, _ in entries)
+        self._files = len(entries)
+        self._writes_since_scan = 0
+
+    def _evict(self) -> None:
+        # trim to 90% of the cap so the next few writes do not evict again straight away
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        files = len(entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            if _remove_quietly(path):
+                self.evictions += 1
+            total -= size
+            files -= 1
+        self._bytes = total
+        self._files = files
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, _, path in self._entries():
+                _remove_quietly(path)
+            self._bytes = 0
+            self._files = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "policy": "disk-lru",
+                "entries": self._files,
+                "bytes": self._bytes,
+                "max_entries": None,
+                "max_bytes": self.max_bytes,
+                "ttl": None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": 0,
+                "writes": self.writes,
+                "errors": self.errors,
+            }
+
+
+def _remove_quietly(path: str) -> bool:
+    # another process may have evicted the same file first
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+def cache_key(name: str, args: tuple, kind: str = "arrays") -> str:
+    """
+    Content address of a call: arguments are plain numbers and strings, so their JSON form is canonical.
+    kind names the payload layout, so a function whose payload changes never reads back the old one.
+    """
+    payload = json.dumps([name, FORMAT_VERSION, kind, list(args)], separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def default_disk_cache() -> DiskCache:
+    """
+    The process-wide disk cache configured from the environment.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            directory = os.environ.get("BSM_DISK_CACHE_DIR") or DEFAULT_DIRECTORY
+            max_mb = float(os.environ.get("BSM_DISK_CACHE_MB", DEFAULT_MAX_MB))
+            compress = os.environ.get("BSM_DISK_CACHE_COMPRESS", "0") == "1"
+            _default_cache = DiskCache("disk", directory, int(max_mb * 1024**2), compress)
+        return _default_cache
+
+
+def persistent_cache(name: str, kind: str, result_type=tuple):
+    """
+    Decorator that stores a function's results in the disk cache.
+
+    The function must take plain numbers/strings and return a tuple of arrays (or numbers);
+    kind names what those arrays hold (e.g. "grid_axes", "png") and is part of the key, together
+    with result_type, which rebuilds the tuple on a hit (e.g. a NamedTuple class).
+    Meant to sit under bounded_cache, so the disk is only read on an in-memory miss.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            cache = default_disk_cache()
+            if not cache.enabled:
+                return func(*args)
+
+            digest = cache_key(name, args, f"{kind}:{result_type.__name__}")
+            with timed(name, "disk") as event:
+                arrays = cache.load(digest)
+                if event is not None:
+                    event["cache"] = "miss" if arrays is None else "hit"
+                if arrays is not None:
+                    return arrays if result_type is tuple else result_type(*arrays)
+
+                result = func(*args)
+                cache.store(digest, tuple(np.asarray(value) for value in result))
+                return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,145 @@
+"""
+Opt-in per-rerun timing instrumentation.
+
+A rerun is recorded between start_rerun() and finish_rerun() on the same thread (Streamlit runs
+every session's script on its own thread). While a rerun is being recorded, timed() blocks and the
+bounded caches append events to it; otherwise they cost a single attribute lookup.
+
+Finished reruns are written as one JSON object per line to the "core.instrumentation" logger and,
+when the BSM_TIMING_LOG environment variable names a file, appended to that file.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+TIMING_LOG_ENV = "BSM_TIMING_LOG"
+
+_state = threading.local()
+_log_lock = threading.Lock()
+
+
+class RerunTimings:
+    """
+    Events recorded during one rerun.
+
+    Every event is a dict with name, kind, depth, ms (wall time), self_ms (minus nested events)
+    and cache ("hit", "miss" or None).
+    """
+    def __init__(self, context: dict = None):
+        self.context = context or {}
+        self.events = []
+        self.total_ms = None
+        self._started = time.perf_counter()
+        self._stack = []
+
+    def open_event(self, name: str, kind: str) -> dict:
+        event = {"name": name, "kind": kind, "depth": len(self._stack), "ms": 0.0, "self_ms": 0.0, "cache": None}
+        # events are listed in start order, so nested calls sit right below their parent
+        self.events.append(event)
+        self._stack.append((event, time.perf_counter(), 0.0))
+        return event
+
+    def close_event(self) -> None:
+        event, started, child_ms = self._stack.pop()
+        event["ms"] = (time.perf_counter() - started) * 1e3
+        event["self_ms"] = event["ms"] - child_ms
+        if self._stack:
+            parent, parent_started, parent_child_ms = self._stack[-1]
+            self._stack[-1] = (parent, parent_started, parent_child_ms + event["ms"])
+
+    def cache_counts(self) -> tuple:
+        hits = sum(event["cache"] == "hit" for event in self.events)
+        misses = sum(event["cache"] == "miss" for event in self.events)
+        return hits, misses
+
+    def totals_by(self, field: str) -> dict:
+        """
+        Sums self time per name or kind, so nested events are not counted twice.
+        """
+        totals = {}
+        for event in self.events:
+            totals[event[field]] = totals.get(event[field], 0.0) + event["self_ms"]
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def to_record(self) -> dict:
+        hits, misses = self.cache_counts()
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            **self.context,
+            "total_ms": round(self.total_ms, 3),
+            "cache_hits": hits,
+            "cache_misses": misses,
+            "events": [
+                {**event, "ms": round(event["ms"], 3), "self_ms": round(event["self_ms"], 3)}
+                for event in self.events
+            ],
+        }
+
+
+def current_rerun() -> RerunTimings | None:
+    return getattr(_state, "run", None)
+
+
+def start_rerun(**context) -> RerunTimings:
+    """
+    Starts recording on this thread; context (e.g. a session id) is copied into the log record.
+    """
+    _state.run = RerunTimings(context)
+    return _state.run
+
+
+def discard_rerun() -> None:
+    """
+    Stops recording on this thread without logging. A rerun cut short (by a widget change or an
+    uncaught error) never reaches finish_rerun(), and Streamlit reuses the thread for later reruns.
+    """
+    _state.run = None
+
+
+def finish_rerun() -> RerunTimings | None:
+    """
+    Stops recording on this thread, writes the timing log and returns the recorded rerun.
+    """
+    run = current_rerun()
+    if run is None:
+        return None
+    _state.run = None
+
+    # events left open (e.g. by st.stop() inside a timed block) are closed at the end of the rerun
+    while run._stack:
+        run.close_event()
+    run.total_ms = (time.perf_counter() - run._started) * 1e3
+
+    line = json.dumps(run.to_record())
+    logger.info(line)
+    path = os.environ.get(TIMING_LOG_ENV)
+    if path:
+        with _log_lock, open(path, "a") as log_file:
+            log_file.write(line + "\n")
+    return run
+
+
+@contextmanager
+def timed(name: str, kind: str = "block"):
+    """
+    Times the enclosed block as one event of the current rerun; a no-op when nothing is being recorded.
+    Yields the event dict (or None) so callers can annotate it.
+    """
+    run = current_rerun()
+    if run is None:
+        yield None
+        return
+
+    event = run.open_event(name, kind)
+    try:
+        yield event
+    finally:
+        # the rerun may have been finished inside the block
+        if run._stack:
+            run.close_event()
@@ -0,0 +1,168 @@
+"""
+Multi-core sharded execution of the vectorized engines.
+
+Inputs are copied once into a shared-memory block, workers read their shard and write their
+results straight into a shared output block, so no arrays are pickled between processes.
+Results come back in input order because every shard writes to its own slice.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+import numpy as np
+
+from models.bsm_vectorized import OptionGreeks, _as_float_arrays, batch_greeks
+from models.bsm_leland_vectorized import LelandBatchResult, batch_leland
+from models.implied_volatility import _is_call, implied_volatility_batch
+
+
+class WorkerStats(NamedTuple):
+    """
+    Throughput of one worker process over the whole run.
+    """
+    pid: int
+    shards: int
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float('inf')
+
+
+def _shard_bounds(n: int, shards: int) -> list:
+    """
+    Splits range(n) into contiguous (start, stop) slices of near-equal size.
+    """
+    edges = np.linspace(0, n, shards + 1).astype(int)
+    return [(start, stop) for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
+
+
+def _run_shard(kind: str, input_name: str, output_name: str, n_inputs: int, n_outputs: int, n: int, start: int, stop: int) -> tuple:
+    """
+    Worker entry point: attach to the shared blocks, run one engine over [start, stop) and write the result in place.
+    """
+    began = time.perf_counter()
+    input_block = shared_memory.SharedMemory(name=input_name)
+    output_block = shared_memory.SharedMemory(name=output_name)
+    try:
+        inputs = np.ndarray((n_inputs, n), dtype=np.float64, buffer=input_block.buf)[:, start:stop]
+        outputs = np.ndarray((n_outputs, n), dtype=np.float64, buffer=output_block.buf)
+
+        if kind == "bsm":
+            result = batch_greeks(*inputs)
+        elif kind == "leland":
+            result = batch_leland(*inputs)
+        else:
+            is_call, market_price, T, K, S, r, q = inputs[:7]
+            k, dt = (inputs[7], inputs[8]) if kind == "iv_leland" else (None, None)
+            option_type = np.where(is_call > 0.5, 'call', 'put')
+            result = (implied_volatility_batch(option_type, market_price, T, K, S, r, q, k, dt),)
+
+        for row, values in enumerate(result):
+            outputs[row, start:stop] = values
+
+        # drop the views before closing, otherwise the buffers are still exported
+        del inputs, outputs
+    finally:
+        input_block.close()
+        output_block.close()
+
+    return os.getpid(), stop - start, time.perf_counter() - began
+
+
+def _run_sharded(kind: str, inputs: tuple, n_outputs: int, workers: int, shards_per_worker: int, pool: ProcessPoolExecutor = None) -> tuple:
+    """
+    Copies the inputs into shared memory, fans the shards out to a process pool and gathers the outputs.
+    A caller-owned pool is reused (and left running); otherwise one is created for this call.
+    Returns (outputs, worker_stats) where outputs has shape (n_outputs, n).
+    """
+    inputs = _as_float_arrays(*inputs)
+    shape = inputs[0].shape
+    n = inputs[0].size
+    # an executor does not expose its size, so a caller passing its own pool also passes its worker count
+    workers = workers or os.cpu_count() or 1
+
+    input_block = shared_memory.SharedMemory(create=True, size=max(len(inputs) * n * 8, 1))
+    output_block = shared_memory.SharedMemory(create=True, size=max(n_outputs * n * 8, 1))
+    try:
+        shared_inputs = np.ndarray((len(inputs), n), dtype=np.float64, buffer=input_block.buf)
+        for row, values in enumerate(inputs):
+            shared_inputs[row] = values.ravel()
+
+        owns_pool = pool is None
+        if owns_pool:
+            pool = ProcessPoolExecutor(max_workers=workers)
+
+        stats = {}
+        try:
+            futures = [
+                pool.submit(_run_shard, kind, input_block.name, output_block.name, len(inputs), n_outputs, n, start, stop)
+                for start, stop in _shard_bounds(n, workers * shards_per_worker)
+            ]
+            for future in futures:
+                pid, rows, seconds = future.result()
+                shards, total_rows, total_seconds = stats.get(pid, (0, 0, 0.0))
+                stats[pid] = (shards + 1, total_rows + rows, total_seconds + seconds)
+        finally:
+            if owns_pool:
+                pool.shutdown()
+
+        shared_outputs = np.ndarray((n_outputs, n), dtype=np.float64, buffer=output_block.buf)
+        outputs = shared_outputs.reshape((n_outputs,) + shape).copy()
+        del shared_inputs, shared_outputs
+    finally:
+        input_block.close()
+        input_block.unlink()
+        output_block.close()
+        output_block.unlink()
+
+    worker_stats = [WorkerStats(pid, *values) for pid, values in sorted(stats.items())]
+    return outputs, worker_stats
+
+
+def parallel_greeks(T, K, S, v, r, q, k=None, dt=None, workers: int = None, shards_per_worker: int = 4, pool: ProcessPoolExecutor = None) -> tuple:
+    """
+    Prices and Greeks for a large batch, sharded across a process pool.
+
+    Parameters and units follow batch_greeks (and batch_leland when k and dt are given).
+    workers defaults to the number of CPUs; pass an existing pool to reuse its processes across calls,
+    together with its max_workers as workers so the shards are sized for it.
+    Returns (result, worker_stats), where result is an OptionGreeks (or LelandBatchResult)
+    with the broadcast input shape.
+    """
+    if k is None or dt is None:
+        outputs, stats = _run_sharded("bsm", (T, K, S, v, r, q), len(OptionGreeks._fields), workers, shards_per_worker, pool)
+        return OptionGreeks(*outputs), stats
+
+    outputs, stats = _run_sharded("leland", (T, K, S, v, r, q, k, dt), len(LelandBatchResult._fields), workers, shards_per_worker, pool)
+    return LelandBatchResult(*outputs), stats
+
+
+def parallel_implied_volatility(option_type, market_price, T, K, S, r, q, k=None, dt=None, workers: int = None, shards_per_worker: int = 4, pool: ProcessPoolExecutor = None) -> tuple:
+    """
+    Implied volatility for a large chain, sharded across a process pool.
+
+    Parameters and units follow implied_volatility_batch; workers and pool as in parallel_greeks.
+    Returns (volatilities, worker_stats).
+    """
+    is_call = _is_call(option_type).astype(float)
+
+    if k is None or dt is None:
+        outputs, stats = _run_sharded("iv", (is_call, market_price, T, K, S, r, q), 1, workers, shards_per_worker, pool)
+    else:
+        outputs, stats = _run_sharded("iv_leland", (is_call, market_price, T, K, S, r, q, k, dt), 1, workers, shards_per_worker, pool)
+
+    return outputs[0], stats
+
+
+def format_worker_stats(stats: list) -> str:
+    """
+    One line per worker with its share of the rows and its throughput.
+    """
+    return "\n".join(
+        f"worker {stat.pid}: {stat.shards} shards, {stat.rows} rows in {stat.seconds:.2f}s ({stat.rows_per_second:,.0f} rows/s)"
+        for stat in stats
+    )
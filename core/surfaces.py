@@ -0,0 +1,114 @@
+import numpy as np
+
+from models.bsm_vectorized import batch_prices
+from models.bsm_leland_vectorized import batch_leland
+
+DEFAULT_RESOLUTION = 30
+
+# share of the adaptive nodes spread uniformly, so flat regions keep some coverage
+UNIFORM_SHARE = 0.3
+
+
+def build_grid(strike_min: float, strike_max: float, maturity_min: float, maturity_max: float, resolution: int = DEFAULT_RESOLUTION) -> tuple:
+    """
+    Builds the strike x maturity meshgrid used by every option surface.
+    """
+    strikes = np.linspace(strike_min, strike_max, resolution)
+    maturities = np.linspace(maturity_min, maturity_max, resolution)
+    K_grid, T_grid = np.meshgrid(strikes, maturities)
+    return K_grid, T_grid
+
+def _refined_axis(nodes, curvature, count: int) -> np.ndarray:
+    """
+    Places count points on an axis so their density follows sqrt(curvature), the spacing that
+    evens out the linear interpolation error, blended with a uniform share. Endpoints are kept.
+    """
+    density = np.sqrt(curvature)
+    density = UNIFORM_SHARE + (1 - UNIFORM_SHARE) * density / density.mean() if density.mean() > 0 else np.ones_like(density)
+
+    # invert the cumulative density at evenly spaced quantiles
+    cumulative = np.concatenate(([0.0], np.cumsum(0.5 * (density[1:] + density[:-1]) * np.diff(nodes))))
+    return np.interp(np.linspace(0, cumulative[-1], count), cumulative, nodes)
+
+def _axis_curvature(values, spacing: float, axis: int) -> np.ndarray:
+    """
+    Largest |second difference| across the other axis, at every node of this one (edges copy their neighbour).
+    """
+    second = np.abs(np.diff(values, n=2, axis=axis)) / spacing**2
+    profile = np.nanmax(second, axis=1 - axis)
+    return np.concatenate(([profile[0]], profile, [profile[-1]]))
+
+def build_adaptive_grid(strike_min: float, strike_max: float, maturity_min: float, maturity_max: float, price_func, resolution: int = DEFAULT_RESOLUTION) -> tuple:
+    """
+    Builds a strike x maturity meshgrid that is denser where the surface bends most, such as
+    around the money at short maturities, within the point budget of a uniform resolution x resolution grid.
+
+    A coarse uniform pilot grid is priced with price_func(K_grid, T_grid) -> (call, put); the
+    curvature of both surfaces along each axis then decides where that axis's nodes go.
+    The pilot counts against the budget, so the final grid is slightly smaller than the uniform one.
+    """
+    pilot = max(resolution // 3, 5)
+    count = max(int(np.sqrt(resolution**2 - pilot**2)), 3)
+
+    if strike_max <= strike_min or maturity_max <= maturity_min:
+        return build_grid(strike_min, strike_max, maturity_min, maturity_max, count)
+
+    K_pilot, T_pilot = build_grid(strike_min, strike_max, maturity_min, maturity_max, pilot)
+    strikes, maturities = K_pilot[0], T_pilot[:, 0]
+    surfaces = [np.nan_to_num(np.asarray(values, dtype=float)) for values in price_func(K_pilot, T_pilot)]
+
+    strike_curvature = sum(_axis_curvature(values, strikes[1] - strikes[0], axis=1) for values in surfaces)
+    maturity_curvature = sum(_axis_curvature(values, maturities[1] - maturities[0], axis=0) for values in surfaces)
+
+    K_grid, T_grid = np.meshgrid(
+        _refined_axis(strikes, strike_curvature, count),
+        _refined_axis(maturities, maturity_curvature, count)
+    )
+    return K_grid, T_grid
+
+def _surface_grid(strike_min, strike_max, maturity_min, maturity_max, resolution, adaptive, price_func) -> tuple:
+    if adaptive:
+        return build_adaptive_grid(strike_min, strike_max, maturity_min, maturity_max, price_func, resolution)
+    return build_grid(strike_min, strike_max, maturity_min, maturity_max, resolution)
+
+def compute_bsm_surface(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution: int = DEFAULT_RESOLUTION, adaptive: bool = False) -> tuple:
+    """
+    Black-Scholes call and put prices over the whole grid.
+    resolution is the points per axis (the point budget when adaptive).
+    Returns (K_grid, T_grid, call_prices, put_prices).
+    """
+    def prices(K_grid, T_grid):
+        return batch_prices(T_grid, K_grid, S, v, r, q)
+
+    K_grid, T_grid = _surface_grid(strike_min, strike_max, maturity_min, maturity_max, resolution, adaptive, prices)
+    call_prices, put_prices = prices(K_grid, T_grid)
+    return K_grid, T_grid, call_prices, put_prices
+
+def compute_leland_surface(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution: int = DEFAULT_RESOLUTION, adaptive: bool = False) -> tuple:
+    """
+    Leland call and put prices over the whole grid.
+    resolution is the points per axis (the point budget when adaptive).
+    Returns (K_grid, T_grid, call_prices, put_prices).
+    """
+    def prices(K_grid, T_grid):
+        leland = batch_leland(T_grid, K_grid, S, v, r, q, k, dt)
+        return leland.call_price, leland.put_price
+
+    K_grid, T_grid = _surface_grid(strike_min, strike_max, maturity_min, maturity_max, resolution, adaptive, prices)
+    call_prices, put_prices = prices(K_grid, T_grid)
+    return K_grid, T_grid, call_prices, put_prices
+
+def compute_bsm_vs_leland_surface(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution: int = DEFAULT_RESOLUTION, adaptive: bool = False) -> tuple:
+    """
+    Leland minus Black-Scholes price differences over the whole grid.
+    resolution is the points per axis (the point budget when adaptive).
+    Returns (K_grid, T_grid, call_diffs, put_diffs).
+    """
+    def differences(K_grid, T_grid):
+        bsm_call, bsm_put = batch_prices(T_grid, K_grid, S, v, r, q)
+        leland = batch_leland(T_grid, K_grid, S, v, r, q, k, dt)
+        return leland.call_price - bsm_call, leland.put_price - bsm_put
+
+    K_grid, T_grid = _surface_grid(strike_min, strike_max, maturity_min, maturity_max, resolution, adaptive, differences)
+    call_diffs, put_diffs = differences(K_grid, T_grid)
+    return K_grid, T_grid, call_diffs, put_diffs
@@ -0,0 +1,139 @@
+"""
+Static image assets for the pages, served from right-sized derivatives cached in memory.
+
+The source images in assets/ are far larger than they are displayed (a 1024 px, 1 MB profile picture
+shown at 350 px, 512 px logos shown at 32 px). Each entry of IMAGES is resized once to twice its
+display width (sharp on high-DPI screens), compressed to PNG and written to assets/derived/.
+Pages then get the encoded bytes (or their base64 form for inline <img> tags) from an in-memory
+cache, so a rerun does no disk I/O, image decoding or re-encoding.
+
+The derivatives are committed with the sources; after changing a source or IMAGES run
+`python -m functions.assets` to rebuild them. A missing derivative is built on first use instead.
+Kept apart from functions/helper.py so the info pages load without the pricing and plotting stack.
+"""
+import base64
+import functools
+import io
+import logging
+import os
+import sys
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+DERIVED_DIR = os.path.join(ASSET_DIR, "derived")
+
+# pixels per displayed pixel, so the images stay sharp on high-DPI screens
+DENSITY = 2
+
+
+class ImageDerivative(NamedTuple):
+    source: str         # file name in assets/
+    width: int          # displayed width in CSS pixels
+    colors: int = 0     # quantize to a palette of this many colors (0 keeps full color)
+
+
+IMAGES = {
+    "profile": ImageDerivative("profile-pic-v3.png", 350, colors=256),
+    "linkedin": ImageDerivative("linkedin.png", 32),
+    "github": ImageDerivative("github.png", 32),
+    "investopedia": ImageDerivative("investopedia_logo.png", 32),
+    "wikipedia": ImageDerivative("wikipedia_logo.png", 32),
+}
+
+
+def derived_path(name: str) -> str:
+    """
+    Where the derivative of IMAGES[name] is stored; the pixel width is part of the file name,
+    so changing a display width never picks up a stale file.
+    """
+    spec = IMAGES[name]
+    stem = os.path.splitext(spec.source)[0]
+    return os.path.join(DERIVED_DIR, f"{stem}.{spec.width * DENSITY}w.png")
+
+
+def build_derivative(name: str) -> bytes:
+    """
+    Resizes and compresses the source image of IMAGES[name] and returns the PNG bytes.
+    """
+    # PIL is only needed when a derivative has to be (re)built
+    from PIL import Image
+
+    spec = IMAGES[name]
+    with Image.open(os.path.join(ASSET_DIR, spec.source)) as source:
+        image = source.convert("RGBA")
+    width = min(spec.width * DENSITY, image.width)
+    height = round(image.height * width / image.width)
+    image = image.resize((width, height), Image.LANCZOS)
+    if spec.colors:
+        # a palette PNG keeps the transparency at a fraction of the size; st.image serves PNG bytes untouched
+        image = image.quantize(spec.colors, method=Image.FASTOCTREE)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def build_derivatives(force: bool = False) -> list:
+    """
+    Writes the derivative of every entry in IMAGES that is missing (or all of them when force is set)
+    and returns the paths written.
+    """
+    os.makedirs(DERIVED_DIR, exist_ok=True)
+    written = []
+    for name in IMAGES:
+        path = derived_path(name)
+        if force or not os.path.exists(path):
+            with open(path, "wb") as derived_file:
+                derived_file.write(build_derivative(name))
+            written.append(path)
+    return written
+
+
+@functools.cache
+def image_bytes(name: str) -> bytes | None:
+    """
+    The PNG bytes of the derivative of IMAGES[name], read once per process; None if the source is missing.
+    """
+    path = derived_path(name)
+    try:
+        with open(path, "rb") as derived_file:
+            return derived_file.read()
+    except FileNotFoundError:
+        pass
+
+    if not os.path.exists(os.path.join(ASSET_DIR, IMAGES[name].source)):
+        return None
+    data = build_derivative(name)
+    try:
+        os.makedirs(DERIVED_DIR, exist_ok=True)
+        with open(path, "wb") as derived_file:
+            derived_file.write(data)
+    except OSError:
+        # a read-only deployment still serves the in-memory copy
+        logger.warning("Could not write image derivative %s", path)
+    return data
+
+
+@functools.cache
+def image_base64(name: str) -> str | None:
+    """
+    The derivative of IMAGES[name] as a base64 string for embedding in HTML; None if the source is missing.
+    """
+    data = image_bytes(name)
+    return base64.b64encode(data).decode() if data is not None else None
+
+
+def preload_images() -> None:
+    """
+    Loads every derivative into the in-memory cache (called from the server start pre-warm).
+    """
+    for name in IMAGES:
+        image_base64(name)
+
+
+if __name__ == "__main__":
+    for written_path in build_derivatives(force=True):
+        print(f"{os.path.relpath(written_path, ASSET_DIR)}: {os.path.getsize(written_path) / 1024:.1f} KB")
+    sys.exit(0)
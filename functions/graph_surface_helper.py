@@ -1,32 +1,178 @@
-import streamlit as st
+import io
+import threading
 
+import numpy as np
+
+from core.cache import bounded_cache
+from core.disk_cache import persistent_cache
+from core.instrumentation import timed
+from core.surfaces import (
+    DEFAULT_RESOLUTION,
+    compute_bsm_surface,
+    compute_leland_surface,
+    compute_bsm_vs_leland_surface
+)
 from graphPlots.plot_bsmVsbsml import PlotBsmVsBsml
 from graphPlots.plot_option_bsm import PlotOptionBSM
 from graphPlots.plot_option_bsml import PlotOptionBSML
 
-@st.cache_data
-def generate_bsm_surface(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q):
+# a 30x30 grid is ~30 KB and a rendered surface image ~65 KB
+GRID_CACHE = dict(max_entries=256, max_bytes=64 * 1024**2, ttl=6 * 60 * 60)
+IMAGE_CACHE = dict(max_entries=512, max_bytes=64 * 1024**2, ttl=6 * 60 * 60)
+
+# surfaces are rasterised once at this resolution (8in figures come out ~960px wide) and served as-is
+SURFACE_DPI = 150
+# a 256-colour palette PNG is ~5x smaller than a truecolour one and indistinguishable on these plots
+PALETTE_COLORS = 256
+
+# --- stage 1: price grids, keyed only on the model inputs and the mesh ---
+# memory first, then the on-disk cache shared by every server process and kept across restarts.
+# only the axes and prices are persisted: the meshgrid is cheaper to rebuild than to read back
+
+def _axes_and_prices(grid) -> tuple:
+    K_grid, T_grid, call_data, put_data = grid
+    return K_grid[0], T_grid[:, 0], call_data, put_data
+
+def _from_axes(axes_and_prices) -> tuple:
+    strikes, maturities, call_data, put_data = axes_and_prices
+    return tuple(np.meshgrid(strikes, maturities)) + (call_data, put_data)
+
+@persistent_cache("bsm_grid_prices", "grid_axes")
+def _bsm_grid_prices(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution, adaptive) -> tuple:
+    return _axes_and_prices(compute_bsm_surface(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution, adaptive))
+
+@persistent_cache("leland_grid_prices", "grid_axes")
+def _leland_grid_prices(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive) -> tuple:
+    return _axes_and_prices(compute_leland_surface(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive))
+
+@persistent_cache("bsm_vs_leland_grid_prices", "grid_axes")
+def _bsm_vs_leland_grid_prices(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive) -> tuple:
+    return _axes_and_prices(compute_bsm_vs_leland_surface(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive))
+
+@bounded_cache("compute_bsm_grid", **GRID_CACHE)
+def compute_bsm_grid(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution=DEFAULT_RESOLUTION, adaptive=False) -> tuple:
+    """
+    Caches the BSM price grid; shared by every view angle and by both option types.
+    """
+    return _from_axes(_bsm_grid_prices(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution, adaptive))
+
+@bounded_cache("compute_leland_grid", **GRID_CACHE)
+def compute_leland_grid(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution=DEFAULT_RESOLUTION, adaptive=False) -> tuple:
+    """
+    Caches the Leland price grid; shared by every view angle and by both option types.
+    """
+    return _from_axes(_leland_grid_prices(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive))
+
+@bounded_cache("compute_bsm_vs_leland_grid", **GRID_CACHE)
+def compute_bsm_vs_leland_grid(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution=DEFAULT_RESOLUTION, adaptive=False) -> tuple:
+    """
+    Caches the Leland minus BSM difference grid; shared by every view angle and by both option types.
+    """
+    return _from_axes(_bsm_vs_leland_grid_prices(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive))
+
+# --- stage 2: rendering, the only step that depends on the view angle ---
+# each view is rasterised once to PNG bytes, kept in memory and on disk, and the figure is closed straight away
+
+# pyplot's figure registry is global and the renders run on every session's thread
+_render_lock = threading.Lock()
+
+def render_png(fig) -> bytes:
+    """
+    Rasterises a figure to a palette PNG at SURFACE_DPI and closes it.
+    """
+    # only a cache miss renders, so matplotlib and Pillow load on the first one rather than at startup
+    import matplotlib.pyplot as plt
+    from PIL import Image
+
+    with timed("savefig", "render"):
+        try:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="png", dpi=SURFACE_DPI, bbox_inches="tight")
+        finally:
+            plt.close(fig)
+
+        buffer.seek(0)
+        with Image.open(buffer) as image:
+            palette = image.convert("RGB").quantize(PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+        output = io.BytesIO()
+        palette.save(output, format="PNG")
+        return output.getvalue()
+
+def _render_surface(plotter, grid, option_type, elevation, rotation) -> tuple:
+    # the disk cache stores arrays, so the bytes travel as a uint8 array
+    with _render_lock:
+        png = render_png(plotter.render_surface(*grid, option_type, elevation, rotation))
+    return (np.frombuffer(png, dtype=np.uint8),)
+
+@persistent_cache("bsm_surface_png", "png")
+def _bsm_surface_png(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution, adaptive) -> tuple:
+    plotter = PlotOptionBSM(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q)
+    grid = compute_bsm_grid(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution, adaptive)
+    return _render_surface(plotter, grid, option_type, elevation, rotation)
+
+@persistent_cache("leland_surface_png", "png")
+def _leland_surface_png(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive) -> tuple:
+    plotter = PlotOptionBSML(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt)
+    grid = compute_leland_grid(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive)
+    return _render_surface(plotter, grid, option_type, elevation, rotation)
+
+@persistent_cache("bsm_vs_leland_surface_png", "png")
+def _bsm_vs_leland_surface_png(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive) -> tuple:
+    plotter = PlotBsmVsBsml(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt)
+    grid = compute_bsm_vs_leland_grid(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive)
+    return _render_surface(plotter, grid, option_type, elevation, rotation)
+
+@bounded_cache("generate_bsm_surface", policy="lfu", **IMAGE_CACHE)
+def generate_bsm_surface(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution=DEFAULT_RESOLUTION, adaptive=False) -> bytes:
+    """
+    Caches the BSM surface plot as PNG bytes.
+    """
+    return _bsm_surface_png(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution, adaptive)[0].tobytes()
+
+@bounded_cache("generate_leland_surface", policy="lfu", **IMAGE_CACHE)
+def generate_leland_surface(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution=DEFAULT_RESOLUTION, adaptive=False) -> bytes:
+    """
+    Caches the Leland surface plot as PNG bytes.
+    """
+    return _leland_surface_png(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive)[0].tobytes()
+
+@bounded_cache("generate_bsm_vs_leland_surface", policy="lfu", **IMAGE_CACHE)
+def generate_bsm_vs_leland_surface(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution=DEFAULT_RESOLUTION, adaptive=False) -> bytes:
+    """
+    Caches the comparison surface plot between BSM and Leland's model as PNG bytes.
+    """
+    return _bsm_vs_leland_surface_png(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive)[0].tobytes()
+
+# --- interactive mode: the browser handles the view, so only the grid is cached ---
+
+def _interactive_figure(plotter, grid, option_type):
+    # plotly is only imported once someone switches to interactive mode
+    from graphPlots.plot_interactive import plot_interactive_surface
+
+    K_grid, T_grid, call_data, put_data = grid
+    option_data, z_label = plotter.select_option_data(option_type, call_data, put_data)
+    return plot_interactive_surface(K_grid, T_grid, option_data, z_label)
+
+def generate_interactive_bsm_surface(option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution=DEFAULT_RESOLUTION, adaptive=False):
     """
-    Caches the BSM surface plot generation.
+    Builds the client-side 3D BSM surface from the cached grid.
     """
     plotter = PlotOptionBSM(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q)
-    fig = plotter.plot_option_surface(option_type, elevation, rotation)
-    return fig
+    grid = compute_bsm_grid(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution, adaptive)
+    return _interactive_figure(plotter, grid, option_type)
 
-@st.cache_data
-def generate_leland_surface(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt) :
+def generate_interactive_leland_surface(option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution=DEFAULT_RESOLUTION, adaptive=False):
     """
-    Caches the Leland surface plot generation.
+    Builds the client-side 3D Leland surface from the cached grid.
     """
     plotter = PlotOptionBSML(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt)
-    fig = plotter.plot_option_surface(option_type, elevation, rotation)
-    return fig
+    grid = compute_leland_grid(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive)
+    return _interactive_figure(plotter, grid, option_type)
 
-@st.cache_data
-def generate_bsm_vs_leland_surface(option_type, elevation, rotation, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt):
+def generate_interactive_bsm_vs_leland_surface(option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution=DEFAULT_RESOLUTION, adaptive=False):
     """
-    Caches the comparison surface plot generation between BSM and Leland's model.
+    Builds the client-side 3D comparison surface from the cached grid.
     """
     plotter = PlotBsmVsBsml(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt)
-    fig = plotter.plot_option_surface(option_type, elevation, rotation)
-    return fig
\ No newline at end of file
+    grid = compute_bsm_vs_leland_grid(strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive)
+    return _interactive_figure(plotter, grid, option_type)
@@ -1,22 +1,40 @@
 import streamlit as st
-import base64
-import os
 
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from core.cache import cache_stats
+from core.instrumentation import discard_rerun, finish_rerun, start_rerun, timed
+from core.surfaces import DEFAULT_RESOLUTION
 from functions.graph_surface_helper import (
     generate_bsm_surface, 
     generate_leland_surface, 
-    generate_bsm_vs_leland_surface
+    generate_bsm_vs_leland_surface,
+    generate_interactive_bsm_surface,
+    generate_interactive_leland_surface,
+    generate_interactive_bsm_vs_leland_surface
 )
 
-def display_option_surface(title, surface_func, base_args, key_suffix, default_rotation, elevation=None, rotation=None) -> None:
+@st.fragment
+def display_option_surface(title, surface_func, base_args, key_suffix, default_rotation, elevation=None, rotation=None, interactive_func=None) -> None:
     """
     A reusable function to display an option surface plot and its controls.
     This function is a general-purpose plotter.
+    When the sidebar's interactive toggle is on, the surface is drawn client-side and the view sliders are skipped.
+    Each panel is a fragment, so moving its view sliders reruns only that panel.
     """
     with st.container(border=True):
         st.subheader(title)
         plot_placeholder = st.empty()
 
+        if interactive_func is not None and st.session_state.get("interactive_plots", False):
+            # surfaces with a caller-controlled view (the picker tab) repeat a key_suffix, so keep their keys apart
+            view_suffix = "" if elevation is None and rotation is None else "_fixed_view"
+            with timed(interactive_func.__name__, "surface"):
+                fig = interactive_func(*base_args)
+            with timed(f"plotly_chart[{key_suffix}]", "render"):
+                plot_placeholder.plotly_chart(fig, key=f"interactive_{key_suffix}{view_suffix}")
+            return
+
         # if elevation and rotation are not passed directly, create sliders for them
         if elevation is None and rotation is None:
             with st.expander("Adjust Plot View"):
@@ -27,17 +45,18 @@ def display_option_surface(title, surface_func, base_args, key_suffix, default_r
         # note: the order is based on the computation function signature: (type, elevation, rotation, ...)
         all_args = (base_args[0], elevation, rotation) + base_args[1:]
         
-        # generate the plot figure
-        fig = surface_func(*all_args)
-        plot_placeholder.pyplot(fig)
+        # the surface comes back as cached PNG bytes, which Streamlit serves without re-encoding
+        png = surface_func(*all_args)
+        with timed(f"image[{key_suffix}]", "render"):
+            plot_placeholder.image(png, width="stretch", output_format="PNG")
 
-def generate_bsm_option_surface(option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, elevation=None, rotation=None) -> None:
+def generate_bsm_option_surface(option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, elevation=None, rotation=None, resolution=DEFAULT_RESOLUTION, adaptive=False) -> None:
     """
     Generates and displays a Black-Scholes option surface.
     This function is specific to the Black-Scholes model.
     """
     # prepare arguments for the BSM computation function
-    bsm_args = (option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q)
+    bsm_args = (option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, resolution, adaptive)
 
     # set a default viewing angle based on the option type
     default_rotation = 330 if option_type == "Call" else 230
@@ -45,6 +64,7 @@ def generate_bsm_option_surface(option_type, strike_min, strike_max, maturity_mi
     display_option_surface(
         title=f"{option_type} Option Surface",
         surface_func=generate_bsm_surface,
+        interactive_func=generate_interactive_bsm_surface,
         base_args=bsm_args,
         key_suffix=f"bsm_{option_type}",
         default_rotation=default_rotation,
@@ -52,7 +72,7 @@ def generate_bsm_option_surface(option_type, strike_min, strike_max, maturity_mi
         rotation=rotation
     )
 
-def generate_leland_option_surface(option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, elevation=None, rotation=None) -> None:
+def generate_leland_option_surface(option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, elevation=None, rotation=None, resolution=DEFAULT_RESOLUTION, adaptive=False) -> None:
     """
     Generates and displays a Leland's Model option surface.
     This function is specific to Leland's model.
@@ -63,7 +83,7 @@ def generate_leland_option_surface(option_type, strike_min, strike_max, maturity
         return
 
     # prepare arguments for the Leland computation function
-    leland_args = (option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt)
+    leland_args = (option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive)
     
     # set a default viewing angle based on the option type
     default_rotation = 330 if "Call" in option_type else 230
@@ -71,6 +91,7 @@ def generate_leland_option_surface(option_type, strike_min, strike_max, maturity
     display_option_surface(
         title=f"{option_type} Surface",
         surface_func=generate_leland_surface,
+        interactive_func=generate_interactive_leland_surface,
         base_args=leland_args,
         key_suffix=f"leland_{option_type}",
         default_rotation=default_rotation,
@@ -78,7 +99,7 @@ def generate_leland_option_surface(option_type, strike_min, strike_max, maturity
         rotation=rotation
     )
 
-def generate_bsm_vs_leland_option_surface(option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, elevation=None, rotation=None) -> None:
+def generate_bsm_vs_leland_option_surface(option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, elevation=None, rotation=None, resolution=DEFAULT_RESOLUTION, adaptive=False) -> None:
     """
     Generates and displays a comparison surface between Black-Scholes and Leland's model.
     This function is specific to the BSM vs BSML comparison.
@@ -89,7 +110,7 @@ def generate_bsm_vs_leland_option_surface(option_type, strike_min, strike_max, m
         return
 
     # prepare arguments for the Leland computation function
-    leland_args = (option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt)
+    leland_args = (option_type, strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt, resolution, adaptive)
     
     # set a default viewing angle based on the option type
     default_rotation = 330 if "Call" in option_type else 230
@@ -97,6 +118,7 @@ def generate_bsm_vs_leland_option_surface(option_type, strike_min, strike_max, m
     display_option_surface(
         title=f"Bsm vs Leland {option_type} Surface",
         surface_func=generate_bsm_vs_leland_surface,
+        interactive_func=generate_interactive_bsm_vs_leland_surface,
         base_args=leland_args,
         key_suffix=f"bsmVsleland_{option_type}",
         default_rotation=default_rotation,
@@ -104,12 +126,77 @@ def generate_bsm_vs_leland_option_surface(option_type, strike_min, strike_max, m
         rotation=rotation
     )
 
-def get_image_as_base64(path) -> str | None:
-    """Encodes a local image file into a base64 string for embedding in HTML."""
-    if not os.path.exists(path):
-        return None
-    with open(path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode()
+def start_instrumentation(page: str) -> None:
+    """
+    Starts timing this rerun if the sidebar's instrumentation toggle is on.
+    Call at the top of a page, before any computation.
+    """
+    if st.session_state.get("instrumentation", False):
+        ctx = get_script_run_ctx()
+        start_rerun(page=page, session=ctx.session_id if ctx else None)
+    else:
+        # drop a run left on this (reused) thread by a rerun that stopped before finish_rerun()
+        discard_rerun()
+
+def display_instrumentation_panel() -> None:
+    """
+    Finishes timing this rerun, writes the timing log and shows a collapsible breakdown in the sidebar.
+    Call at the bottom of a page.
+    """
+    run = finish_rerun()
+    if run is None:
+        return
+
+    hits, misses = run.cache_counts()
+    with st.sidebar.expander(f"Rerun timings: {run.total_ms:.0f} ms", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Total", f"{run.total_ms:.0f} ms")
+        col2.metric("Cache hits", hits)
+        col3.metric("Cache misses", misses)
+
+        # tabs are the outermost events, so their wall time is the per-tab cost
+        tabs = {event["name"]: event["ms"] for event in run.events if event["kind"] == "tab"}
+        if tabs:
+            st.write("**By tab (ms)**")
+            st.bar_chart(tabs, horizontal=True)
+
+        st.write("**By kind (self ms)**")
+        st.dataframe([{"kind": kind, "ms": round(ms, 2)} for kind, ms in run.totals_by("kind").items()], hide_index=True)
+
+        st.write("**All events**")
+        st.dataframe(
+            [
+                {
+                    "event": "\u2003" * event["depth"] + event["name"],
+                    "kind": event["kind"],
+                    "cache": event["cache"] or "",
+                    "ms": round(event["ms"], 2),
+                    "self ms": round(event["self_ms"], 2),
+                }
+                for event in run.events
+            ],
+            hide_index=True,
+        )
+
+        # counters of every registered cache over the life of this server process
+        st.write("**Caches (since server start)**")
+        st.dataframe(
+            [
+                {
+                    "cache": stats["name"],
+                    # the disk cache has not counted its directory until its first write
+                    "entries": stats["entries"] or 0,
+                    "MB": round((stats["bytes"] or 0) / 1024**2, 2),
+                    "hits": stats["hits"],
+                    "misses": stats["misses"],
+                    "hit rate": f"{stats['hits'] / max(stats['hits'] + stats['misses'], 1):.0%}",
+                    "evictions": stats["evictions"],
+                    "expirations": stats["expirations"],
+                }
+                for stats in cache_stats()
+            ],
+            hide_index=True,
+        )
 
 """def get_greeks_format(greek_value, greek_name):
     with st.container(border=True):
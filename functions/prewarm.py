@@ -0,0 +1,149 @@
+"""
+Background cache pre-warming.
+
+At server start a daemon thread loads the page images and fills the price, Greek, grid and surface
+image caches for the sidebar defaults in views/bsm.py and a set of common presets, so the first
+visitor does not pay for them.
+The grids also land in the on-disk cache, so running this module before a restart
+(`python -m functions.prewarm`) leaves the next server process warm as well.
+
+Configuration (environment variables):
+- BSM_PREWARM: set to 0 to disable pre-warming at server start
+- BSM_PREWARM_PRESETS: path to a JSON list of presets; each preset overrides some of DEFAULT_INPUTS
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from functions.assets import preload_images
+
+logger = logging.getLogger(__name__)
+
+# sidebar defaults in views/bsm.py; floats because the widgets return floats and the disk cache keys on them
+DEFAULT_INPUTS = dict(
+    S=120.0, K=100.0, T=1.0, r=5.0, v=20.0, q=0.0, k=0.0, dt=0.0,
+    strike_min=96.0, strike_max=144.0, maturity_min=0.1, maturity_max=2.0
+)
+
+# common tweaks of the defaults: Leland's model switched on, and a few volatility/spot moves
+DEFAULT_PRESETS = [
+    {},
+    {"k": 1.0, "dt": 5.0},
+    {"k": 0.5, "dt": 1.0},
+    {"k": 1.0, "dt": 1.0},
+    {"v": 30.0},
+    {"v": 10.0},
+    {"S": 100.0, "strike_min": 80.0, "strike_max": 120.0},
+]
+
+# default view angles of the surface panels (elevation, rotation)
+DEFAULT_VIEWS = {"Call": (20, 330), "Put": (20, 230)}
+
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def load_presets() -> list:
+    """
+    Presets from BSM_PREWARM_PRESETS if set, otherwise DEFAULT_PRESETS, merged over DEFAULT_INPUTS.
+    """
+    presets = DEFAULT_PRESETS
+    path = os.environ.get("BSM_PREWARM_PRESETS")
+    if path:
+        with open(path) as presets_file:
+            presets = json.load(presets_file)
+    return [{**DEFAULT_INPUTS, **{name: float(value) for name, value in preset.items()}} for preset in presets]
+
+
+def prewarm_inputs(inputs: dict) -> None:
+    """
+    Runs every cached computation the bsm page needs on first load for one set of inputs.
+    """
+    # imported here so that importing this module (at server start) stays cheap; the work runs on the pre-warm thread
+    from core.surfaces import DEFAULT_RESOLUTION
+    from functions.computations import (
+        get_bsm_prices,
+        get_leland_prices,
+        get_implied_volatility,
+        get_greeks_by_model,
+        get_theta,
+        get_vega,
+        get_gamma,
+        get_delta,
+        get_rho
+    )
+    from functions.graph_surface_helper import (
+        generate_bsm_surface,
+        generate_leland_surface,
+        generate_bsm_vs_leland_surface
+    )
+
+    S, K, T, r, v, q, k, dt = (inputs[name] for name in ["S", "K", "T", "r", "v", "q", "k", "dt"])
+    plot_range = (inputs["strike_min"], inputs["strike_max"], inputs["maturity_min"], inputs["maturity_max"])
+    models = ["Black-Scholes", "Leland's Model"] if dt > 0 else ["Black-Scholes"]
+
+    get_bsm_prices(T, K, S, v, r, q)
+    get_greeks_by_model(T, K, S, v, r, q, k, dt)
+    for model_type in models:
+        for greek in (get_vega, get_gamma, get_delta, get_theta, get_rho):
+            greek(T, K, S, v, r, q, k, dt, model_type)
+        for option_type, intrinsic in (("Call", max(S - K, 0)), ("Put", max(K - S, 0))):
+            # the Greeks tabs default the market price to 1.5x the value at expiry
+            get_implied_volatility(T, K, S, v, r, q, k, dt, option_type, float(intrinsic * 1.5), model_type)
+
+    # the page passes the default uniform mesh positionally, and the caches key on the exact arguments
+    surface_options = (DEFAULT_RESOLUTION, False)
+    for option_type, (elevation, rotation) in DEFAULT_VIEWS.items():
+        generate_bsm_surface(option_type, elevation, rotation, *plot_range, S, v, r, q, *surface_options)
+        if dt > 0:
+            generate_leland_surface(option_type, elevation, rotation, *plot_range, S, v, r, q, k, dt, *surface_options)
+            generate_bsm_vs_leland_surface(option_type, elevation, rotation, *plot_range, S, v, r, q, k, dt, *surface_options)
+
+    if dt > 0:
+        get_leland_prices(T, K, S, v, r, q, k, dt)
+
+
+def prewarm(presets: list = None) -> float:
+    """
+    Warms the caches for every preset in turn and returns the seconds it took.
+    A failing preset is logged and skipped so it cannot stop the others.
+    """
+    presets = load_presets() if presets is None else presets
+    start = time.perf_counter()
+    try:
+        preload_images()
+    except Exception:
+        logger.exception("Image pre-load failed")
+    for inputs in presets:
+        try:
+            prewarm_inputs(inputs)
+        except Exception:
+            logger.exception("Cache pre-warm failed for %s", inputs)
+    elapsed = time.perf_counter() - start
+    logger.info("Pre-warmed %d parameter sets in %.2fs", len(presets), elapsed)
+    return elapsed
+
+
+def start_prewarm() -> threading.Thread | None:
+    """
+    Starts pre-warming on a daemon thread, once per server process; later calls return the same thread.
+    Safe to call from every rerun, and never blocks the caller.
+    """
+    global _thread
+    if os.environ.get("BSM_PREWARM", "1") == "0":
+        return None
+
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=prewarm, name="cache-prewarm", daemon=True)
+            _thread.start()
+        return _thread
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    prewarm()
+    sys.exit(0)
@@ -1,9 +1,7 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-
-from functions.computations import get_bsm_prices, get_leland_prices
+from models.bsm_vectorized import batch_prices
+from models.bsm_leland_vectorized import batch_leland
+from graphPlots.plot_surface import plot_surface_figure
+from core.surfaces import DEFAULT_RESOLUTION, compute_bsm_vs_leland_surface
 
 
 class PlotBsmVsBsml:
@@ -26,41 +24,56 @@ class PlotBsmVsBsml:
     def compute_difference(self, K_val, T_val) -> tuple:
         """ 
         Computes the difference between Leland and Black-Scholes-Merton option prices.
+        Accepts scalars or whole strike/maturity grids.
         """
 
-        bsm_call, bsm_put = get_bsm_prices(T_val, K_val, self.S, self.v, self.r, self.q)
-        l_call, l_put = get_leland_prices(T_val, K_val, self.S, self.v, self.r, self.q, self.k, self.dt)
-        
+        bsm_call, bsm_put = batch_prices(T_val, K_val, self.S, self.v, self.r, self.q)
+        leland = batch_leland(T_val, K_val, self.S, self.v, self.r, self.q, self.k, self.dt)
+        l_call, l_put = leland.call_price, leland.put_price
+
         call_diff = l_call - bsm_call
         put_diff = l_put - bsm_put
 
         return call_diff, put_diff
 
-    def plot_option_surface(self, option_type: str, elevation: int, rotation: int):
+    def compute_surface(self, resolution: int = DEFAULT_RESOLUTION, adaptive: bool = False) -> tuple:
         """
-        Plots the surface of the difference between Leland and BSM option prices.
+        Evaluates the Leland minus BSM price difference over the whole strike x maturity grid in one broadcast call.
+        resolution is the points per axis; adaptive concentrates that budget where the surface bends most.
         """
-        # --- initialise the grid for strikes and maturities ---
-        strikes = np.linspace(self.strike_min, self.strike_max, 30)
-        maturities = np.linspace(self.maturity_min, self.maturity_max, 30)
-        K_grid, T_grid = np.meshgrid(strikes, maturities)
-
-        call_diffs, put_diffs = np.vectorize(self.compute_difference)(K_grid, T_grid)
+        return compute_bsm_vs_leland_surface(
+            self.strike_min, self.strike_max, self.maturity_min, self.maturity_max,
+            self.S, self.v, self.r, self.q, self.k, self.dt,
+            resolution, adaptive
+        )
 
+    def select_option_data(self, option_type: str, call_diffs, put_diffs) -> tuple:
+        """
+        Picks the call or put grid and its z-axis label.
+        """
         if option_type == 'Call':
-            option_data = call_diffs
-            z_label = 'Call Difference'
+            return call_diffs, 'Call Difference'
         elif option_type == 'Put':
-            option_data = put_diffs
-            z_label = 'Put Difference'
+            return put_diffs, 'Put Difference'
         else:
             raise ValueError(f"Unknown option_type for Leland plot: {option_type}")
 
+    def plot_option_surface(self, option_type: str, elevation: int, rotation: int, resolution: int = DEFAULT_RESOLUTION, adaptive: bool = False):
+        """
+        Plots the surface of the difference between Leland and BSM option prices.
+        """
+        # --- evaluate the grid for strikes and maturities ---
+        K_grid, T_grid, call_diffs, put_diffs = self.compute_surface(resolution, adaptive)
+        return self.render_surface(K_grid, T_grid, call_diffs, put_diffs, option_type, elevation, rotation)
+
+    def render_surface(self, K_grid, T_grid, call_diffs, put_diffs, option_type: str, elevation: int, rotation: int):
+        """
+        Renders an already computed grid; only this step depends on the view angle.
+        """
+        option_data, z_label = self.select_option_data(option_type, call_diffs, put_diffs)
+
         # --- Create the figure ---
-        fig = plt.figure(figsize=(8, 8), facecolor="#262730")
-        ax = fig.add_subplot(111, projection='3d')
-        ax.view_init(elev=elevation, azim=rotation)# type: ignore
-        ax.plot_surface(K_grid, T_grid, option_data, cmap='viridis')# type: ignore
+        fig, ax = plot_surface_figure(K_grid, T_grid, option_data, elevation, rotation, facecolor="#262730")
 
         # --- Styling ---
         # labels + titles
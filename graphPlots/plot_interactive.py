@@ -0,0 +1,25 @@
+import plotly.graph_objects as go
+
+
+def plot_interactive_surface(K_grid, T_grid, option_data, z_label: str):
+    """
+    Builds a Plotly 3D surface from an already computed grid.
+    Rotation and zoom happen in the browser, so changing the view never reruns the script.
+    """
+    fig = go.Figure(data=[go.Surface(x=K_grid, y=T_grid, z=option_data, colorscale='Viridis', showscale=False)])
+
+    # --- Styling ---
+    axis_style = dict(color="#6b0000ff", gridcolor="#6b0000ff", backgroundcolor="#fff7e6ff")
+    fig.update_layout(
+        scene=dict(
+            xaxis=dict(title='Strike Price', **axis_style),
+            yaxis=dict(title='Time to Maturity', **axis_style),
+            zaxis=dict(title=z_label, **axis_style),
+            camera=dict(eye=dict(x=1.6, y=-1.6, z=0.8)),
+        ),
+        paper_bgcolor="#fff7e6ff",
+        margin=dict(l=0, r=0, t=0, b=0),
+        height=600,
+    )
+
+    return fig
@@ -1,8 +1,6 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-from models.bsm_model import BlackScholes
+from models.bsm_vectorized import batch_prices
+from graphPlots.plot_surface import plot_surface_figure
+from core.surfaces import DEFAULT_RESOLUTION, compute_bsm_surface
 
 
 class PlotOptionBSM:
@@ -23,36 +21,49 @@ class PlotOptionBSM:
     def compute_option_price(self, K_val, T_val) -> tuple:
         """
         Helper function to calculate BSM prices.
+        Accepts scalars or whole strike/maturity grids.
         """
-        model = BlackScholes(T_val, K_val, self.S, self.v, self.r, self.q)
-        call_price, put_price = model.calculate_prices()
+        call_price, put_price = batch_prices(T_val, K_val, self.S, self.v, self.r, self.q)
         return call_price, put_price
 
-    def plot_option_surface(self, option_type: str, elevation: int, rotation: int):
+    def compute_surface(self, resolution: int = DEFAULT_RESOLUTION, adaptive: bool = False) -> tuple:
         """
-        Generates the 3D surface plot for a given option type.
+        Evaluates call and put prices over the whole strike x maturity grid in one broadcast call.
+        resolution is the points per axis; adaptive concentrates that budget where the surface bends most.
         """
-        # --- initialise the grid for strikes and maturities ---
-        strikes = np.linspace(self.strike_min, self.strike_max, 30)
-        maturities = np.linspace(self.maturity_min, self.maturity_max, 30)
-        K_grid, T_grid = np.meshgrid(strikes, maturities)
-
-        call_prices, put_prices = np.vectorize(self.compute_option_price)(K_grid, T_grid)
+        return compute_bsm_surface(
+            self.strike_min, self.strike_max, self.maturity_min, self.maturity_max,
+            self.S, self.v, self.r, self.q,
+            resolution, adaptive
+        )
 
+    def select_option_data(self, option_type: str, call_prices, put_prices) -> tuple:
+        """
+        Picks the call or put grid and its z-axis label.
+        """
         if option_type == 'Call':
-            option_data = call_prices
-            z_label = 'Call Option Price'  
+            return call_prices, 'Call Option Price'
         elif option_type == 'Put':
-            option_data = put_prices
-            z_label = 'Put Option Price'
+            return put_prices, 'Put Option Price'
         else:
             raise ValueError(f"Unknown option_type for BSM plot: {option_type}")
 
+    def plot_option_surface(self, option_type: str, elevation: int, rotation: int, resolution: int = DEFAULT_RESOLUTION, adaptive: bool = False):
+        """
+        Generates the 3D surface plot for a given option type.
+        """
+        # --- evaluate the grid for strikes and maturities ---
+        K_grid, T_grid, call_prices, put_prices = self.compute_surface(resolution, adaptive)
+        return self.render_surface(K_grid, T_grid, call_prices, put_prices, option_type, elevation, rotation)
+
+    def render_surface(self, K_grid, T_grid, call_prices, put_prices, option_type: str, elevation: int, rotation: int):
+        """
+        Renders an already computed grid; only this step depends on the view angle.
+        """
+        option_data, z_label = self.select_option_data(option_type, call_prices, put_prices)
+
         # --- Create the figure ---
-        fig = plt.figure(figsize=(8, 8), facecolor="#6b0000ff", edgecolor="#6b0000ff")
-        ax = fig.add_subplot(111, projection='3d')
-        ax.view_init(elev=elevation, azim=rotation)# type: ignore
-        ax.plot_surface(K_grid, T_grid, option_data, cmap='viridis')# type: ignore
+        fig, ax = plot_surface_figure(K_grid, T_grid, option_data, elevation, rotation, facecolor="#6b0000ff", edgecolor="#6b0000ff")
 
         # --- Styling ---
         # labels + titles
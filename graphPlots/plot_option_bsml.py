@@ -1,8 +1,6 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-from models.bsm_leland_model import BlackScholesLeland
+from models.bsm_leland_vectorized import batch_leland
+from graphPlots.plot_surface import plot_surface_figure
+from core.surfaces import DEFAULT_RESOLUTION, compute_leland_surface
 
 
 class PlotOptionBSML:
@@ -25,36 +23,49 @@ class PlotOptionBSML:
     def compute_option_price(self, K_val, T_val) -> tuple:
         """
         Helper function to calculate Leland prices.
+        Accepts scalars or whole strike/maturity grids.
         """
-        model = BlackScholesLeland(T_val, K_val, self.S, self.v, self.r, self.q, self.k, self.dt)
-        l_call_price, l_put_price = model.calculate_prices()
-        return l_call_price, l_put_price
+        result = batch_leland(T_val, K_val, self.S, self.v, self.r, self.q, self.k, self.dt)
+        return result.call_price, result.put_price
 
-    def plot_option_surface(self, option_type: str, elevation: int, rotation: int):
+    def compute_surface(self, resolution: int = DEFAULT_RESOLUTION, adaptive: bool = False) -> tuple:
         """
-        Generates the 3D surface plot for a given option type and view angle.
+        Evaluates Leland call and put prices over the whole strike x maturity grid in one broadcast call.
+        resolution is the points per axis; adaptive concentrates that budget where the surface bends most.
         """
-        # --- initialise the grid for strikes and maturities ---
-        strikes = np.linspace(self.strike_min, self.strike_max, 30)
-        maturities = np.linspace(self.maturity_min, self.maturity_max, 30)
-        K_grid, T_grid = np.meshgrid(strikes, maturities)
-
-        l_call_p, l_put_p = np.vectorize(self.compute_option_price)(K_grid, T_grid)
+        return compute_leland_surface(
+            self.strike_min, self.strike_max, self.maturity_min, self.maturity_max,
+            self.S, self.v, self.r, self.q, self.k, self.dt,
+            resolution, adaptive
+        )
 
+    def select_option_data(self, option_type: str, l_call_p, l_put_p) -> tuple:
+        """
+        Picks the call or put grid and its z-axis label.
+        """
         if option_type == 'Call':
-            option_data = l_call_p
-            z_label = 'Call Price'
+            return l_call_p, 'Call Price'
         elif option_type == 'Put':
-            option_data = l_put_p
-            z_label = 'Put Price'
+            return l_put_p, 'Put Price'
         else:
             raise ValueError(f"Unknown option_type for Leland plot: {option_type}")
 
+    def plot_option_surface(self, option_type: str, elevation: int, rotation: int, resolution: int = DEFAULT_RESOLUTION, adaptive: bool = False):
+        """
+        Generates the 3D surface plot for a given option type and view angle.
+        """
+        # --- evaluate the grid for strikes and maturities ---
+        K_grid, T_grid, l_call_p, l_put_p = self.compute_surface(resolution, adaptive)
+        return self.render_surface(K_grid, T_grid, l_call_p, l_put_p, option_type, elevation, rotation)
+
+    def render_surface(self, K_grid, T_grid, l_call_p, l_put_p, option_type: str, elevation: int, rotation: int):
+        """
+        Renders an already computed grid; only this step depends on the view angle.
+        """
+        option_data, z_label = self.select_option_data(option_type, l_call_p, l_put_p)
+
         # --- Create the figure ---
-        fig = plt.figure(figsize=(8, 8), facecolor="#6b0000ff")
-        ax = fig.add_subplot(111, projection='3d')
-        ax.view_init(elev=elevation, azim=rotation)# type: ignore
-        ax.plot_surface(K_grid, T_grid, option_data, cmap='viridis')# type: ignore
+        fig, ax = plot_surface_figure(K_grid, T_grid, option_data, elevation, rotation, facecolor="#6b0000ff")
 
         # --- Styling ---
         # labels + titles
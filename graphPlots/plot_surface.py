@@ -0,0 +1,14 @@
+def plot_surface_figure(K_grid, T_grid, option_data, elevation: int, rotation: int, **figure_style) -> tuple:
+    """
+    Creates the figure and 3D axes at the given view angle and draws the surface; shared by the
+    matplotlib renderers, which then style the axes. Returns (fig, ax).
+    """
+    # matplotlib is only imported once a surface is actually drawn (cached images skip it)
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(8, 8), **figure_style)
+    ax = fig.add_subplot(111, projection='3d')
+    ax.view_init(elev=elevation, azim=rotation)# type: ignore
+    # draw every grid line; matplotlib would otherwise downsample grids finer than 50 points per axis
+    ax.plot_surface(K_grid, T_grid, option_data, cmap='viridis', rcount=K_grid.shape[0], ccount=K_grid.shape[1])# type: ignore
+    return fig, ax
@@ -1,9 +1,23 @@
-from numpy import sqrt, pi, log, exp
-from scipy.stats import norm
-from models.bsm_model import BlackScholes 
+from numpy import sqrt, pi, exp
+from models.normal import norm_cdf, norm_pdf
+from models.bsm_model import _d_values, _prices
+from models.records import FrozenRecord, lazy_slot
 
 
-class BlackScholesLeland:
+def _leland_volatility(v, k, dt) -> tuple:
+    # the Leland number and the adjusted volatility for decimal inputs (dt in years)
+    leland_number = sqrt(2 / pi) * (k / (v * sqrt(dt)))
+    new_v = sqrt(v**2 * (1 + leland_number))
+    return leland_number, new_v
+
+
+class BlackScholesLeland(FrozenRecord):
+    """
+    Immutable Leland parameter record. The Leland number, the adjusted volatility, d1/d2 and the
+    prices are computed on first use and cached.
+    """
+    __slots__ = ("T", "K", "S", "v", "r", "q", "k", "dt", "_leland", "_d_values", "_prices")
+
     def __init__(self, T: float, K: float, S: float, v: float, r: float, q: float, k: float, dt: float,):
         """
         Parameters:
@@ -17,61 +31,68 @@ class BlackScholesLeland:
         - dt: Delta t, the time between hedging adjustment (in trading days)
         """
 
-        self.T = T
-        self.K = K
-        self.S = S
-        self.v = v / 100 # Convert percent to decimal
-        self.r = r / 100
-        self.q = q / 100
-        self.k = k / 100
-        self.dt = dt / 252 # Convert trading days to years
-
-        self.call_price = None
-        self.put_price = None
+        set_field = object.__setattr__
+        set_field(self, "T", T)
+        set_field(self, "K", K)
+        set_field(self, "S", S)
+        set_field(self, "v", v / 100) # Convert percent to decimal
+        set_field(self, "r", r / 100)
+        set_field(self, "q", q / 100)
+        set_field(self, "k", k / 100)
+        set_field(self, "dt", dt / 252) # Convert trading days to years
 
-        self._compute_d_values()
-        self.compute_leland_number()
-
-    def _compute_d_values(self) -> tuple:
+    def with_volatility(self, v: float) -> "BlackScholesLeland":
         """
-        Compute d1 and d2 values used in pricing formulas.
+        The same contract at another volatility (as a percentage).
         """
-        new_v = self.compute_leland_number()
+        return self._copy(v=v / 100)
 
-        if new_v <= 0:
-            d1 = float('nan')
-            d2 = float('nan')
-        else:
-            vol_sqrt_T = new_v * sqrt(self.T)
-            numerator = log(self.S / self.K) + self.T * (self.r - self.q + 0.5 * new_v**2)
-            d1 = numerator / vol_sqrt_T
-            d2 = d1 - vol_sqrt_T
+    @lazy_slot
+    def leland(self) -> tuple:
+        """
+        The Leland number and the volatility adjusted by it, as (leland_number, adjusted_v).
+        """
+        return _leland_volatility(self.v, self.k, self.dt)
 
-        return d1, d2
+    @property
+    def adjusted_v(self) -> float:
+        return self.leland[1]
 
     def compute_leland_number(self) -> float:
         """
         Compute the Leland number and adjust the volatility accordingly.
         """
-        v, k, dt = self.v, self.k, self.dt
+        return self.adjusted_v
+
+    @lazy_slot
+    def d_values(self) -> tuple:
+        """
+        d1 and d2 at the adjusted volatility (NaN when it is not positive).
+        """
+        return _d_values(self.S, self.K, self.T, self.r, self.q, self.adjusted_v)
 
-        leland_number = sqrt(2 / pi) * (k / (v * sqrt(dt)))
-        new_v = sqrt(v**2 * (1 + leland_number))
-        return new_v
+    @lazy_slot
+    def prices(self) -> tuple:
+        """
+        Black-Scholes (call, put) prices at the adjusted volatility.
+        """
+        S, K, T = self.S, self.K, self.T
+        return _prices(S, K, *self.d_values, exp(-self.q * T), exp(-self.r * T))
 
     def calculate_prices(self) -> tuple:
         """
         Calculate and return Black-Scholes call and put prices adjusted for Leland's model.
         """
-        T, K, S, r, q = self.T, self.K, self.S, self.r, self.q,
+        return self.prices
 
-        new_v = self.compute_leland_number()
+    @property
+    def call_price(self) -> float:
+        return self.prices[0]
 
-        bs_model = BlackScholes(T, K, S, new_v * 100, r * 100, q * 100) # convert back to percentages
-        call_price, put_price = bs_model.calculate_prices()
+    @property
+    def put_price(self) -> float:
+        return self.prices[1]
 
-        return call_price, put_price
-    
     def vega(self) -> float:
         """
         Compute Vega for the Leland model using the chain rule.
@@ -80,9 +101,8 @@ class BlackScholesLeland:
         if v <= 0:
             return 0.0
 
-        # calculate the adjusted volatility and the Leland Number
-        leland_number = sqrt(2 / pi) * (self.k / (v * sqrt(self.dt)))
-        v_adj = sqrt(v**2 * (1 + leland_number))
+        # the adjusted volatility and the Leland Number
+        leland_number, v_adj = self.leland
 
         if v_adj <= 0:
             return 0.0
@@ -90,10 +110,9 @@ class BlackScholesLeland:
         # calculate the derivative of the adjustment: d(v_adj) / d(v)
         dv_adj_dv = (v * (1 + 0.5 * leland_number)) / v_adj
 
-        # calculate BSM Vega using the ADJUSTED volatility
-        # note: we need a temporary BSM model to get the d1 for the adjusted vol
-        temp_bs_model = BlackScholes(self.T, self.K, self.S, v_adj * 100, self.r * 100, self.q * 100)
-        bsm_vega_adj = temp_bs_model.vega() # This is dC/dv_adj
+        # BSM Vega at the ADJUSTED volatility: this is dC/dv_adj
+        d1, _ = self.d_values
+        bsm_vega_adj = self.S * exp(-self.q * self.T) * norm_pdf(d1) * sqrt(self.T)
 
         # apply the chain rule
         vega = bsm_vega_adj * dv_adj_dv
@@ -104,18 +123,18 @@ class BlackScholesLeland:
         """
         Compute Gamma: sensitivity of delta in relation to changes in the underlying asset price.
         """
-        new_v = self.compute_leland_number()
-        d1, _ = self._compute_d_values()
+        new_v = self.adjusted_v
+        d1, _ = self.d_values
         S, T, q = self.S, self.T, self.q
-        Gamma = norm.pdf(d1) * exp(-q * T) / (S * new_v * sqrt(T))
+        Gamma = norm_pdf(d1) * exp(-q * T) / (S * new_v * sqrt(T))
         return Gamma
 
     def delta(self) -> tuple:
         """
         Compute Delta: sensitivity of option price to the underlying asset price.
         """
-        d1, _ = self._compute_d_values()
-        Call_Delta = exp(-self.q * self.T) * norm.cdf(d1)
+        d1, _ = self.d_values
+        Call_Delta = exp(-self.q * self.T) * norm_cdf(d1)
         Put_Delta = Call_Delta - exp(-self.q * self.T)
         return Call_Delta, Put_Delta
 
@@ -123,55 +142,59 @@ class BlackScholesLeland:
         """
         Compute Theta: sensitivity of option price to time decay.
         """
-        d1, d2 = self._compute_d_values()
-        new_v = self.compute_leland_number()
+        d1, d2 = self.d_values
+        new_v = self.adjusted_v
         S, K, T, r, q = self.S, self.K, self.T, self.r, self.q
-        theta_call = (-S * exp(-q * T) * norm.pdf(d1) * new_v / (2 * sqrt(T)) -
-                      r * K * exp(-r * T) * norm.cdf(d2) +
-                      q * S * exp(-q * T) * norm.cdf(d1))
-        theta_put = (-S * exp(-q * T) * norm.pdf(d1) * new_v / (2 * sqrt(T)) +
-                     r * K * exp(-r * T) * norm.cdf(-d2) -
-                     q * S * exp(-q * T) * norm.cdf(-d1))
+        theta_call = (-S * exp(-q * T) * norm_pdf(d1) * new_v / (2 * sqrt(T)) -
+                      r * K * exp(-r * T) * norm_cdf(d2) +
+                      q * S * exp(-q * T) * norm_cdf(d1))
+        theta_put = (-S * exp(-q * T) * norm_pdf(d1) * new_v / (2 * sqrt(T)) +
+                     r * K * exp(-r * T) * norm_cdf(-d2) -
+                     q * S * exp(-q * T) * norm_cdf(-d1))
         return theta_call, theta_put
 
     def rho(self) -> tuple:
         """
         Compute Rho: sensitivity of option price to interest rate changes.
         """
-        _, d2 = self._compute_d_values()
+        _, d2 = self.d_values
         K, T, r = self.K, self.T, self.r
-        rho_call = K * T * exp(-r * T) * norm.cdf(d2)
-        rho_put = -K * T * exp(-r * T) * norm.cdf(-d2)
+        rho_call = K * T * exp(-r * T) * norm_cdf(d2)
+        rho_put = -K * T * exp(-r * T) * norm_cdf(-d2)
         return rho_call, rho_put
 
     def implied_volatility(self, option_type: str,  market_price: float, iterations: int = 100, tolerance: float = 1e-5) -> float:
         """
-        Calculate implied volatility using the Newton-Raphson method for Leland's model.
+        Calculate implied volatility using the Newton-Raphson method for Leland's model, starting from
+        this record's volatility. The record is left unchanged: each step prices the trial volatility directly.
         """
+        S, K, T, r, q, k, dt = self.S, self.K, self.T, self.r, self.q, self.k, self.dt
+        # the discount factors do not depend on the volatility, so every step reuses them
+        dividend_discount, rate_discount = exp(-q * T), exp(-r * T)
         input_vol = self.v
 
         for _ in range(iterations):
-            self.v = input_vol
-
-            # recalculate d1 and d2 with the new volatility
-            call, put = self.calculate_prices()
-
-            vega = self.vega()
+            leland_number, v_adj = _leland_volatility(input_vol, k, dt)
+            d1, d2 = _d_values(S, K, T, r, q, v_adj)
+            call, put = _prices(S, K, d1, d2, dividend_discount, rate_discount)
+
+            # vega via the chain rule, zero where the volatility is not positive (see vega())
+            if input_vol <= 0 or v_adj <= 0:
+                vega = 0.0
+            else:
+                vega = S * dividend_discount * norm_pdf(d1) * sqrt(T) * (input_vol * (1 + 0.5 * leland_number)) / v_adj
             if vega == 0:
                 # prevent division by zero
-                break 
+                break
 
             option_price = call if option_type.lower() == 'call' else put
             diff = option_price - market_price
 
             # check for convergence
             if abs(diff) < tolerance:
-                return self.v
+                return input_vol
 
             input_vol -= diff / vega
 
         # return NaN if no convergence
         return float('nan')
-
-
-        
\ No newline at end of file
@@ -0,0 +1,76 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from models.bsm_vectorized import _as_float_arrays, _greeks_from_volatility
+
+
+class LelandBatchResult(NamedTuple):
+    """
+    Prices and Greeks for a batch of contracts under Leland's model.
+    Each field is an array with the broadcast shape of the inputs.
+    """
+    call_price: np.ndarray
+    put_price: np.ndarray
+    vega: np.ndarray
+    gamma: np.ndarray
+    call_delta: np.ndarray
+    put_delta: np.ndarray
+    call_theta: np.ndarray
+    put_theta: np.ndarray
+    call_rho: np.ndarray
+    put_rho: np.ndarray
+    adjusted_v: np.ndarray
+
+
+def compute_leland_volatility(v, k, dt) -> tuple:
+    """
+    Compute the Leland number and the adjusted volatility element-wise.
+
+    Parameters (decimals, dt in years):
+    - v: Volatility
+    - k: Roundtrip transaction cost rate
+    - dt: Time between hedging adjustments
+
+    Returns a (leland_number, adjusted_v) tuple.
+    """
+    v, k, dt = _as_float_arrays(v, k, dt)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        leland_number = np.sqrt(2 / np.pi) * (k / (v * np.sqrt(dt)))
+        adjusted_v = np.sqrt(v**2 * (1 + leland_number))
+
+    return leland_number, adjusted_v
+
+
+def batch_leland(T, K, S, v, r, q, k, dt) -> LelandBatchResult:
+    """
+    Calculate Leland prices and Greeks for many contracts in one vectorized pass.
+
+    Every parameter may be a scalar or a NumPy array; they are broadcast against each other.
+    Units follow BlackScholesLeland:
+    - T: Time to maturity (in years)
+    - K: Strike price
+    - S: Spot price
+    - v: Volatility (as a percentage, e.g., 20 for 20%)
+    - r: Risk-free interest rate (as a percentage)
+    - q: Dividend yield (as a percentage)
+    - k: Roundtrip transaction cost rate per unit dollar of transaction (as a percentage)
+    - dt: Delta t, the time between hedging adjustment (in trading days)
+
+    The adjusted volatility is computed once per element and shared by every output.
+    """
+    T, K, S, v, r, q, k, dt = _as_float_arrays(T, K, S, v, r, q, k, dt)
+    v, r, q, k = v / 100, r / 100, q / 100, k / 100 # convert percent to decimal
+    dt = dt / 252 # convert trading days to years
+
+    leland_number, new_v = compute_leland_volatility(v, k, dt)
+    greeks = _greeks_from_volatility(T, K, S, new_v, r, q)
+
+    # vega via the chain rule: dC/dv = dC/dv_adj * dv_adj/dv
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dv_adj_dv = (v * (1 + 0.5 * leland_number)) / new_v
+        # np.where always returns an array, so unwrap it like the other (0-d arithmetic) fields
+        vega = np.where((v <= 0) | (new_v <= 0), 0.0, greeks.vega * dv_adj_dv)[()]
+
+    return LelandBatchResult(*greeks._replace(vega=vega), new_v)
@@ -1,8 +1,32 @@
 from numpy import log, sqrt, exp
-from scipy.stats import norm
+from models.normal import norm_cdf, norm_pdf
+from models.records import FrozenRecord, lazy_slot
 
 
-class BlackScholes:
+def _d_values(S, K, T, r, q, v) -> tuple:
+    # d1 and d2 for decimal inputs; NaN when the volatility is not positive
+    if v <= 0:
+        return float('nan'), float('nan')
+
+    vol_sqrt_T = v * sqrt(T)
+    numerator = log(S / K) + T * (r - q + 0.5 * v**2)
+    d1 = numerator / vol_sqrt_T
+    return d1, d1 - vol_sqrt_T
+
+
+def _prices(S, K, d1, d2, dividend_discount, rate_discount) -> tuple:
+    call = S * dividend_discount * norm_cdf(d1) - K * rate_discount * norm_cdf(d2)
+    put = K * rate_discount * norm_cdf(-d2) - S * dividend_discount * norm_cdf(-d1)
+    return call, put
+
+
+class BlackScholes(FrozenRecord):
+    """
+    Immutable Black-Scholes parameter record. d1/d2, the discount factors and the prices are
+    computed on first use and cached on the record, so it can be shared between threads.
+    """
+    __slots__ = ("T", "K", "S", "v", "r", "q", "_d_values", "_dividend_discount", "_rate_discount", "_prices")
+
     def __init__(self, T: float, K: float, S: float, v: float, r: float, q: float):
         """
         - T: Time to maturity (in years)
@@ -12,107 +36,134 @@ class BlackScholes:
         - r: Risk-free interest rate (as a percentage)
         - q: Dividend yield (as a percentage)
         """
-        self.T = T
-        self.K = K
-        self.S = S
-        self.v = v / 100  # Convert percent to decimal
-        self.r = r / 100
-        self.q = q / 100
+        set_field = object.__setattr__
+        set_field(self, "T", T)
+        set_field(self, "K", K)
+        set_field(self, "S", S)
+        set_field(self, "v", v / 100)  # Convert percent to decimal
+        set_field(self, "r", r / 100)
+        set_field(self, "q", q / 100)
 
-        self._compute_d_values()
+    def with_volatility(self, v: float) -> "BlackScholes":
+        """
+        The same contract at another volatility (as a percentage).
+        """
+        return self._copy(v=v / 100)
 
-    def _compute_d_values(self) -> None:
+    @lazy_slot
+    def d_values(self) -> tuple:
         """
-        Compute d1 and d2 values used in pricing formulas.
+        d1 and d2 used in the pricing formulas (NaN when the volatility is not positive).
         """
-        if self.v <= 0:
-            self.d1 = float('nan')
-            self.d2 = float('nan')
-        else:
-            vol_sqrt_T = self.v * sqrt(self.T)
-            numerator = log(self.S / self.K) + self.T * (self.r - self.q + 0.5 * self.v**2)
-            self.d1 = numerator / vol_sqrt_T
-            self.d2 = self.d1 - vol_sqrt_T
+        return _d_values(self.S, self.K, self.T, self.r, self.q, self.v)
 
-    def calculate_prices(self) -> tuple:
+    @property
+    def d1(self) -> float:
+        return self.d_values[0]
+
+    @property
+    def d2(self) -> float:
+        return self.d_values[1]
+
+    @lazy_slot
+    def dividend_discount(self) -> float:
+        return exp(-self.q * self.T)
+
+    @lazy_slot
+    def rate_discount(self) -> float:
+        return exp(-self.r * self.T)
+
+    @lazy_slot
+    def prices(self) -> tuple:
         """
-        Calculate and return Black-Scholes call and put prices.
+        Black-Scholes (call, put) prices.
         """
-        S, K, T, r, q = self.S, self.K, self.T, self.r, self.q
-        d1, d2 = self.d1, self.d2
+        # two exp() calls are cheaper than going through the cached discount factors here
+        T = self.T
+        return _prices(self.S, self.K, *self.d_values, exp(-self.q * T), exp(-self.r * T))
 
-        call = S * exp(-q * T) * norm.cdf(d1) - K * exp(-r * T) * norm.cdf(d2)
-        put = K * exp(-r * T) * norm.cdf(-d2) - S * exp(-q * T) * norm.cdf(-d1)
+    @property
+    def call_price(self) -> float:
+        return self.prices[0]
 
-        self.call_price = call
-        self.put_price = put
+    @property
+    def put_price(self) -> float:
+        return self.prices[1]
 
-        return call, put
+    def calculate_prices(self) -> tuple:
+        """
+        Calculate and return Black-Scholes call and put prices.
+        """
+        return self.prices
 
     def vega(self) -> float:
         """
         Compute Vega: sensitivity of option price to volatility.
         """
-        S, T, q, d1 = self.S, self.T, self.q, self.d1
-        Vega = S * exp(-q * T) * norm.pdf(d1) * sqrt(T)
+        S, T, d1 = self.S, self.T, self.d_values[0]
+        Vega = S * self.dividend_discount * norm_pdf(d1) * sqrt(T)
         return Vega
-    
+
     def gamma(self) -> float:
         """
         Compute Gamma: sensitivity of delta in relation to changes in the underlying asset price.
         """
-        S, T, q, d1 = self.S, self.T, self.q, self.d1
-        Gamma = norm.pdf(d1) * exp(-q * T) / (S * self.v * sqrt(T))
+        S, T, d1 = self.S, self.T, self.d_values[0]
+        Gamma = norm_pdf(d1) * self.dividend_discount / (S * self.v * sqrt(T))
         return Gamma
 
     def delta(self) -> tuple:
         """
         Compute Delta: sensitivity of option price to the underlying asset price.
         """
-        Call_Delta = exp(-self.q * self.T) * norm.cdf(self.d1)
-        Put_Delta = exp(-self.q * self.T) * (Call_Delta - 1)
+        Call_Delta = self.dividend_discount * norm_cdf(self.d_values[0])
+        Put_Delta = Call_Delta - self.dividend_discount
         return Call_Delta, Put_Delta
 
     def theta(self) -> tuple:
         """
         Compute Theta: sensitivity of option price to time decay.
         """
-        S, K, T, r, q, d1, d2 = self.S, self.K, self.T, self.r, self.q, self.d1, self.d2
-        theta_call = (-S * exp(-q * T) * norm.pdf(d1) * self.v / (2 * sqrt(T)) -
-                      r * K * exp(-r * T) * norm.cdf(d2) +
-                      q * S * exp(-q * T) * norm.cdf(d1))
-        theta_put = (-S * exp(-q * T) * norm.pdf(d1) * self.v / (2 * sqrt(T)) +
-                     r * K * exp(-r * T) * norm.cdf(-d2) -
-                     q * S * exp(-q * T) * norm.cdf(-d1))
+        S, K, T, r, q = self.S, self.K, self.T, self.r, self.q
+        d1, d2 = self.d_values
+        dividend_discount, rate_discount = self.dividend_discount, self.rate_discount
+        theta_call = (-S * dividend_discount * norm_pdf(d1) * self.v / (2 * sqrt(T)) -
+                      r * K * rate_discount * norm_cdf(d2) +
+                      q * S * dividend_discount * norm_cdf(d1))
+        theta_put = (-S * dividend_discount * norm_pdf(d1) * self.v / (2 * sqrt(T)) +
+                     r * K * rate_discount * norm_cdf(-d2) -
+                     q * S * dividend_discount * norm_cdf(-d1))
         return theta_call, theta_put
 
     def rho(self) -> tuple:
         """
         Compute Rho: sensitivity of option price to interest rate changes.
         """
-        K, T, r, d2 = self.K, self.T, self.r, self.d2
-        rho_call = K * T * exp(-r * T) * norm.cdf(d2)
-        rho_put = -K * T * exp(-r * T) * norm.cdf(-d2)
+        K, T, d2 = self.K, self.T, self.d_values[1]
+        rho_call = K * T * self.rate_discount * norm_cdf(d2)
+        rho_put = -K * T * self.rate_discount * norm_cdf(-d2)
         return rho_call, rho_put
 
     def implied_volatility(self, option_type: str,  market_price: float, iterations: int = 100, tolerance: float = 1e-5) -> float:
         """
-        Calculate implied volatility using the Newton-Raphson method.
+        Calculate implied volatility using the Newton-Raphson method, starting from this record's volatility.
+        The record is left unchanged: each step prices the trial volatility directly.
         """
+        S, K, T, r, q = self.S, self.K, self.T, self.r, self.q
+        # the discount factors do not depend on the volatility, so every step reuses them
+        dividend_discount, rate_discount = self.dividend_discount, self.rate_discount
         vol = self.v
 
         for _ in range(iterations):
-            self.v = vol
-            # recalculate d1 and d2 with the new volatility
-            self._compute_d_values()
-            call, put = self.calculate_prices()
+            d1, d2 = _d_values(S, K, T, r, q, vol)
+            call, put = _prices(S, K, d1, d2, dividend_discount, rate_discount)
 
-            vega = self.vega()
+            vega = S * dividend_discount * norm_pdf(d1) * sqrt(T)
             if vega == 0:
                 # prevent division by zero
                 break
 
-            
+
             option = call if option_type.lower() == 'call' else put
             diff = option - market_price
 
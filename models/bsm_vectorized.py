@@ -0,0 +1,136 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from models.normal import norm_cdf, norm_pdf
+
+
+def _as_float_arrays(*values) -> tuple:
+    """
+    Convert the inputs to float arrays broadcast against each other.
+    """
+    return np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in values))
+
+
+def compute_d_values(T, K, S, v, r, q) -> tuple:
+    """
+    Compute d1 and d2 element-wise for arrays of contracts.
+
+    Parameters (decimals, not percentages):
+    - T: Time to maturity (in years)
+    - K: Strike price
+    - S: Spot price
+    - v: Volatility
+    - r: Risk-free interest rate
+    - q: Dividend yield
+
+    Elements with v <= 0 get NaN, matching BlackScholes.d_values.
+    """
+    T, K, S, v, r, q = _as_float_arrays(T, K, S, v, r, q)
+    valid = v > 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vol_sqrt_T = v * np.sqrt(T)
+        numerator = np.log(S / K) + T * (r - q + 0.5 * v**2)
+        d1 = np.where(valid, numerator / vol_sqrt_T, np.nan)
+        d2 = np.where(valid, d1 - vol_sqrt_T, np.nan)
+
+    return d1, d2
+
+
+def batch_prices(T, K, S, v, r, q) -> tuple:
+    """
+    Calculate Black-Scholes call and put prices for many contracts in one vectorized pass.
+
+    Every parameter may be a scalar or a NumPy array; they are broadcast against each other.
+    Units follow BlackScholes:
+    - T: Time to maturity (in years)
+    - K: Strike price
+    - S: Spot price
+    - v: Volatility (as a percentage, e.g., 20 for 20%)
+    - r: Risk-free interest rate (as a percentage)
+    - q: Dividend yield (as a percentage)
+
+    Returns a (call, put) tuple of arrays with the broadcast shape.
+    """
+    T, K, S, v, r, q = _as_float_arrays(T, K, S, v, r, q)
+    v, r, q = v / 100, r / 100, q / 100 # convert percent to decimal
+
+    d1, d2 = compute_d_values(T, K, S, v, r, q)
+
+    spot_discount = S * np.exp(-q * T)
+    strike_discount = K * np.exp(-r * T)
+
+    call = spot_discount * norm_cdf(d1) - strike_discount * norm_cdf(d2)
+    put = strike_discount * norm_cdf(-d2) - spot_discount * norm_cdf(-d1)
+
+    return call, put
+
+
+class OptionGreeks(NamedTuple):
+    """
+    Prices and first-order Greeks for calls and puts.
+    Each field is an array with the broadcast shape of the inputs.
+    """
+    call_price: np.ndarray
+    put_price: np.ndarray
+    vega: np.ndarray
+    gamma: np.ndarray
+    call_delta: np.ndarray
+    put_delta: np.ndarray
+    call_theta: np.ndarray
+    put_theta: np.ndarray
+    call_rho: np.ndarray
+    put_rho: np.ndarray
+
+
+def _greeks_from_volatility(T, K, S, v, r, q) -> OptionGreeks:
+    """
+    Shared single-pass kernel: prices and Greeks at volatility v (decimal inputs, already broadcast).
+    d1/d2, both discount factors, pdf(d1) and the four cdf values are each evaluated exactly once.
+    """
+    d1, d2 = compute_d_values(T, K, S, v, r, q)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sqrt_T = np.sqrt(T)
+        dividend_discount = np.exp(-q * T)
+        rate_discount = np.exp(-r * T)
+        spot_discount = S * dividend_discount
+        strike_discount = K * rate_discount
+
+        pdf_d1 = norm_pdf(d1)
+        cdf_d1, cdf_d2 = norm_cdf(d1), norm_cdf(d2)
+        cdf_neg_d1, cdf_neg_d2 = norm_cdf(-d1), norm_cdf(-d2)
+
+        call_price = spot_discount * cdf_d1 - strike_discount * cdf_d2
+        put_price = strike_discount * cdf_neg_d2 - spot_discount * cdf_neg_d1
+
+        vega = spot_discount * pdf_d1 * sqrt_T
+        gamma = pdf_d1 * dividend_discount / (S * v * sqrt_T)
+
+        call_delta = dividend_discount * cdf_d1
+        put_delta = call_delta - dividend_discount
+
+        time_decay = -spot_discount * pdf_d1 * v / (2 * sqrt_T)
+        call_theta = time_decay - r * strike_discount * cdf_d2 + q * spot_discount * cdf_d1
+        put_theta = time_decay + r * strike_discount * cdf_neg_d2 - q * spot_discount * cdf_neg_d1
+
+        call_rho = K * T * rate_discount * cdf_d2
+        put_rho = -K * T * rate_discount * cdf_neg_d2
+
+    return OptionGreeks(
+        call_price, put_price, vega, gamma,
+        call_delta, put_delta, call_theta, put_theta,
+        call_rho, put_rho
+    )
+
+
+def batch_greeks(T, K, S, v, r, q) -> OptionGreeks:
+    """
+    Calculate Black-Scholes prices and every first-order Greek in one vectorized pass.
+    Parameters and units are the same as batch_prices.
+    """
+    T, K, S, v, r, q = _as_float_arrays(T, K, S, v, r, q)
+    v, r, q = v / 100, r / 100, q / 100 # convert percent to decimal
+
+    return _greeks_from_volatility(T, K, S, v, r, q)
@@ -0,0 +1,130 @@
+import numpy as np
+
+from models.bsm_model import BlackScholes
+from models.bsm_leland_model import BlackScholesLeland
+from models.bsm_vectorized import OptionGreeks, _as_float_arrays, compute_d_values, batch_greeks
+from models.bsm_leland_vectorized import LelandBatchResult, batch_leland, compute_leland_volatility
+from models.implied_volatility import implied_volatility_batch
+from models.records import FrozenRecord, lazy_slot
+
+FIELDS = ("T", "K", "S", "v", "r", "q", "k", "dt")
+
+
+class OptionContracts(FrozenRecord):
+    """
+    Immutable structure-of-arrays book of contracts: one read-only float64 array per parameter
+    instead of one object per contract, so millions of contracts cost 64 bytes each and build in
+    one array conversion. Scalars broadcast without being copied (a stride-0 view).
+
+    Fields keep the units of BlackScholes / BlackScholesLeland (percentages, dt in trading days).
+    Derived arrays (d1/d2, discount factors, the Leland-adjusted volatility) and the results of
+    greeks / leland are computed on first use and cached, like the scalar records.
+    Arrays passed in are used as they are, not copied, so they should not be modified afterwards.
+    """
+    __slots__ = FIELDS + ("_d_values", "_dividend_discount", "_rate_discount", "_adjusted_v", "_greeks", "_leland")
+
+    def __init__(self, T, K, S, v, r, q, k=0.0, dt=0.0):
+        """
+        Every parameter may be a scalar or an array; they are broadcast to one shape.
+        """
+        for name, values in zip(FIELDS, _as_float_arrays(T, K, S, v, r, q, k, dt)):
+            # a float64 input of the full shape comes back as the caller's own array, so only the
+            # book's view of it is made read-only
+            values = values.view()
+            values.flags.writeable = False
+            object.__setattr__(self, name, values)
+
+    @classmethod
+    def from_frame(cls, frame) -> "OptionContracts":
+        """
+        Builds the book from a DataFrame (or any mapping of columns) with T, K, S, v, r, q and optionally k, dt columns.
+        """
+        return cls(*(np.asarray(frame[name], dtype=float) for name in FIELDS[:6]), *(
+            np.asarray(frame[name], dtype=float) if name in frame else 0.0 for name in FIELDS[6:]
+        ))
+
+    @classmethod
+    def from_records(cls, records) -> "OptionContracts":
+        """
+        Builds the book from BlackScholes / BlackScholesLeland records (converted back to their input units).
+        """
+        rows = [
+            (record.T, record.K, record.S, record.v * 100, record.r * 100, record.q * 100,
+             getattr(record, "k", 0.0) * 100, getattr(record, "dt", 0.0) * 252)
+            for record in records
+        ]
+        columns = np.array(rows, dtype=float).reshape(-1, len(FIELDS)).T
+        return cls(*columns)
+
+    def __len__(self) -> int:
+        return self.T.size
+
+    @property
+    def shape(self) -> tuple:
+        return self.T.shape
+
+    def __getitem__(self, index) -> "OptionContracts":
+        """
+        A sub-book (slice, mask or index array); the cached results are not carried over.
+        """
+        return OptionContracts(*(getattr(self, name)[index] for name in FIELDS))
+
+    def record(self, index: int) -> BlackScholes | BlackScholesLeland:
+        """
+        One contract as a scalar record: BlackScholesLeland when it has a hedging interval, otherwise BlackScholes.
+        """
+        T, K, S, v, r, q, k, dt = (float(getattr(self, name).flat[index]) for name in FIELDS)
+        if dt > 0:
+            return BlackScholesLeland(T, K, S, v, r, q, k, dt)
+        return BlackScholes(T, K, S, v, r, q)
+
+    @lazy_slot
+    def d_values(self) -> tuple:
+        """
+        Black-Scholes d1 and d2 arrays (NaN where the volatility is not positive).
+        """
+        return compute_d_values(self.T, self.K, self.S, self.v / 100, self.r / 100, self.q / 100)
+
+    @lazy_slot
+    def dividend_discount(self) -> np.ndarray:
+        return np.exp(-self.q / 100 * self.T)
+
+    @lazy_slot
+    def rate_discount(self) -> np.ndarray:
+        return np.exp(-self.r / 100 * self.T)
+
+    @lazy_slot
+    def adjusted_v(self) -> np.ndarray:
+        """
+        Leland-adjusted volatility (as a decimal).
+        """
+        return compute_leland_volatility(self.v / 100, self.k / 100, self.dt / 252)[1]
+
+    @lazy_slot
+    def greeks(self) -> OptionGreeks:
+        """
+        Black-Scholes prices and Greeks for every contract.
+        """
+        return batch_greeks(self.T, self.K, self.S, self.v, self.r, self.q)
+
+    @lazy_slot
+    def leland(self) -> LelandBatchResult:
+        """
+        Leland prices and Greeks for every contract.
+        """
+        return batch_leland(self.T, self.K, self.S, self.v, self.r, self.q, self.k, self.dt)
+
+    def prices(self, model: str = "bsm") -> tuple:
+        """
+        (call, put) price arrays under "bsm" or "leland".
+        """
+        result = self.leland if model == "leland" else self.greeks
+        return result.call_price, result.put_price
+
+    def implied_volatility(self, option_type, market_price, model: str = "bsm", iterations: int = 100, tolerance: float = 1e-5) -> np.ndarray:
+        """
+        Implied volatilities (decimals) of market prices for every contract; see implied_volatility_batch.
+        """
+        if model == "leland":
+            return implied_volatility_batch(option_type, market_price, self.T, self.K, self.S, self.r, self.q, self.k, self.dt, iterations, tolerance)
+        return implied_volatility_batch(option_type, market_price, self.T, self.K, self.S, self.r, self.q, iterations=iterations, tolerance=tolerance)
@@ -0,0 +1,39 @@
+import numpy as np
+
+from models.bsm_vectorized import OptionGreeks, batch_greeks
+from models.bsm_leland_vectorized import batch_leland
+
+
+def compute_all_greeks(T, K, S, v, r, q, k=0.0, dt=0.0, model_type: str = "Black-Scholes") -> OptionGreeks:
+    """
+    Compute call/put prices and every first-order Greek in a single pass for either model.
+
+    Parameters follow BlackScholes / BlackScholesLeland and may be scalars or broadcastable arrays.
+    k and dt are only used when model_type is not "Black-Scholes".
+
+    Scalar inputs give NumPy scalars in every field, array inputs give arrays.
+    """
+    if model_type == "Black-Scholes":
+        greeks = batch_greeks(T, K, S, v, r, q)
+    else:
+        greeks = OptionGreeks(*batch_leland(T, K, S, v, r, q, k, dt)[:len(OptionGreeks._fields)])
+
+    # unwrap 0-d arrays so scalar callers get plain numbers back
+    return OptionGreeks(*(value[()] for value in greeks))
+
+
+def compute_greeks_by_model(T, K, S, v, r, q, k=0.0, dt=0.0) -> dict:
+    """
+    Prices and every Greek for both models from one vectorized call, keyed by model name
+    ("Black-Scholes", "Leland's Model") so a dashboard can render all of its cards from one result.
+
+    Parameters follow BlackScholesLeland and must be scalars.
+    Leland's model needs dt > 0; otherwise only the Black-Scholes entry is returned.
+    """
+    if not dt > 0:
+        return {"Black-Scholes": compute_all_greeks(T, K, S, v, r, q)}
+
+    # with zero transaction costs the adjusted volatility is v itself, so BSM rides along as a second contract
+    result = batch_leland(T, K, S, v, r, q, np.array([0.0, k]), dt)
+    bsm, leland = (OptionGreeks(*(value[row] for value in result[:len(OptionGreeks._fields)])) for row in range(2))
+    return {"Black-Scholes": bsm, "Leland's Model": leland}
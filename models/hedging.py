@@ -0,0 +1,310 @@
+"""
+Discrete delta-hedging simulator, to check Leland's transaction-cost model against the hedge it assumes.
+
+A writer sells one option and delta-hedges it every dt trading days, paying a proportional cost of
+k/2 per unit traded (k is the round-trip rate) on every revision, as in Leland (1985); the initial
+hedge and the final settlement are cost-free. Two writers are simulated for every dt of a grid:
+- "leland": charges the Leland premium and hedges with the delta at the Leland-adjusted volatility
+- "bsm": charges the Black-Scholes premium and hedges with the Black-Scholes delta
+Leland's claim is that the first writer's hedging P&L averages to about zero; the second writer
+loses roughly the transaction costs.
+
+All dt values share one daily price path per simulated path, so the grid is compared on common
+random numbers. Paths are streamed in chunks like models.monte_carlo: each chunk keeps O(chunk_size)
+state per writer and returns moments and a fixed-bin histogram of its P&L, so 1e6 paths x 252 steps
+run in bounded memory, and a seed gives the same report serially or on any number of workers.
+
+Command line (from the project root):
+    python -m models.hedging --S 100 --K 100 --v 20 --k 1 --dt 1 2 5 10 21 --paths 1000000
+"""
+import argparse
+import math
+import sys
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from models.bsm_model import BlackScholes
+from models.bsm_leland_model import BlackScholesLeland
+from models.monte_carlo import TRADING_DAYS, _chunk_sizes
+from models.normal import norm_cdf
+
+STRATEGIES = ("leland", "bsm")
+DEFAULT_CHUNK_SIZE = 50_000
+# the P&L histogram spans +-HISTOGRAM_RANGE x S in HISTOGRAM_BINS bins; values outside land in the end bins
+HISTOGRAM_RANGE = 0.25
+HISTOGRAM_BINS = 4000
+
+
+class HedgingResult(NamedTuple):
+    """
+    Hedging P&L of one writer at one rebalancing interval, discounted to time 0, per option sold.
+    """
+    strategy: str
+    dt: float               # trading days between rebalances
+    rebalances: int
+    premium: float
+    mean_pnl: float
+    std_pnl: float
+    standard_error: float
+    pnl_5: float            # 5th percentile (from the histogram, to within one bin)
+    pnl_50: float
+    pnl_95: float
+    mean_cost: float        # transaction costs paid
+
+
+class HedgingReport(NamedTuple):
+    results: list
+    paths: int
+    steps: int
+    seconds: float
+    seed: int               # SeedSequence entropy: pass it back as seed to reproduce the run
+
+    @property
+    def paths_per_second(self) -> float:
+        return self.paths / self.seconds if self.seconds > 0 else float('inf')
+
+
+class _HedgeSpec(NamedTuple):
+    # decimals and years; one row per (strategy, dt) pair, strategies outermost
+    T: float
+    K: float
+    S: float
+    v: float
+    r: float
+    q: float
+    mu: float
+    half_cost: float
+    is_call: bool
+    days: int
+    intervals: tuple
+    volatilities: tuple
+    premiums: tuple
+
+
+def _hedge_delta(S, K, tau, r, q, volatility, is_call) -> np.ndarray:
+    """
+    Black-Scholes delta at the given volatilities (shape (rows, 1)) for spot prices S (shape (paths,)).
+    """
+    vol_sqrt_tau = volatility * math.sqrt(tau)
+    d1 = (np.log(S / K) + (r - q + 0.5 * volatility**2) * tau) / vol_sqrt_tau
+    dividend_discount = math.exp(-q * tau)
+    call_delta = dividend_discount * norm_cdf(d1)
+    return call_delta if is_call else call_delta - dividend_discount
+
+
+def _simulate_chunk(spec: _HedgeSpec, seed: "np.random.SeedSequence", paths: int) -> tuple:
+    """
+    Simulates one chunk and returns (count, mean_pnl, m2_pnl, mean_cost, histogram), one row per
+    (strategy, dt) pair; m2_pnl is the sum of squared deviations from the mean.
+    """
+    rng = np.random.default_rng(seed)
+    step = spec.T / spec.days
+    drift = (spec.mu - spec.q - 0.5 * spec.v**2) * step
+    diffusion = spec.v * math.sqrt(step)
+    intervals = np.array(spec.intervals)
+    volatilities = np.array(spec.volatilities)[:, None]
+    rows = len(intervals)
+
+    S = np.full(paths, float(spec.S))
+    delta = np.repeat(_hedge_delta(S[:1], spec.K, spec.T, spec.r, spec.q, volatilities, spec.is_call), paths, axis=1)
+    # cash flows are accumulated discounted to time 0, so only the rows that trade are touched each day
+    cash = np.repeat(np.array(spec.premiums)[:, None] - delta[:, :1] * spec.S, paths, axis=1)
+    costs = np.zeros((rows, paths))
+
+    for day in range(1, spec.days + 1):
+        S *= np.exp(drift + diffusion * rng.standard_normal(paths))
+        discount = math.exp(-spec.r * day * step)
+        if spec.q:
+            # dividends paid on the shares held over the day
+            cash += delta * (S * (spec.q * step * discount))
+        if day == spec.days:
+            break
+
+        trading = np.flatnonzero(day % intervals == 0)
+        if trading.size == 0:
+            continue
+        new_delta = _hedge_delta(S, spec.K, spec.T - day * step, spec.r, spec.q, volatilities[trading], spec.is_call)
+        trade = new_delta - delta[trading]
+        cost = spec.half_cost * np.abs(trade) * S
+        cash[trading] -= (trade * S + cost) * discount
+        costs[trading] += cost * discount
+        delta[trading] = new_delta
+
+    payoff = np.maximum(S - spec.K, 0.0) if spec.is_call else np.maximum(spec.K - S, 0.0)
+    pnl = cash + (delta * S - payoff) * math.exp(-spec.r * spec.T)
+
+    mean = pnl.mean(axis=1)
+    centered = pnl - mean[:, None]
+    low, width = -HISTOGRAM_RANGE * spec.S, 2 * HISTOGRAM_RANGE * spec.S / HISTOGRAM_BINS
+    bins = np.clip(((pnl - low) / width).astype(np.int64), 0, HISTOGRAM_BINS - 1)
+    bins += np.arange(rows)[:, None] * HISTOGRAM_BINS
+    histogram = np.bincount(bins.ravel(), minlength=rows * HISTOGRAM_BINS).reshape(rows, HISTOGRAM_BINS)
+    return paths, mean, np.einsum("ij,ij->i", centered, centered), costs.mean(axis=1), histogram
+
+
+def _merge_chunks(a: tuple, b: tuple) -> tuple:
+    """
+    Combines two chunks' statistics (Chan et al.'s pairwise update for the mean and squared deviations).
+    """
+    n_a, mean_a, m2_a, cost_a, histogram_a = a
+    n_b, mean_b, m2_b, cost_b, histogram_b = b
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    return (
+        n,
+        mean_a + delta * n_b / n,
+        m2_a + m2_b + delta * delta * n_a * n_b / n,
+        cost_a + (cost_b - cost_a) * n_b / n,
+        histogram_a + histogram_b,
+    )
+
+
+def _histogram_quantile(histogram: np.ndarray, fraction: float, S: float) -> float:
+    """
+    Quantile of a P&L histogram, interpolated linearly within the bin.
+    """
+    cumulative = np.cumsum(histogram)
+    target = fraction * cumulative[-1]
+    index = int(np.searchsorted(cumulative, target))
+    below = cumulative[index - 1] if index > 0 else 0
+    inside = (target - below) / histogram[index] if histogram[index] else 0.5
+    width = 2 * HISTOGRAM_RANGE * S / HISTOGRAM_BINS
+    return float(-HISTOGRAM_RANGE * S + (index + inside) * width)
+
+
+def simulate_hedging(
+    T: float, K: float, S: float, v: float, r: float, q: float, k: float,
+    intervals=(1, 2, 5, 10, 21),
+    option_type: str = "call",
+    mu: float = None,
+    paths: int = 100_000,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = None,
+    workers: int = 1,
+    pool=None,
+) -> HedgingReport:
+    """
+    Simulates the hedging P&L of the Leland and Black-Scholes writers for every rebalancing interval.
+
+    Parameters follow BlackScholesLeland (v, r, q, k as percentages); in addition:
+    - intervals: rebalancing intervals dt to compare, in whole trading days
+    - option_type: 'call' or 'put' (the option sold)
+    - mu: real-world drift of the underlying (as a percentage), defaults to r
+    - paths, chunk_size, seed, workers, pool: as in monte_carlo_price; memory is O(chunk_size x len(intervals))
+    Returns a HedgingReport with one HedgingResult per (strategy, dt), strategies in STRATEGIES order.
+    """
+    option_type = option_type.lower()
+    if option_type not in ("call", "put"):
+        raise ValueError(f"option_type must be 'call' or 'put', got {option_type!r}")
+    days = round(T * TRADING_DAYS)
+    if days < 1 or v <= 0 or paths < 2:
+        raise ValueError("T must cover at least one trading day, v must be positive and at least two paths are needed")
+    if any(dt < 1 or dt != int(dt) for dt in intervals):
+        raise ValueError(f"intervals must be whole numbers of trading days, got {tuple(intervals)}")
+    intervals = tuple(int(dt) for dt in intervals)
+
+    is_call = option_type == "call"
+    records = [BlackScholesLeland(T, K, S, v, r, q, k, dt) for dt in intervals]
+    bsm = BlackScholes(T, K, S, v, r, q)
+    leland_premiums = [record.call_price if is_call else record.put_price for record in records]
+    bsm_premium = bsm.call_price if is_call else bsm.put_price
+
+    spec = _HedgeSpec(
+        T, K, S, v / 100, r / 100, q / 100, (r if mu is None else mu) / 100, k / 200, is_call, days,
+        intervals * len(STRATEGIES),
+        tuple(record.adjusted_v for record in records) + (v / 100,) * len(intervals),
+        tuple(leland_premiums) + (bsm_premium,) * len(intervals),
+    )
+    root = np.random.SeedSequence(seed)
+    sizes = _chunk_sizes(paths, max(1, chunk_size))
+    seeds = root.spawn(len(sizes))
+
+    start = time.perf_counter()
+    if pool is None and workers == 1:
+        # merged as each chunk finishes, so only one chunk's state is alive at a time
+        merged = None
+        for chunk_seed, size in zip(seeds, sizes):
+            chunk = _simulate_chunk(spec, chunk_seed, size)
+            merged = chunk if merged is None else _merge_chunks(merged, chunk)
+    else:
+        # imported here for the same reason as in monte_carlo_price: `core` re-exports
+        # simulate_hedging, and single-process runs never need concurrent.futures
+        from concurrent.futures import ProcessPoolExecutor
+
+        owns_pool = pool is None
+        if owns_pool:
+            pool = ProcessPoolExecutor(max_workers=workers or None)
+        try:
+            merged = None
+            for chunk in pool.map(_simulate_chunk, [spec] * len(sizes), seeds, sizes):
+                merged = chunk if merged is None else _merge_chunks(merged, chunk)
+        finally:
+            if owns_pool:
+                pool.shutdown()
+    seconds = time.perf_counter() - start
+
+    count, mean, m2, mean_cost, histogram = merged
+    std = np.sqrt(m2 / (count - 1))
+    results = []
+    for row, (dt, premium) in enumerate(zip(spec.intervals, spec.premiums)):
+        results.append(HedgingResult(
+            STRATEGIES[row // len(intervals)], float(dt), -(-days // dt) - 1, float(premium),
+            float(mean[row]), float(std[row]), float(std[row] / math.sqrt(count)),
+            *(_histogram_quantile(histogram[row], fraction, S) for fraction in (0.05, 0.5, 0.95)),
+            float(mean_cost[row]),
+        ))
+    return HedgingReport(results, paths, days, seconds, root.entropy)
+
+
+def format_report(report: HedgingReport) -> str:
+    """
+    One line per writer and interval, with the run's throughput.
+    """
+    lines = [
+        f"{'strategy':<9}{'dt':>5}{'trades':>8}{'premium':>10}{'mean P&L':>11}{'± s.e.':>9}"
+        f"{'std':>9}{'5%':>10}{'median':>9}{'95%':>9}{'costs':>9}"
+    ]
+    for result in report.results:
+        lines.append(
+            f"{result.strategy:<9}{result.dt:>5.0f}{result.rebalances:>8}{result.premium:>10.4f}"
+            f"{result.mean_pnl:>11.4f}{result.standard_error:>9.4f}{result.std_pnl:>9.4f}"
+            f"{result.pnl_5:>10.4f}{result.pnl_50:>9.4f}{result.pnl_95:>9.4f}{result.mean_cost:>9.4f}"
+        )
+    lines.append(
+        f"{report.paths:,} paths x {report.steps} steps in {report.seconds:.1f}s "
+        f"({report.paths_per_second:,.0f} paths/s)"
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate discrete delta hedging against Leland's transaction-cost model.")
+    for name, default in (("T", 1.0), ("K", 100.0), ("S", 100.0), ("v", 20.0), ("r", 5.0), ("q", 0.0), ("k", 1.0)):
+        parser.add_argument(f"--{name}", type=float, default=default)
+    parser.add_argument("--dt", type=float, nargs="+", default=[1, 2, 5, 10, 21], help="rebalancing intervals (trading days)")
+    parser.add_argument("--option-type", default="call", choices=["call", "put"])
+    parser.add_argument("--mu", type=float, help="real-world drift %% (defaults to r)")
+    parser.add_argument("--paths", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    report = simulate_hedging(
+        args.T, args.K, args.S, args.v, args.r, args.q, args.k, args.dt, args.option_type, args.mu,
+        args.paths, args.chunk_size, args.seed, args.workers
+    )
+    print(format_report(report))
+    print(f"seed {report.seed}")
+    if sys.platform.startswith("linux"):
+        import resource
+
+        # ru_maxrss is in kilobytes on Linux
+        print(f"peak memory {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
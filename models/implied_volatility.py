@@ -0,0 +1,127 @@
+import numpy as np
+
+from models.bsm_vectorized import _as_float_arrays, compute_d_values
+from models.normal import norm_cdf, norm_pdf
+
+
+def _is_call(option_type) -> np.ndarray:
+    """
+    Convert 'call'/'put' labels (a single string or an array of them) into a boolean mask.
+    """
+    return np.char.lower(np.asarray(option_type, dtype=str)) == 'call'
+
+
+def _initial_guess(call, spot_discount, strike_discount, T) -> np.ndarray:
+    """
+    Corrado-Miller closed-form approximation of the implied volatility of a call price.
+    Falls back to a moneyness-based guess where the approximation is undefined.
+    """
+    half_gap = (spot_discount - strike_discount) / 2
+    time_value = call - half_gap
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        discriminant = np.maximum(time_value**2 - (2 * half_gap)**2 / np.pi, 0.0)
+        total_vol = np.sqrt(2 * np.pi) / (spot_discount + strike_discount) * (time_value + np.sqrt(discriminant))
+        guess = total_vol / np.sqrt(T)
+
+        # away from the money the approximation can collapse, so use sqrt(2|ln(F/K)| / T) instead
+        fallback = np.sqrt(2 * np.abs(np.log(spot_discount / strike_discount)) / T)
+
+    guess = np.where(np.isfinite(guess) & (guess > 1e-3), guess, fallback)
+    return np.clip(np.where(np.isfinite(guess), guess, 0.2), 1e-3, 5.0)
+
+
+def _solve_call_volatility(call, T, K, S, r, q, iterations: int, tolerance: float) -> tuple:
+    """
+    Newton-Raphson on every element at once, safeguarded by a bisection bracket.
+
+    Returns the volatilities and the number of iterations each element needed (-1 if it did not converge).
+    """
+    spot_discount = S * np.exp(-q * T)
+    strike_discount = K * np.exp(-r * T)
+    sqrt_T = np.sqrt(T)
+
+    vol = _initial_guess(call, spot_discount, strike_discount, T)
+    lower = np.zeros_like(vol)
+    upper = np.full_like(vol, 10.0)
+    steps = np.full(vol.shape, -1)
+
+    # quotes outside the no-arbitrage bounds have no implied volatility
+    intrinsic = np.maximum(spot_discount - strike_discount, 0.0)
+    active = (call > intrinsic) & (call < spot_discount) & (T > 0)
+
+    for iteration in range(iterations):
+        if not active.any():
+            break
+
+        index = np.flatnonzero(active)
+        sigma = vol[index]
+
+        d1, d2 = compute_d_values(T[index], K[index], S[index], sigma, r[index], q[index])
+        price = spot_discount[index] * norm_cdf(d1) - strike_discount[index] * norm_cdf(d2)
+        vega = spot_discount[index] * norm_pdf(d1) * sqrt_T[index]
+        diff = price - call[index]
+
+        # check for convergence
+        converged = np.abs(diff) < tolerance
+        steps[index[converged]] = iteration
+
+        # price is increasing in volatility, so the sign of diff tightens the bracket
+        upper[index] = np.where(diff > 0, sigma, upper[index])
+        lower[index] = np.where(diff < 0, sigma, lower[index])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = sigma - diff / vega
+
+        # fall back to bisection where vega collapses or Newton leaves the bracket
+        bisect = 0.5 * (lower[index] + upper[index])
+        use_newton = np.isfinite(newton) & (newton > lower[index]) & (newton < upper[index])
+        vol[index] = np.where(converged, sigma, np.where(use_newton, newton, bisect))
+
+        active[index[converged]] = False
+
+    return np.where(steps >= 0, vol, np.nan), steps
+
+
+def implied_volatility_batch(option_type, market_price, T, K, S, r, q, k=None, dt=None, iterations: int = 100, tolerance: float = 1e-5) -> np.ndarray:
+    """
+    Invert a whole chain of market prices (calls and puts mixed) into implied volatilities at once.
+
+    Parameters follow BlackScholes / BlackScholesLeland and broadcast against each other:
+    - option_type: 'call' or 'put', or an array of them
+    - market_price: Observed option prices
+    - T: Time to maturity (in years)
+    - K: Strike price
+    - S: Spot price
+    - r: Risk-free interest rate (as a percentage)
+    - q: Dividend yield (as a percentage)
+    - k: Roundtrip transaction cost rate (as a percentage), Leland's model only
+    - dt: Time between hedging adjustments (in trading days), Leland's model only
+
+    Returns volatilities as decimals like the scalar implied_volatility methods, in the broadcast
+    shape of the inputs (a scalar for scalar inputs), with NaN where a quote breaks the
+    no-arbitrage bounds or does not converge.
+    """
+    is_call = _is_call(option_type)
+    is_call, market_price, T, K, S, r, q = _as_float_arrays(is_call, market_price, T, K, S, r, q)
+    is_call = is_call.astype(bool)
+    r, q = r / 100, q / 100 # convert percent to decimal
+
+    # put-call parity turns every quote into a call price, so a single pricing formula is solved
+    parity = S * np.exp(-q * T) - K * np.exp(-r * T)
+    call = np.where(is_call, market_price, market_price + parity)
+
+    # the solver indexes flat arrays, so solve the broadcast book flattened and restore its shape
+    shape = call.shape
+    vol, _ = _solve_call_volatility(*(np.ravel(value) for value in (call, T, K, S, r, q)), iterations, tolerance)
+    vol = vol.reshape(shape)
+
+    if k is None or dt is None:
+        return vol[()]
+
+    # leland's price is the BSM price at v_adj where v_adj^2 = v^2 + c*v, so invert that quadratic
+    k, dt, vol = _as_float_arrays(k, dt, vol)
+    k, dt = k / 100, dt / 252
+    with np.errstate(divide='ignore', invalid='ignore'):
+        c = np.sqrt(2 / np.pi) * k / np.sqrt(dt)
+        return ((-c + np.sqrt(c**2 + 4 * vol**2)) / 2)[()]
@@ -0,0 +1,270 @@
+"""
+Monte Carlo pricing under geometric Brownian motion, for validating the closed forms and for
+path-dependent payoffs.
+
+Paths are simulated in fixed-size chunks. Only the current log-price and the running statistics
+the payoff needs (average, extremes, barrier status) are kept, so memory is bounded by the chunk
+size whatever the number of steps. Each chunk draws from its own child of one
+numpy.random.SeedSequence and returns its sample moments. The moments are merged in chunk order,
+so a seed gives bit-identical results serially or with any number of worker processes.
+"""
+import math
+import os
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from models.bsm_model import BlackScholes
+
+PAYOFFS = ("european", "asian", "lookback", "up-and-out", "down-and-out")
+DEFAULT_CHUNK_SIZE = 100_000
+TRADING_DAYS = 252
+
+
+class MonteCarloResult(NamedTuple):
+    """
+    Discounted price estimate with its standard error and the cost of producing it.
+    """
+    price: float
+    standard_error: float
+    paths: int
+    steps: int
+    seconds: float
+    seed: int               # SeedSequence entropy: pass it back as seed to reproduce the run
+    control_beta: float     # control-variate coefficient (0 when the control is off)
+
+    @property
+    def paths_per_second(self) -> float:
+        return self.paths / self.seconds if self.seconds > 0 else float('inf')
+
+    def confidence_interval(self, z: float = 1.96) -> tuple:
+        return self.price - z * self.standard_error, self.price + z * self.standard_error
+
+
+class _PathSpec(NamedTuple):
+    # one simulation's parameters, in decimals and years, shipped to the worker processes
+    T: float
+    K: float
+    S: float
+    v: float
+    r: float
+    q: float
+    is_call: bool
+    payoff: str
+    barrier: float
+    steps: int
+    antithetic: bool
+    control_variate: bool
+
+
+def _payoff(spec: _PathSpec, terminal, average, maximum, minimum, alive) -> np.ndarray:
+    """
+    Undiscounted payoff from the terminal price and the running path statistics.
+    """
+    K = spec.K
+    if spec.payoff == "asian":
+        # arithmetic average over the monitoring dates, fixed strike
+        underlying = average
+    elif spec.payoff == "lookback":
+        # fixed strike: the best price the holder could have exercised at
+        underlying = maximum if spec.is_call else minimum
+    else:
+        underlying = terminal
+
+    value = np.maximum(underlying - K, 0.0) if spec.is_call else np.maximum(K - underlying, 0.0)
+    if alive is not None:
+        value = np.where(alive, value, 0.0)
+    return value
+
+
+def _simulate_chunk(spec: _PathSpec, seed: "np.random.SeedSequence", paths: int) -> np.ndarray:
+    """
+    Simulates one chunk and returns its sample moments [count, mean_y, mean_x, m_yy, m_xx, m_xy],
+    where y is the discounted payoff, x the control and m_* the centered (co)moment sums.
+    With antithetic variates a sample is the average over a path and its mirror, so count = paths / 2.
+    """
+    rng = np.random.default_rng(seed)
+    samples = paths // 2 if spec.antithetic else paths
+    signs = np.array([1.0, -1.0])[:, None] if spec.antithetic else np.ones((1, 1))
+
+    step = spec.T / spec.steps
+    drift = (spec.r - spec.q - 0.5 * spec.v**2) * step
+    diffusion = spec.v * math.sqrt(step)
+
+    log_price = np.full((len(signs), samples), math.log(spec.S))
+    path_dependent = spec.payoff != "european"
+    total = np.zeros_like(log_price) if spec.payoff == "asian" else None
+    maximum = np.full_like(log_price, spec.S) if spec.payoff == "lookback" else None
+    minimum = np.full_like(log_price, spec.S) if spec.payoff == "lookback" else None
+    alive = None
+    if spec.payoff == "up-and-out":
+        alive = np.full(log_price.shape, spec.S < spec.barrier)
+    elif spec.payoff == "down-and-out":
+        alive = np.full(log_price.shape, spec.S > spec.barrier)
+
+    for _ in range(spec.steps):
+        log_price += drift + diffusion * (signs * rng.standard_normal(samples))
+        if not path_dependent:
+            continue
+
+        price = np.exp(log_price)
+        if total is not None:
+            total += price
+        if maximum is not None:
+            np.maximum(maximum, price, out=maximum)
+            np.minimum(minimum, price, out=minimum)
+        if spec.payoff == "up-and-out":
+            alive &= price < spec.barrier
+        elif spec.payoff == "down-and-out":
+            alive &= price > spec.barrier
+
+    terminal = np.exp(log_price)
+    average = total / spec.steps if total is not None else None
+    rate_discount = math.exp(-spec.r * spec.T)
+
+    y = (rate_discount * _payoff(spec, terminal, average, maximum, minimum, alive)).mean(axis=0)
+    if not spec.control_variate:
+        x = np.zeros_like(y)
+    elif path_dependent:
+        # the European option on the same path, whose expectation is the closed-form BSM price
+        x = rate_discount * _payoff(spec._replace(payoff="european"), terminal, None, None, None, None)
+        x = x.mean(axis=0)
+    else:
+        # the European option is itself the BSM price, so use the discounted underlying (expectation S e^-qT)
+        x = (rate_discount * terminal).mean(axis=0)
+
+    mean_y, mean_x = y.mean(), x.mean()
+    y_centered, x_centered = y - mean_y, x - mean_x
+    return np.array([
+        samples, mean_y, mean_x,
+        y_centered @ y_centered, x_centered @ x_centered, y_centered @ x_centered
+    ])
+
+
+def _merge_moments(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Combines the moments of two disjoint sample sets (Chan et al.'s pairwise update).
+    """
+    n_a, n_b = a[0], b[0]
+    n = n_a + n_b
+    delta_y, delta_x = b[1] - a[1], b[2] - a[2]
+    weight = n_a * n_b / n
+    return np.array([
+        n,
+        a[1] + delta_y * n_b / n,
+        a[2] + delta_x * n_b / n,
+        a[3] + b[3] + delta_y * delta_y * weight,
+        a[4] + b[4] + delta_x * delta_x * weight,
+        a[5] + b[5] + delta_y * delta_x * weight,
+    ])
+
+
+def _control_expectation(spec: _PathSpec) -> float:
+    """
+    Exact expectation of the control used by _simulate_chunk.
+    """
+    if spec.payoff == "european":
+        return spec.S * math.exp(-spec.q * spec.T)
+    record = BlackScholes(spec.T, spec.K, spec.S, spec.v * 100, spec.r * 100, spec.q * 100)
+    return record.call_price if spec.is_call else record.put_price
+
+
+def _chunk_sizes(paths: int, chunk_size: int) -> list:
+    full, remainder = divmod(paths, chunk_size)
+    return [chunk_size] * full + ([remainder] if remainder else [])
+
+
+def monte_carlo_price(
+    T: float, K: float, S: float, v: float, r: float, q: float,
+    option_type: str = "call",
+    payoff: str = "european",
+    barrier: float = None,
+    paths: int = 1_000_000,
+    steps: int = None,
+    antithetic: bool = True,
+    control_variate: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = None,
+    workers: int = 1,
+    pool=None,
+) -> MonteCarloResult:
+    """
+    Monte Carlo price of an option on a GBM underlying, with its standard error.
+
+    Parameters follow BlackScholes (v, r, q as percentages); in addition:
+    - option_type: 'call' or 'put'
+    - payoff: one of PAYOFFS. 'asian' is the fixed-strike arithmetic average over the steps,
+      'lookback' the fixed-strike lookback, and the knock-out barriers pay the European
+      payoff unless the price crosses barrier on a monitoring date (discrete monitoring)
+    - paths: number of simulated paths (rounded up to even with antithetic variates)
+    - steps: monitoring dates; European payoffs are sampled exactly in one step, the others
+      default to one step per trading day
+    - antithetic: pair every path with its mirror image (-Z)
+    - control_variate: regress on a control with a known expectation: the closed-form BSM
+      price of the matching European option for path-dependent payoffs, the discounted
+      underlying for the European payoff itself
+    - chunk_size: paths simulated at once; memory is O(chunk_size), independent of steps
+    - seed: seed of the SeedSequence the per-chunk streams are spawned from (None for fresh entropy)
+    - workers, pool: run the chunks on a process pool (a caller-owned ProcessPoolExecutor is reused and left running);
+      the result for a given seed does not depend on the number of workers
+    """
+    option_type = option_type.lower()
+    if option_type not in ("call", "put"):
+        raise ValueError(f"option_type must be 'call' or 'put', got {option_type!r}")
+    if payoff not in PAYOFFS:
+        raise ValueError(f"payoff must be one of {PAYOFFS}, got {payoff!r}")
+    if payoff.endswith("-out") and barrier is None:
+        raise ValueError(f"a {payoff} payoff needs a barrier")
+    if T <= 0 or v <= 0 or paths < 2:
+        raise ValueError("T and v must be positive and at least two paths are needed")
+
+    if payoff == "european":
+        steps = 1
+    elif steps is None:
+        steps = max(1, round(T * TRADING_DAYS))
+    # antithetic samples come in pairs, so every chunk holds an even number of paths
+    pair = 2 if antithetic else 1
+    paths = -(-paths // pair) * pair
+    chunk_size = max(pair, chunk_size // pair * pair)
+
+    spec = _PathSpec(
+        T, K, S, v / 100, r / 100, q / 100, option_type == "call", payoff,
+        float(barrier) if barrier is not None else float('nan'), steps, antithetic, control_variate
+    )
+    root = np.random.SeedSequence(seed)
+    sizes = _chunk_sizes(paths, chunk_size)
+    seeds = root.spawn(len(sizes))
+
+    start = time.perf_counter()
+    if pool is None and workers == 1:
+        chunk_moments = [_simulate_chunk(spec, chunk_seed, size) for chunk_seed, size in zip(seeds, sizes)]
+    else:
+        # imported on first use: `core` re-exports monte_carlo_price, so a module-level import
+        # would load concurrent.futures on every `import core`, single-process callers included
+        from concurrent.futures import ProcessPoolExecutor
+
+        owns_pool = pool is None
+        if owns_pool:
+            pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        try:
+            chunk_moments = list(pool.map(_simulate_chunk, [spec] * len(sizes), seeds, sizes))
+        finally:
+            if owns_pool:
+                pool.shutdown()
+
+    # merged in chunk order whoever simulated them, so the sums round identically for every worker count
+    moments = chunk_moments[0]
+    for chunk in chunk_moments[1:]:
+        moments = _merge_moments(moments, chunk)
+    seconds = time.perf_counter() - start
+
+    n, mean_y, mean_x, m_yy, m_xx, m_xy = moments
+    beta = m_xy / m_xx if control_variate and m_xx > 0 else 0.0
+    price = mean_y - beta * (mean_x - _control_expectation(spec)) if beta else mean_y
+    # residual variance of y after removing the part explained by the control
+    variance = max(m_yy - beta * m_xy, 0.0) / (n - 1)
+
+    return MonteCarloResult(
+        float(price), math.sqrt(variance / n), paths, steps, seconds, root.entropy, float(beta)
+    )
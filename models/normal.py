@@ -0,0 +1,45 @@
+"""
+Standard normal CDF/PDF kernels for the pricing models.
+
+scipy.stats.norm.cdf/pdf spend tens of microseconds per call on argument checking, which
+dominates scalar pricing. These kernels skip that layer:
+- Python/NumPy scalars go through math.erfc/math.exp, which cost well under a microsecond.
+- Arrays go through scipy.special.ndtr (the ufunc scipy.stats.norm.cdf wraps) and np.exp.
+  scipy.special takes ~0.2 s to import, so it is only loaded by the first array call.
+
+Both paths are erfc-based, so the CDF keeps full relative precision in the lower tail.
+Against scipy.stats.norm the absolute error is below 1e-15 for the CDF and 1e-16 for the PDF
+over x in [-40, 40] (checked by benchmarks/bench_normal.py).
+"""
+import functools
+import math
+
+import numpy as np
+
+INV_SQRT_2 = 1 / math.sqrt(2)
+INV_SQRT_2PI = 1 / math.sqrt(2 * math.pi)
+
+
+@functools.cache
+def _ndtr():
+    from scipy.special import ndtr
+
+    return ndtr
+
+
+def norm_cdf(x):
+    """
+    Standard normal cumulative distribution function for a scalar or an array.
+    """
+    if isinstance(x, float):
+        return 0.5 * math.erfc(-x * INV_SQRT_2)
+    return _ndtr()(x)
+
+
+def norm_pdf(x):
+    """
+    Standard normal probability density function for a scalar or an array.
+    """
+    if isinstance(x, float):
+        return math.exp(-0.5 * x * x) * INV_SQRT_2PI
+    return np.exp(-0.5 * np.square(x)) * INV_SQRT_2PI
@@ -0,0 +1,64 @@
+_UNSET = object()
+
+
+class lazy_slot:
+    """
+    Read-only attribute computed on first access and stored in the instance's "_<name>" slot.
+
+    Works with __slots__ classes (no instance __dict__ needed). Two threads may both compute a
+    missing value, but they store the same result, so sharing a record between sessions is safe.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.slot = "_" + func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot, _UNSET)
+        if value is _UNSET:
+            value = self.func(instance)
+            object.__setattr__(instance, self.slot, value)
+        return value
+
+
+class FrozenRecord:
+    """
+    Base for compact immutable parameter records.
+
+    Subclasses list their fields and the "_<name>" slots of their lazy_slot attributes in __slots__,
+    and set fields in __init__ with object.__setattr__; assigning afterwards raises AttributeError.
+    """
+    __slots__ = ()
+    _field_names = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # public slots are the fields; "_"-prefixed ones hold lazily computed values
+        cls._field_names = tuple(name for name in cls.__dict__.get("__slots__", ()) if not name.startswith("_"))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable; build a new record instead")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable; build a new record instead")
+
+    def _copy(self, **changes):
+        """
+        A new record with the same fields (already in model units) and the given slots replaced.
+        Lazily computed values are not carried over unless passed in changes.
+        """
+        record = object.__new__(type(self))
+        for name in self._field_names:
+            object.__setattr__(record, name, getattr(self, name))
+        for name, value in changes.items():
+            object.__setattr__(record, name, value)
+        return record
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self._field_names}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
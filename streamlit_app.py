@@ -1,5 +1,10 @@
 import streamlit as st
 
+from functions.prewarm import start_prewarm
+
+# fill the caches for the default inputs in the background; starts once per server process and never blocks
+start_prewarm()
+
 # Page Setup
 
 about_page = st.Page(
@@ -0,0 +1,17 @@
+import pandas as pd
+import pyarrow.parquet as pq
+
+from core.batch import main
+
+
+def test_integer_chunk_followed_by_fractional_chunk(tmp_path):
+    # the first chunk reads back as int64 columns, the second has a fractional strike (float64)
+    rows = ["T,K,S,v,r,q"] + ["1,100,100,20,5,0"] * 4 + ["1,100.5,100,20,5,0"] * 4
+    source = tmp_path / "contracts.csv"
+    source.write_text("\n".join(rows) + "\n")
+
+    for output in (tmp_path / "priced.csv", tmp_path / "priced.parquet"):
+        assert main([str(source), str(output), "--chunk-size", "4"]) == 0
+        priced = pq.read_table(output).to_pandas() if output.suffix == ".parquet" else pd.read_csv(output)
+        assert priced["K"].tolist() == [100.0] * 4 + [100.5] * 4
+        assert priced["call_price"].notna().all()
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from models.bsm_leland_model import BlackScholesLeland
+from models.bsm_leland_vectorized import batch_leland
+
+rng = np.random.default_rng(1)
+N = 200
+T = rng.uniform(0.05, 2.0, N)
+K = rng.uniform(80.0, 160.0, N)
+S = 120.0
+v = rng.uniform(10.0, 50.0, N)
+r = rng.uniform(0.0, 8.0, N)
+q = rng.uniform(0.0, 3.0, N)
+k = rng.uniform(0.0, 2.0, N)
+dt = rng.uniform(1.0, 21.0, N)
+
+
+def _expected(record: BlackScholesLeland) -> dict:
+    return {
+        "call_price": record.call_price,
+        "put_price": record.put_price,
+        "vega": record.vega(),
+        "gamma": record.gamma(),
+        "call_delta": record.delta()[0],
+        "put_delta": record.delta()[1],
+        "call_theta": record.theta()[0],
+        "put_theta": record.theta()[1],
+        "call_rho": record.rho()[0],
+        "put_rho": record.rho()[1],
+        "adjusted_v": record.adjusted_v,
+    }
+
+
+def test_batch_leland_matches_the_records():
+    result = batch_leland(T, K, S, v, r, q, k, dt)
+    expected = [_expected(BlackScholesLeland(T[i], K[i], S, v[i], r[i], q[i], k[i], dt[i])) for i in range(N)]
+    for field in result._fields:
+        values = [row[field] for row in expected]
+        np.testing.assert_allclose(getattr(result, field), values, rtol=1e-10, atol=1e-12, err_msg=field)
+
+
+def test_scalar_inputs_give_numpy_scalars():
+    result = batch_leland(1.0, 100.0, S, 20.0, 5.0, 1.0, 1.0, 5.0)
+    assert all(isinstance(value, np.float64) for value in result)
+
+    expected = _expected(BlackScholesLeland(1.0, 100.0, S, 20.0, 5.0, 1.0, 1.0, 5.0))
+    for field, value in expected.items():
+        assert getattr(result, field) == pytest.approx(value, rel=1e-12), field
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_non_positive_volatility():
+    result = batch_leland(1.0, 100.0, S, np.array([0.0, -5.0, 20.0]), 5.0, 0.0, 1.0, 5.0)
+    # no volatility means no defined price, and vega is zero like BlackScholesLeland.vega
+    assert np.isnan(result.call_price[:2]).all() and np.isnan(result.put_price[:2]).all()
+    np.testing.assert_array_equal(result.vega[:2], 0.0)
+    assert result.vega[2] > 0
+
+    record = BlackScholesLeland(1.0, 100.0, S, 0.0, 5.0, 0.0, 1.0, 5.0)
+    assert record.vega() == 0.0 and np.isnan(record.call_price)
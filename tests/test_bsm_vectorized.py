@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from models.bsm_model import BlackScholes
+from models.bsm_vectorized import batch_greeks, batch_prices
+
+rng = np.random.default_rng(0)
+N = 200
+T = rng.uniform(0.05, 2.0, N)
+K = rng.uniform(80.0, 160.0, N)
+S = 120.0
+v = rng.uniform(10.0, 50.0, N)
+r = rng.uniform(0.0, 8.0, N)
+q = rng.uniform(0.0, 3.0, N)
+
+
+def _records():
+    return [BlackScholes(T[i], K[i], S, v[i], r[i], q[i]) for i in range(N)]
+
+
+def test_batch_prices_match_the_records():
+    call, put = batch_prices(T, K, S, v, r, q)
+    expected = np.array([record.calculate_prices() for record in _records()])
+    np.testing.assert_allclose(call, expected[:, 0], rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(put, expected[:, 1], rtol=1e-12, atol=1e-12)
+
+
+def test_batch_greeks_match_the_records():
+    greeks = batch_greeks(T, K, S, v, r, q)
+    records = _records()
+    expected = {
+        "call_price": [record.call_price for record in records],
+        "put_price": [record.put_price for record in records],
+        "vega": [record.vega() for record in records],
+        "gamma": [record.gamma() for record in records],
+        "call_delta": [record.delta()[0] for record in records],
+        "put_delta": [record.delta()[1] for record in records],
+        "call_theta": [record.theta()[0] for record in records],
+        "put_theta": [record.theta()[1] for record in records],
+        "call_rho": [record.rho()[0] for record in records],
+        "put_rho": [record.rho()[1] for record in records],
+    }
+    for field, values in expected.items():
+        np.testing.assert_allclose(getattr(greeks, field), values, rtol=1e-10, atol=1e-12, err_msg=field)
+
+
+def test_inputs_broadcast_and_scalars_stay_scalar():
+    call, put = batch_prices(np.array([[0.5], [1.0]]), np.array([90.0, 100.0, 110.0]), S, 20.0, 5.0, 0.0)
+    assert call.shape == put.shape == (2, 3)
+
+    greeks = batch_greeks(1.0, 100.0, S, 20.0, 5.0, 1.0)
+    record = BlackScholes(1.0, 100.0, S, 20.0, 5.0, 1.0)
+    assert all(np.ndim(value) == 0 for value in greeks)
+    assert greeks.call_price == pytest.approx(record.call_price, rel=1e-12)
+
+
+def test_non_positive_volatility_gives_nan_prices():
+    call, put = batch_prices(1.0, 100.0, S, np.array([0.0, -5.0]), 5.0, 0.0)
+    assert np.isnan(call).all() and np.isnan(put).all()
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from core.cache import bounded_cache
+from core.computations import get_greeks_by_model
+
+
+def test_cached_array_cannot_be_modified_by_a_caller():
+    @bounded_cache("test_array")
+    def grid(n):
+        return np.arange(n, dtype=float), {"total": np.full(2, float(n))}
+
+    values, extras = grid(3)
+    with pytest.raises(ValueError):
+        values[0] = 99.0
+    with pytest.raises(ValueError):
+        extras["total"] += 1
+    with pytest.raises(TypeError):
+        extras["total"] = None
+
+    values, extras = grid(3)
+    assert grid.cache.stats()["hits"] == 1
+    assert values.tolist() == [0.0, 1.0, 2.0]
+    assert extras["total"].tolist() == [3.0, 3.0]
+
+
+def test_cached_greeks_are_shared_read_only():
+    inputs = (1.0, 100.0, 120.0, 20.0, 5.0, 0.0, 1.0, 5.0)
+    greeks_by_model = get_greeks_by_model(*inputs)
+    original = greeks_by_model["Black-Scholes"]
+    with pytest.raises(TypeError):
+        greeks_by_model["Black-Scholes"] = greeks_by_model["Leland's Model"]
+
+    assert get_greeks_by_model(*inputs)["Black-Scholes"] == original
+
+
+def test_caching_leaves_the_function_array_writeable():
+    table = np.arange(3, dtype=float)
+
+    @bounded_cache("test_shared_array")
+    def lookup():
+        return table
+
+    cached = lookup()
+    with pytest.raises(ValueError):
+        cached[0] = 99.0
+
+    table[0] = 99.0
+    assert table.flags.writeable
+    assert lookup()[0] == 99.0
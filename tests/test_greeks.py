@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from models.bsm_leland_model import BlackScholesLeland
+from models.bsm_model import BlackScholes
+from models.greeks import compute_all_greeks, compute_greeks_by_model
+
+INPUTS = (1.0, 100.0, 120.0, 20.0, 5.0, 1.0)
+COSTS = (1.0, 5.0)
+
+
+def _scalar_greeks(record) -> dict:
+    (call_delta, put_delta), (call_theta, put_theta), (call_rho, put_rho) = record.delta(), record.theta(), record.rho()
+    return dict(
+        call_price=record.call_price, put_price=record.put_price, vega=record.vega(), gamma=record.gamma(),
+        call_delta=call_delta, put_delta=put_delta, call_theta=call_theta, put_theta=put_theta,
+        call_rho=call_rho, put_rho=put_rho,
+    )
+
+
+@pytest.mark.parametrize("model_type, record", [
+    ("Black-Scholes", BlackScholes(*INPUTS)),
+    ("Leland's Model", BlackScholesLeland(*INPUTS, *COSTS)),
+])
+def test_compute_all_greeks_matches_the_scalar_greeks(model_type, record):
+    greeks = compute_all_greeks(*INPUTS, *COSTS, model_type=model_type)
+    for field, value in _scalar_greeks(record).items():
+        assert isinstance(getattr(greeks, field), np.float64), field
+        assert getattr(greeks, field) == pytest.approx(value, rel=1e-12), field
+
+
+def test_compute_all_greeks_accepts_arrays():
+    strikes = np.array([90.0, 100.0, 110.0])
+    greeks = compute_all_greeks(1.0, strikes, 120.0, 20.0, 5.0, 1.0)
+    expected = [BlackScholes(1.0, strike, 120.0, 20.0, 5.0, 1.0).delta()[0] for strike in strikes]
+    np.testing.assert_allclose(greeks.call_delta, expected, rtol=1e-12)
+
+
+def test_compute_greeks_by_model():
+    both = compute_greeks_by_model(*INPUTS, *COSTS)
+    assert set(both) == {"Black-Scholes", "Leland's Model"}
+    for model_type, greeks in both.items():
+        single = compute_all_greeks(*INPUTS, *COSTS, model_type=model_type)
+        for field in greeks._fields:
+            assert getattr(greeks, field) == pytest.approx(getattr(single, field), rel=1e-12), (model_type, field)
+
+    # without a hedging interval Leland's model is undefined, so only Black-Scholes is returned
+    assert set(compute_greeks_by_model(*INPUTS, 1.0, 0.0)) == {"Black-Scholes"}
@@ -0,0 +1,38 @@
+import pytest
+
+from models.hedging import STRATEGIES, simulate_hedging
+
+INPUTS = dict(T=1.0, K=100.0, S=100.0, v=20.0, r=5.0, q=0.0, k=1.0)
+INTERVALS = (1, 5)
+SEED = 7
+
+
+@pytest.fixture(scope="module")
+def report():
+    return simulate_hedging(**INPUTS, intervals=INTERVALS, paths=10_000, chunk_size=2_500, seed=SEED)
+
+
+def test_one_result_per_strategy_and_interval(report):
+    assert [(result.strategy, result.dt) for result in report.results] == [
+        (strategy, float(dt)) for strategy in STRATEGIES for dt in INTERVALS
+    ]
+
+
+def test_leland_writer_breaks_even(report):
+    for result in report.results:
+        if result.strategy == "leland":
+            # the Leland premium covers the costs, so the P&L averages to about zero (within 1% of the premium)
+            assert abs(result.mean_pnl) < 0.01 * result.premium, result
+            assert result.mean_cost > 0
+
+
+def test_bsm_writer_loses_about_its_costs(report):
+    for result in report.results:
+        if result.strategy == "bsm":
+            assert result.mean_pnl < 0
+            assert result.mean_pnl == pytest.approx(-result.mean_cost, rel=0.1), result
+
+
+def test_seed_reproduces_on_two_workers(report):
+    parallel = simulate_hedging(**INPUTS, intervals=INTERVALS, paths=10_000, chunk_size=2_500, seed=SEED, workers=2)
+    assert [result.mean_pnl for result in parallel.results] == [result.mean_pnl for result in report.results]
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from models.bsm_leland_model import BlackScholesLeland
+from models.bsm_model import BlackScholes
+from models.contracts import OptionContracts
+from models.implied_volatility import implied_volatility_batch
+
+S, r, q, k, dt = 120.0, 5.0, 1.0, 1.0, 5.0
+STRIKES = np.array([[90.0, 110.0, 130.0], [100.0, 120.0, 140.0]])
+MATURITIES = np.array([[0.5], [1.5]])
+VOLATILITY = 25.0
+
+
+def _quotes(option_type: str, leland: bool) -> np.ndarray:
+    index = 0 if option_type == "call" else 1
+    prices = np.empty(STRIKES.shape)
+    for position in np.ndindex(STRIKES.shape):
+        args = (MATURITIES[position[0], 0], STRIKES[position], S, VOLATILITY, r, q)
+        record = BlackScholesLeland(*args, k, dt) if leland else BlackScholes(*args)
+        prices[position] = record.calculate_prices()[index]
+    return prices
+
+
+def _scalar_volatility(option_type, price, T, K, leland: bool) -> float:
+    # the scalar solvers start from the record's volatility, so start them away from the answer
+    record = BlackScholesLeland(T, K, S, 20.0, r, q, k, dt) if leland else BlackScholes(T, K, S, 20.0, r, q)
+    return record.implied_volatility(option_type, price)
+
+
+@pytest.mark.parametrize("leland", [False, True])
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_matches_the_scalar_solvers_for_scalar_1d_and_2d_inputs(option_type, leland):
+    prices = _quotes(option_type, leland)
+    T = np.broadcast_to(MATURITIES, STRIKES.shape)
+    cost = dict(k=k, dt=dt) if leland else {}
+    expected = np.vectorize(lambda price, T, K: _scalar_volatility(option_type, price, T, K, leland))(prices, T, STRIKES)
+
+    scalar = implied_volatility_batch(option_type, prices[0, 1], T[0, 1], STRIKES[0, 1], S, r, q, **cost)
+    assert np.ndim(scalar) == 0
+    np.testing.assert_allclose(scalar, expected[0, 1], atol=1e-4)
+
+    flat = implied_volatility_batch(option_type, prices[1], T[1], STRIKES[1], S, r, q, **cost)
+    np.testing.assert_allclose(flat, expected[1], atol=1e-4)
+
+    grid = implied_volatility_batch(option_type, prices, MATURITIES, STRIKES, S, r, q, **cost)
+    assert grid.shape == STRIKES.shape
+    np.testing.assert_allclose(grid, expected, atol=1e-4)
+    np.testing.assert_allclose(grid, VOLATILITY / 100, atol=1e-4)
+
+
+def test_book_of_scalar_contracts():
+    price = BlackScholes(1.0, 100.0, S, VOLATILITY, r, q).call_price
+    book = OptionContracts(1.0, 100.0, S, VOLATILITY, r, q)
+    assert book.implied_volatility("call", price) == pytest.approx(VOLATILITY / 100, abs=1e-4)
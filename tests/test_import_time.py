@@ -0,0 +1,14 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_entry_points_do_not_eagerly_import_heavy_packages():
+    # a fresh interpreter, since this test session has already imported numpy, scipy and friends
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.import_time", "--check"],
+        cwd=ROOT, env={**os.environ, "BSM_PREWARM": "0", "MPLBACKEND": "Agg"}, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
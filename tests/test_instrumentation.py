@@ -0,0 +1,35 @@
+from core.cache import bounded_cache
+from core.instrumentation import current_rerun, discard_rerun, start_rerun, timed
+from functions import helper
+
+
+@bounded_cache("test_instrumented")
+def _square(x):
+    return x * x
+
+
+def test_rerun_cut_short_stops_recording_once_instrumentation_is_off(monkeypatch):
+    # a rerun with instrumentation on that never reaches finish_rerun() (e.g. a RerunException)
+    monkeypatch.setattr(helper.st, "session_state", {"instrumentation": True})
+    helper.start_instrumentation("test")
+    stale = current_rerun()
+    with timed("tab", "tab"):
+        _square(2)
+    assert len(stale.events) == 2
+
+    # the next rerun on the same thread, with the toggle off, must not keep appending to it
+    monkeypatch.setattr(helper.st, "session_state", {"instrumentation": False})
+    helper.start_instrumentation("test")
+    assert current_rerun() is None
+    with timed("tab", "tab"):
+        _square(3)
+    assert len(stale.events) == 2
+
+
+def test_new_rerun_replaces_an_unfinished_one():
+    stale = start_rerun(page="test")
+    fresh = start_rerun(page="test")
+    with timed("block"):
+        pass
+    assert current_rerun() is fresh and not stale.events and len(fresh.events) == 1
+    discard_rerun()
@@ -0,0 +1,46 @@
+import pytest
+
+from models.bsm_model import BlackScholes
+from models.monte_carlo import monte_carlo_price
+
+INPUTS = dict(T=1.0, K=100.0, S=120.0, v=20.0, r=5.0, q=2.0)
+Z_LIMIT = 4.0
+SEED = 2024
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+@pytest.mark.parametrize("antithetic, control_variate", [(False, False), (True, False), (True, True)])
+def test_european_price_within_a_few_standard_errors_of_the_closed_form(option_type, antithetic, control_variate):
+    record = BlackScholes(**INPUTS)
+    exact = record.call_price if option_type == "call" else record.put_price
+    result = monte_carlo_price(
+        **INPUTS, option_type=option_type, paths=200_000,
+        antithetic=antithetic, control_variate=control_variate, seed=SEED,
+    )
+    assert result.standard_error > 0
+    assert abs(result.price - exact) <= Z_LIMIT * result.standard_error
+
+
+def test_seed_reproduces_exactly_serially_and_on_two_workers():
+    options = dict(**INPUTS, option_type="put", payoff="asian", steps=20, paths=40_000, chunk_size=5_000, seed=SEED)
+    serial = monte_carlo_price(**options, workers=1)
+    again = monte_carlo_price(**options, workers=1)
+    parallel = monte_carlo_price(**options, workers=2)
+
+    assert (serial.price, serial.standard_error) == (again.price, again.standard_error)
+    assert (serial.price, serial.standard_error) == (parallel.price, parallel.standard_error)
+    assert serial.seed == SEED
+
+
+def test_knock_out_is_worth_less_than_the_european_option():
+    options = dict(**INPUTS, steps=50, paths=40_000, seed=SEED)
+    european = monte_carlo_price(**options, payoff="european").price
+    up_and_out = monte_carlo_price(**options, payoff="up-and-out", barrier=160.0).price
+    assert 0 < up_and_out < european
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        monte_carlo_price(**INPUTS, payoff="up-and-out")
+    with pytest.raises(ValueError):
+        monte_carlo_price(**INPUTS, option_type="straddle")
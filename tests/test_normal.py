@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from models.normal import norm_cdf, norm_pdf
+
+# documented error bounds of the kernels against scipy.stats.norm
+CDF_TOLERANCE = 1e-15
+PDF_TOLERANCE = 1e-16
+
+GRID = np.concatenate([np.linspace(-40, 40, 200_001), np.random.default_rng(0).normal(0, 3, 100_000)])
+SAMPLE = GRID[::97]
+
+
+@pytest.mark.parametrize("kernel, reference, tolerance", [(norm_cdf, norm.cdf, CDF_TOLERANCE), (norm_pdf, norm.pdf, PDF_TOLERANCE)])
+def test_array_accuracy(kernel, reference, tolerance):
+    assert np.max(np.abs(kernel(GRID) - reference(GRID))) <= tolerance
+
+
+@pytest.mark.parametrize("kernel, reference, tolerance", [(norm_cdf, norm.cdf, CDF_TOLERANCE), (norm_pdf, norm.pdf, PDF_TOLERANCE)])
+def test_scalar_accuracy(kernel, reference, tolerance):
+    assert max(abs(kernel(float(value)) - reference(value)) for value in SAMPLE) <= tolerance
+
+
+@pytest.mark.parametrize("value", [float('nan'), float('inf'), -float('inf')])
+def test_nan_propagates_and_tails_saturate(value):
+    assert np.array_equal(norm_cdf(value), norm.cdf(value), equal_nan=True)
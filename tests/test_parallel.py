@@ -0,0 +1,16 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.parallel import parallel_greeks
+from models.bsm_vectorized import batch_greeks
+
+
+def test_shards_are_sized_for_the_workers_of_a_given_pool():
+    K = np.linspace(80.0, 160.0, 1_000)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        result, stats = parallel_greeks(1.0, K, 120.0, 20.0, 5.0, 0.0, workers=2, shards_per_worker=3, pool=pool)
+
+    assert sum(stat.shards for stat in stats) == 2 * 3
+    assert sum(stat.rows for stat in stats) == K.size
+    np.testing.assert_allclose(result.call_price, batch_greeks(1.0, K, 120.0, 20.0, 5.0, 0.0).call_price)
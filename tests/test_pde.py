@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from benchmarks.bench_pde import accuracy_cases
+from models.bsm_model import BlackScholes
+from models.pde import pde_price
+
+CASES = accuracy_cases()
+
+
+@pytest.mark.parametrize("value, reference, tolerance", [case[1:] for case in CASES], ids=[case[0] for case in CASES])
+def test_accuracy_against_the_closed_forms_and_a_binomial_tree(value, reference, tolerance):
+    assert abs(value() - reference()) <= tolerance
+
+
+def test_strip_of_strikes_matches_separate_solves():
+    strikes = np.array([90.0, 100.0, 110.0])
+    strip = pde_price(1.0, strikes, 100.0, 20.0, 5.0, 0.0, "put", s_max=250.0)
+    for strike, price in zip(strikes, strip.price):
+        assert price == pytest.approx(pde_price(1.0, strike, 100.0, 20.0, 5.0, 0.0, "put", s_max=250.0).price, abs=1e-12)
+        assert price == pytest.approx(BlackScholes(1.0, strike, 100.0, 20.0, 5.0, 0.0).put_price, abs=1e-2)
+
+
+def test_american_put_is_worth_at_least_the_european_and_its_exercise_value():
+    european = pde_price(1.0, 100.0, 90.0, 20.0, 5.0, 0.0, "put")
+    american = pde_price(1.0, 100.0, 90.0, 20.0, 5.0, 0.0, "put", "american")
+    assert american.price > european.price
+    assert np.all(american.prices >= np.maximum(100.0 - american.spots, 0.0) - 1e-12)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        pde_price(1.0, 100.0, 100.0, 20.0, 5.0, 0.0, exercise="bermudan")
+    with pytest.raises(ValueError):
+        pde_price(1.0, 100.0, 100.0, 20.0, 5.0, 0.0, barrier=90.0)
+    with pytest.raises(ValueError):
+        pde_price(1.0, 100.0, 80.0, 20.0, 5.0, 0.0, barrier=90.0, barrier_type="down-and-out")
@@ -0,0 +1,88 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from models.bsm_leland_model import BlackScholesLeland
+from models.bsm_model import BlackScholes
+from models.bsm_vectorized import batch_greeks
+from models.contracts import OptionContracts
+from models.records import FrozenRecord, lazy_slot
+
+
+class Square(FrozenRecord):
+    __slots__ = ("side", "_area")
+    calls = 0
+
+    def __init__(self, side):
+        object.__setattr__(self, "side", side)
+
+    @lazy_slot
+    def area(self):
+        Square.calls += 1
+        return self.side**2
+
+
+def test_lazy_slot_computes_once_and_is_not_copied():
+    Square.calls = 0
+    square = Square(3)
+    assert square._field_names == ("side",)
+    assert square.area == 9 and square.area == 9 and Square.calls == 1
+
+    bigger = square._copy(side=4)
+    assert bigger.area == 16 and Square.calls == 2
+
+
+def test_frozen_record_is_immutable_and_pickles_its_fields():
+    square = Square(3)
+    with pytest.raises(AttributeError):
+        square.side = 4
+    with pytest.raises(AttributeError):
+        del square.side
+
+    square.area
+    restored = pickle.loads(pickle.dumps(square))
+    assert restored.side == 3 and restored.area == 9
+
+
+def test_model_records():
+    record = BlackScholes(1.0, 100.0, 120.0, 20.0, 5.0, 1.0)
+    assert record.v == pytest.approx(0.2)
+    assert record.calculate_prices() == record.prices
+    with pytest.raises(AttributeError):
+        record.K = 90.0
+    assert record.with_volatility(30.0).call_price > record.call_price
+
+    leland = pickle.loads(pickle.dumps(BlackScholesLeland(1.0, 100.0, 120.0, 20.0, 5.0, 1.0, 1.0, 5.0)))
+    assert leland.call_price > record.call_price
+
+
+def test_book_leaves_the_callers_arrays_writable():
+    T = np.linspace(0.5, 2.0, 4)
+    K = np.linspace(90.0, 150.0, 4)
+    book = OptionContracts(T, K, 120.0, 20.0, 5.0, 1.0)
+
+    K[0] = 1.0
+    T[0] = 1.0
+    assert book.K[0] == 1.0  # the book shares the memory, it does not copy it
+    with pytest.raises(ValueError):
+        book.K[1] = 1.0
+    with pytest.raises(AttributeError):
+        book.K = K
+
+
+def test_book_matches_the_records():
+    T = np.array([[0.5], [1.5]])
+    K = np.array([90.0, 120.0, 150.0])
+    book = OptionContracts(T, K, 120.0, 20.0, 5.0, 1.0, 1.0, 5.0)
+    assert book.shape == (2, 3) and len(book) == 6
+
+    np.testing.assert_allclose(book.prices()[0], batch_greeks(T, K, 120.0, 20.0, 5.0, 1.0).call_price)
+    for index in range(len(book)):
+        record = book.record(index)
+        assert isinstance(record, BlackScholesLeland)
+        assert book.prices("leland")[0].flat[index] == pytest.approx(record.call_price)
+
+    rebuilt = OptionContracts.from_records([book.record(index) for index in range(len(book))])
+    np.testing.assert_allclose(rebuilt.K, book.K.ravel())
+    np.testing.assert_allclose(rebuilt.dt, 5.0)
@@ -1,6 +1,5 @@
 import streamlit as st
-from PIL import Image
-from functions.helper import get_image_as_base64
+from functions.assets import image_base64, image_bytes
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -9,8 +8,8 @@ st.set_page_config(
     layout="wide"
 )
 
-linkedin_logo_b64 = get_image_as_base64('assets/linkedin.png')
-github_logo_b64 = get_image_as_base64('assets/github.png')
+linkedin_logo_b64 = image_base64('linkedin')
+github_logo_b64 = image_base64('github')
 
 # --- Sidebar Styling ---
 st.markdown("""
@@ -41,10 +40,10 @@ with st.sidebar:
 # --- Profile Section ---
 col1, col2 = st.columns([0.3, 0.7], gap="small")
 with col1:
-    try:
-        profile_pic = Image.open('assets/profile-pic-v3.png')
+    profile_pic = image_bytes('profile')
+    if profile_pic is not None:
         st.image(profile_pic, width=350)
-    except FileNotFoundError:
+    else:
         st.info("Add a profile picture to assets to display an image here.")
 
 
@@ -6,6 +6,7 @@ from functions.computations import (
     get_bsm_prices,
     get_leland_prices,
     get_implied_volatility,
+    get_greeks_by_model,
     get_theta,
     get_vega,
     get_gamma,
@@ -16,8 +17,11 @@ from functions.computations import (
 from functions.helper import (
     generate_bsm_option_surface,
     generate_leland_option_surface,
-    generate_bsm_vs_leland_option_surface
+    generate_bsm_vs_leland_option_surface,
+    start_instrumentation,
+    display_instrumentation_panel
 )
+from core.instrumentation import timed
 
 st.set_page_config(
     page_title="Black-Scholes Model",
@@ -26,6 +30,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+start_instrumentation("bsm")
+
 # --- Sidebar Styling ---
 st.markdown("""
     <style>
@@ -64,12 +70,14 @@ with st.sidebar:
         strike_max = st.number_input('Max Strike Price', min_value=1.0, value=S*1.2, step=0.1, key="strike_max")
         maturity_min = st.slider('Min Time to Maturity', min_value=0.1, max_value=2.0, value=0.1, step=0.1, key="maturity_min")
         maturity_max = st.slider('Max Time to Maturity', min_value=0.1, max_value=2.0, value=2.0, step=0.1, key="maturity_max")
+        resolution = st.slider('Surface Resolution (points per axis)', min_value=10, max_value=100, value=30, step=5, key="resolution")
+        adaptive = st.toggle("Adaptive mesh", value=False, key="adaptive_mesh", help="Spend the same point budget where the surface bends most (near the money and close to expiry) for sharper plots")
+        st.toggle("Interactive 3D plots", value=False, key="interactive_plots", help="Rotate and zoom the surfaces in the browser instead of with the view sliders")
 
-# --- TABS ---
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["Black-Scholes Model", "Leland's Model","BSM Vs BSML", "Option Surface Picker", "Implied Volatility & Greeks", "Implied Volatility & Greeks Picker"])
+    st.toggle("Performance instrumentation", value=False, key="instrumentation", help="Time every computation, surface and render on each rerun and show the breakdown below")
 
 # --- TAB 1: STANDARD BLACK-SCHOLES PLOTS ---
-with tab1:
+def bsm_tab(T, K, S, v, r, q, plot_range, surface_options) -> None:
     st.header("Black-Scholes Model Pricing")
     call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
     call_price_on_expiry = max(S - K, 0)
@@ -83,7 +91,7 @@ with tab1:
             st.metric("Value at Expiry", f"${call_price_on_expiry:.2f}")
         with col1_2:
             st.metric("Current Premium", f"${call_price - call_price_on_expiry:.2f}")
-        generate_bsm_option_surface("Call", strike_min, strike_max, maturity_min, maturity_max, S, v, r, q)
+        generate_bsm_option_surface("Call", *plot_range, S, v, r, q, **surface_options)
     with col2:
         st.header("Put Option Value")
         col2_1, col2_2 = st.columns(2)
@@ -91,12 +99,16 @@ with tab1:
             st.metric("Value at Expiry", f"${put_price_on_expiry:.2f}")
         with col2_2:
             st.metric("Current Premium", f"${put_price - put_price_on_expiry:.2f}")
-        generate_bsm_option_surface("Put", strike_min, strike_max, maturity_min, maturity_max, S, v, r, q)
+        generate_bsm_option_surface("Put", *plot_range, S, v, r, q, **surface_options)
+
 
 # --- TAB 2: LELAND'S MODEL PLOTS ---
-with tab2:
+def leland_tab(T, K, S, v, r, q, k, dt, plot_range, surface_options) -> None:
     st.header("Leland's Model with Transaction Costs and Dividend Yield")
 
+    call_price_on_expiry = max(S - K, 0)
+    put_price_on_expiry = max(K - S, 0)
+
     if dt > 0:
         l_call_price, l_put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
 
@@ -108,7 +120,7 @@ with tab2:
                 st.metric("Value at Expiry", f"${call_price_on_expiry:.2f}")
             with col1_2:
                 st.metric("Current Premium", f"${l_call_price - call_price_on_expiry:.2f}")
-            generate_leland_option_surface("Call", strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt)
+            generate_leland_option_surface("Call", *plot_range, S, v, r, q, k, dt, **surface_options)
 
         with col2:
             st.header("Put Option Value")
@@ -117,17 +129,21 @@ with tab2:
                 st.metric("Value at Expiry", f"${put_price_on_expiry:.2f}")
             with col2_2:
                 st.metric("Current Premium", f"${l_put_price - put_price_on_expiry:.2f}")
-            generate_leland_option_surface("Put", strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt)
+            generate_leland_option_surface("Put", *plot_range, S, v, r, q, k, dt, **surface_options)
 
     else:
         st.warning("Enter a Δ Time (in the sidebar) greater than zero to display Leland's Model results.")
 
+
 # --- Tab 3: BSM vs Leland's Model Option Surface ---
-with tab3:
+def bsm_vs_leland_tab(T, K, S, v, r, q, k, dt, plot_range, surface_options) -> None:
     st.header("Black-Scholes vs Leland's Model Option Surface")
 
     st.divider()
 
+    call_price_on_expiry = max(S - K, 0)
+    put_price_on_expiry = max(K - S, 0)
+
     if dt > 0:
         
         Le_call_price, Le_put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
@@ -148,7 +164,7 @@ with tab3:
             with col1_bsm_c:
                 st.metric("Value at Expiry", f"${call_price_on_expiry:.2f}")
             with col2_bsm_c:
-                st.metric("Current Premium", f"${call_price - call_price_on_expiry:.2f}")
+                st.metric("Current Premium", f"${bs_Call_price - call_price_on_expiry:.2f}")
 
         with col2:
             st.subheader("Leland's")
@@ -157,7 +173,7 @@ with tab3:
             with col1_le_c:
                 st.metric("Value at Expiry", f"${call_price_on_expiry:.2f}")
             with col2_le_c:
-                st.metric("Current Premium", f"${l_call_price - call_price_on_expiry:.2f}")
+                st.metric("Current Premium", f"${Le_call_price - call_price_on_expiry:.2f}")
 
         with col3:
             st.subheader("Black-Scholes")
@@ -165,7 +181,7 @@ with tab3:
             with col1_bsm_p:
                 st.metric("Value at Expiry", f"${put_price_on_expiry:.2f}")
             with col2_bsm_p:
-                st.metric("Current Premium", f"${put_price - put_price_on_expiry:.2f}")
+                st.metric("Current Premium", f"${bs_Put_price - put_price_on_expiry:.2f}")
         
         with col4:
             st.subheader("Leland's")
@@ -173,20 +189,22 @@ with tab3:
             with col1_le_p:
                 st.metric("Value at Expiry", f"${put_price_on_expiry:.2f}")
             with col2_le_p:
-                st.metric("Current Premium", f"${l_put_price - put_price_on_expiry:.2f}")
+                st.metric("Current Premium", f"${Le_put_price - put_price_on_expiry:.2f}")
 
         col1_g, col2_g = st.columns(2)
 
         with col1_g:
-            generate_bsm_vs_leland_option_surface("Call", strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt)
+            generate_bsm_vs_leland_option_surface("Call", *plot_range, S, v, r, q, k, dt, **surface_options)
 
         with col2_g:
-            generate_bsm_vs_leland_option_surface("Put", strike_min, strike_max, maturity_min, maturity_max, S, v, r, q, k, dt)
+            generate_bsm_vs_leland_option_surface("Put", *plot_range, S, v, r, q, k, dt, **surface_options)
     else:
         st.warning("Enter a Δ Time (in the sidebar) greater than zero to display Leland's Model results.")
 
+
 # --- TAB 4: OPTION SURFACE PICKER ---
-with tab4:
+@st.fragment
+def surface_picker_tab(S, v, r, q, k, dt, plot_range, surface_options) -> None:
     col1, col2, col3 = st.columns([1, 1.5, 0.5])
 
     with col1:
@@ -222,20 +240,27 @@ with tab4:
         if bsm_model == "Black-Scholes":
             generate_bsm_option_surface(
                 option_surface_type, 
-                strike_min, strike_max, maturity_min, maturity_max, 
+                *plot_range, 
                 S, v, r, q, 
-                elevation=elevation_val, rotation=rotation_val
+                elevation=elevation_val, rotation=rotation_val,
+                **surface_options
             )
         elif bsm_model == "Leland's Model":
             generate_leland_option_surface(
                 option_surface_type, 
-                strike_min, strike_max, maturity_min, maturity_max, 
+                *plot_range, 
                 S, v, r, q, k, dt, 
-                elevation=elevation_val, rotation=rotation_val
+                elevation=elevation_val, rotation=rotation_val,
+                **surface_options
             )
 
+
 # --- TAB 5: IMPLIED VOLATILITY AND GREEKS CALCULATION ---
-with tab5:
+@st.fragment
+def greeks_calculator_tab(T, K, S, v, r, q, k, dt) -> None:
+    call_price_on_expiry = max(S - K, 0)
+    put_price_on_expiry = max(K - S, 0)
+
 
     col1_tab5, col2_tab5, col3_tab5 = st.columns([3, 8, 3])
 
@@ -278,7 +303,7 @@ with tab5:
                 if model_type == "Leland's Model":
                     if dt <= 0:
                         st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
-                        st.stop()
+                        return
                     call_price, put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
                 else:
                     call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
@@ -354,19 +379,10 @@ with tab5:
                     with col2_1:
                         st.metric(f"Implied Volatility for {option_type}", f"{greek_output:.3f}")
 
-# --- TAB 6: IMPLIED VOLATILITY AND GREEKS PICKER CALCULATION ---
-with tab6:
-    col1_page, col2_page, col3_page = st.columns([1, 1, 1])
-
-    with col1_page:
-        st.header("Put & Call")
 
-        with st.container(border=True):
-            st.subheader("Implied Volatility Calculation")
-            st.write("Calculate the Implied Volatility of an option given its market price.")
-            with st.expander("View Variables that impact **Implied Volatility**"):
-                st.markdown(
-                    """
+# --- TAB 6: IMPLIED VOLATILITY AND GREEKS PICKER CALCULATION ---
+# variables shown in each card's expander
+IMPLIED_VOLATILITY_VARIABLES = """
                     - **$S$**: Current price of the underlying asset
                     - **$K$**: Strike price of the option
                     - **$T-t$**: Time to expiration (in years)
@@ -376,422 +392,227 @@ with tab6:
                     - **$k$**: Transaction costs (For Leland's model)
                     - **$dt$**: Time delta (For Leland's model)
                     """
-            )
-
-            model_type = st.selectbox(
-                f"Select Model for Implied Volatility Calculation",
-                ["Black-Scholes", "Leland's Model"],
-                index=0,
-                key=f"Implied Volatility_model_type"
-            )
-
-            if model_type == "Leland's Model":
-                if dt <= 0:
-                    st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
-                    st.stop()
-                call_price, put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
-            else:
-                call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
-                
-            option_type = st.selectbox(
-                f"Select Option Type for Implied Volatility Calculation",
-                ["Call", "Put"],
-                index=0,
-                key=f"Implied Volatility_option_type"
-                )
-            
-            option_type_market_price = st.number_input(
-                    "Market Price of the Option $",
-                    min_value=0.0,
-                    value=float(call_price_on_expiry * 1.5 if option_type == "Call" else put_price_on_expiry * 1.5),
-                    format="%.2f",
-                    step= 0.01,
-                    key=f"Implied Volatility_market_price"
-                )
-
-            option_type_market_price = float(option_type_market_price) # fix for whole numbers not being handled right
-
-            if option_type == "Call":
-                option_price = call_price
-            else:
-                option_price = put_price
-
-            greek_output = get_implied_volatility(T, K, S, v, r, q, k, dt, option_type, option_type_market_price, model_type)
-
-            with st.container(border=True):
-                col1_1, col2_1 = st.columns(2)
-                with col1_1:
-                    st.metric(f"{option_type} Option Model Price", f"${option_price:.2f}")
-                with col2_1:
-                    st.metric(f"Implied Volatility for {option_type}", f"{greek_output:.3f}")
-
-        with st.container(border=True):
-            st.subheader("Vega Calculation")
-            st.write("Calculate the Vega of an option given its market price.")
-            with st.expander("View Variables that impact **Vega** the most"):
-                st.markdown(
-                    """
+VEGA_VARIABLES = """
                     - **$T-t$**: Time to expiry is the most important factor for Vega. As time to expiry increases, Vega increases.
                     - **$K$**: The strike price of the option. Vega is highest when the option is at-the-money.
                     - **$\\sigma$**: Volatility of the underlying asset's returns. Higher volatility increases Vega.
                     """
-            )
+GAMMA_VARIABLES = """
+                    - **$T-t$**: Time to expiry is the most important factor for Gamma. As time to expiry decreases, Gamma increases.
+                    - **$K$**: The strike price of the option. Gamma is highest when the option is at-the-money.
+                    """
+CALL_DELTA_VARIABLES = """
+                    - **$$$**: Money-ness of the option.
+                        - **In-the-money**: Strike price below the current stock price.
+                        - **At-the-money**: Strike price equal to the current stock price.
+                        - **Out-of-the-money**: Strike price above the current stock price.
+                    - **$T-t$**: Time to expiration (in years)
+                    - **$\\sigma$**: Volatility of the underlying asset's returns
+                    """
+PUT_DELTA_VARIABLES = """
+                    - **$$$**: Money-ness of the option.
+                        - **In-the-money**: Strike price above the current stock price.
+                        - **At-the-money**: Strike price equal to the current stock price.
+                        - **Out-of-the-money**: Strike price below the current stock price.
+                    - **$T-t$**: Time to expiration (in years)
+                    - **$\\sigma$**: Volatility of the underlying asset's returns
+                    """
+THETA_RHO_VARIABLES = """
+                    - **$T-t$**: Time to expiration (in years)
+                    - **$K$**: Strike price of the option
+                    - **$\\sigma$**: Volatility of the underlying asset's returns
+                    - **$r$**: Risk-free interest rate
+                    - **$q$**: Dividend yield of the underlying asset
+                    - **$k$**: Transaction costs (For Leland's model)
+                    - **$dt$**: Time delta (For Leland's model)
+                    """
 
-            greek_model = "vega"
-        
-            model_type = st.selectbox(
-                f"Select Model for {greek_model} Calculation",
-                ["Black-Scholes", "Leland's Model"],
-                index=0,
-                key=f"{greek_model}_model_type"
-            )
+# display conventions: vega and rho per 1% move, theta per calendar day
+GREEK_SCALES = {"vega": 100, "gamma": 1, "call_delta": 1, "put_delta": 1, "call_theta": 365, "put_theta": 365, "call_rho": 100, "put_rho": 100}
 
-            if model_type == "Leland's Model":
-                if dt <= 0:
-                    st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
-                    st.stop()
-                call_price, put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
-            else:
-                call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
-                
-            option_type = st.selectbox(
-                f"Select Option Type for {greek_model} Calculation",
-                ["Call", "Put"],
-                index=0,
-                key=f"{greek_model}_option_type"
-            )
 
-            if option_type == "Call":
-                option_price = call_price
-            else:
-                option_price = put_price
+def select_model_greeks(greeks_by_model, key, label) -> tuple:
+    """
+    Model selectbox for one card; returns (model_type, greeks) or (model_type, None) when Leland's model has no Δ Time.
+    """
+    model_type = st.selectbox(
+        f"Select Model for {label} Calculation",
+        ["Black-Scholes", "Leland's Model"],
+        index=0,
+        key=key
+    )
 
-            greek_output = get_vega(T, K, S, v, r, q, k, dt, model_type)
-            greek_output /= 100 # Vega is often expressed per 1% change in volatility, so we divide by 100
+    if model_type not in greeks_by_model:
+        st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
+        return model_type, None
+    return model_type, greeks_by_model[model_type]
 
-            with st.container(border=True):
-                col1_2, col2_2 = st.columns(2)
-                with col1_2:
-                    st.metric(f"{option_type} Option Model Price", f"${option_price:.2f}")
-                with col2_2:
-                    st.metric(f"{greek_model} for {option_type}", f"{greek_output:.3f}")
 
-        with st.container(border=True):
-            st.subheader("Gamma Calculation")
-            st.write("Calculate the Gamma of an option given its market price.")
-            with st.expander("View Variables that impact **Gamma** the most"):
-                st.markdown(
-                    """
-                    - **$T-t$**: Time to expiry is the most important factor for Gamma. As time to expiry decreases, Gamma increases.
-                    - **$K$**: The strike price of the option. Gamma is highest when the option is at-the-money.
-                    """
-            )
+def greek_card(greeks_by_model, title, description, expander_title, variables, greek_model, field, model_key, option_type=None, option_key=None) -> None:
+    """
+    One Greek card rendered from the precomputed results of both models.
+    Cards for a fixed option type pass option_type; the rest let the user pick it with option_key.
+    """
+    with st.container(border=True):
+        st.subheader(title)
+        st.write(description)
+        with st.expander(expander_title):
+            st.markdown(variables)
 
-            greek_model = "Gamma"
-        
-            model_type = st.selectbox(
-                f"Select Model for {greek_model} Calculation",
-                ["Black-Scholes", "Leland's Model"],
-                index=0,
-                key=f"{greek_model}_model_type"
-            )
+        model_type, greeks = select_model_greeks(greeks_by_model, model_key, greek_model)
+        if greeks is None:
+            return
 
-            if model_type == "Leland's Model":
-                if dt <= 0:
-                    st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
-                    st.stop()
-                call_price, put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
-            else:
-                call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
-                
+        if option_type is None:
             option_type = st.selectbox(
                 f"Select Option Type for {greek_model} Calculation",
                 ["Call", "Put"],
                 index=0,
-                key=f"{greek_model}_option_type"
+                key=option_key
             )
 
-            if option_type == "Call":
-                option_price = call_price
-            else:
-                option_price = put_price
+        option_price = greeks.call_price if option_type == "Call" else greeks.put_price
+        greek_output = getattr(greeks, field) / GREEK_SCALES[field]
 
-            greek_output = get_gamma(T, K, S, v, r, q, k, dt, model_type)
+        with st.container(border=True):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric(f"{option_type} Option Model Price", f"${option_price:.2f}")
+            with col2:
+                st.metric(f"{greek_model} for {option_type}", f"{greek_output:.3f}")
+
+
+def greeks_summary_table(greeks_by_model) -> list:
+    """
+    Every price and Greek of both models side by side, in the cards' display units.
+    """
+    rows = [("Price $", "call_price", "put_price", 1), ("Delta", "call_delta", "put_delta", 1), ("Gamma", "gamma", "gamma", 1),
+            ("Vega (per 1%)", "vega", "vega", 100), ("Theta (per day)", "call_theta", "put_theta", 365), ("Rho (per 1%)", "call_rho", "put_rho", 100)]
+    table = []
+    for name, call_field, put_field, scale in rows:
+        row = {"": name}
+        for model_type, greeks in greeks_by_model.items():
+            row[f"{model_type} Call"] = round(float(getattr(greeks, call_field)) / scale, 4)
+            row[f"{model_type} Put"] = round(float(getattr(greeks, put_field)) / scale, 4)
+        table.append(row)
+    return table
+
+
+@st.fragment
+def greeks_picker_tab(T, K, S, v, r, q, k, dt) -> None:
+    call_price_on_expiry = max(S - K, 0)
+    put_price_on_expiry = max(K - S, 0)
 
-            with st.container(border=True):
-                col1_3, col2_3 = st.columns(2)
-                with col1_3:
-                    st.metric(f"{option_type} Option Model Price", f"${option_price:.2f}")
-                with col2_3:
-                    st.metric(f"{greek_model} for {option_type}", f"{greek_output:.3f}")
+    # prices and Greeks of both models in one vectorized call; every card below reads from this
+    greeks_by_model = get_greeks_by_model(T, K, S, v, r, q, k, dt)
 
-    with col2_page:
-        st.header("Call")
+    with st.expander("Dashboard: every price and Greek for both models"):
+        st.dataframe(greeks_summary_table(greeks_by_model), hide_index=True)
+
+    col1_page, col2_page, col3_page = st.columns([1, 1, 1])
+
+    with col1_page:
+        st.header("Put & Call")
 
         with st.container(border=True):
-            st.subheader("Call Delta Calculation")
-            st.write("Calculate the Delta of an option given its market price.")
-            with st.expander("View Variables that impact **Delta**"):
-                st.markdown(
-                    """
-                    - **$$$**: Money-ness of the option.
-                        - **In-the-money**: Strike price below the current stock price.
-                        - **At-the-money**: Strike price equal to the current stock price.
-                        - **Out-of-the-money**: Strike price above the current stock price.
-                    - **$T-t$**: Time to expiration (in years)
-                    - **$\\sigma$**: Volatility of the underlying asset's returns
-                    """
-            )
+            st.subheader("Implied Volatility Calculation")
+            st.write("Calculate the Implied Volatility of an option given its market price.")
+            with st.expander("View Variables that impact **Implied Volatility**"):
+                st.markdown(IMPLIED_VOLATILITY_VARIABLES)
 
-            greek_model = "Delta"
-            option_type = "Call"
-        
-            model_type = st.selectbox(
-                f"Select Model for {greek_model} Calculation",
-                ["Black-Scholes", "Leland's Model"],
-                index=0,
-                key=f"{greek_model}_call"
-            )
+            model_type, greeks = select_model_greeks(greeks_by_model, "Implied Volatility_model_type", "Implied Volatility")
+            if greeks is not None:
+                option_type = st.selectbox(
+                    f"Select Option Type for Implied Volatility Calculation",
+                    ["Call", "Put"],
+                    index=0,
+                    key=f"Implied Volatility_option_type"
+                    )
 
-            if model_type == "Leland's Model":
-                if dt <= 0:
-                    st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
-                    st.stop()
-                call_price, put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
-            else:
-                call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
+                option_type_market_price = st.number_input(
+                        "Market Price of the Option $",
+                        min_value=0.0,
+                        value=float(call_price_on_expiry * 1.5 if option_type == "Call" else put_price_on_expiry * 1.5),
+                        format="%.2f",
+                        step= 0.01,
+                        key=f"Implied Volatility_market_price"
+                    )
 
-            Call_Delta, Put_Delta = get_delta(T, K, S, v, r, q, k, dt, model_type)
+                option_type_market_price = float(option_type_market_price) # fix for whole numbers not being handled right
 
-            with st.container(border=True):
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric(f"{option_type} Option Model Price", f"${call_price:.2f}")
-                with col2:
-                    st.metric(f"{greek_model} for {option_type}", f"{Call_Delta:.3f}")
+                option_price = greeks.call_price if option_type == "Call" else greeks.put_price
 
-        with st.container(border=True):
-            st.subheader("Call Theta Calculation")
-            st.write("Calculate the Theta of a call option given its market price.")
-            with st.expander("View Variables that impact **Theta**"):
-                st.markdown(
-                    """
-                    - **$T-t$**: Time to expiration (in years)
-                    - **$K$**: Strike price of the option
-                    - **$\\sigma$**: Volatility of the underlying asset's returns
-                    - **$r$**: Risk-free interest rate
-                    - **$q$**: Dividend yield of the underlying asset
-                    - **$k$**: Transaction costs (For Leland's model)
-                    - **$dt$**: Time delta (For Leland's model)
-                    """
-                )
+                greek_output = get_implied_volatility(T, K, S, v, r, q, k, dt, option_type, option_type_market_price, model_type)
 
-            greek_model = "Theta"
-            option_type = "Call"
-        
-            model_type = st.selectbox(
-                f"Select Model for {greek_model} Calculation",
-                ["Black-Scholes", "Leland's Model"],
-                index=0,
-                key=f"{greek_model}_call_theta"
-            )
+                with st.container(border=True):
+                    col1_1, col2_1 = st.columns(2)
+                    with col1_1:
+                        st.metric(f"{option_type} Option Model Price", f"${option_price:.2f}")
+                    with col2_1:
+                        st.metric(f"Implied Volatility for {option_type}", f"{greek_output:.3f}")
 
-            if model_type == "Leland's Model":
-                if dt <= 0:
-                    st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
-                    st.stop()
-                call_price, put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
-            else:
-                call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
-
-            theta_call, theta_put = get_theta(T, K, S, v, r, q, k, dt, model_type)
-            # theta is often expressed per day, so we divide by 365
-            theta_call /= 365
-
-            with st.container(border=True):
-                col1_2, col2_2 = st.columns(2)
-                with col1_2:
-                    st.metric(f"{option_type} Option Model Price", f"${call_price:.2f}")
-                with col2_2:
-                    st.metric(f"{greek_model} for {option_type}", f"{theta_call:.3f}")
-        
-        with st.container(border=True):
-            st.subheader("Call Rho Calculation")
-            st.write("Calculate the Rho of a call option given its market price.")
-            with st.expander("View Variables that impact **Rho**"):
-                st.markdown(
-                    """
-                    - **$T-t$**: Time to expiration (in years)
-                    - **$K$**: Strike price of the option
-                    - **$\\sigma$**: Volatility of the underlying asset's returns
-                    - **$r$**: Risk-free interest rate
-                    - **$q$**: Dividend yield of the underlying asset
-                    - **$k$**: Transaction costs (For Leland's model)
-                    - **$dt$**: Time delta (For Leland's model)
-                    """
-                )
+        greek_card(greeks_by_model, "Vega Calculation", "Calculate the Vega of an option given its market price.",
+                   "View Variables that impact **Vega** the most", VEGA_VARIABLES, "vega", "vega", model_key="vega_model_type", option_key="vega_option_type")
+        greek_card(greeks_by_model, "Gamma Calculation", "Calculate the Gamma of an option given its market price.",
+                   "View Variables that impact **Gamma** the most", GAMMA_VARIABLES, "Gamma", "gamma", model_key="Gamma_model_type", option_key="Gamma_option_type")
 
-            greek_model = "Rho"
-            option_type = "Call"
-        
-            model_type = st.selectbox(
-                f"Select Model for {greek_model} Calculation",
-                ["Black-Scholes", "Leland's Model"],
-                index=0,
-                key=f"{greek_model}_call_rho"
-            )
+    with col2_page:
+        st.header("Call")
+        greek_card(greeks_by_model, "Call Delta Calculation", "Calculate the Delta of an option given its market price.",
+                   "View Variables that impact **Delta**", CALL_DELTA_VARIABLES, "Delta", "call_delta", model_key="Delta_call", option_type="Call")
+        greek_card(greeks_by_model, "Call Theta Calculation", "Calculate the Theta of a call option given its market price.",
+                   "View Variables that impact **Theta**", THETA_RHO_VARIABLES, "Theta", "call_theta", model_key="Theta_call_theta", option_type="Call")
+        greek_card(greeks_by_model, "Call Rho Calculation", "Calculate the Rho of a call option given its market price.",
+                   "View Variables that impact **Rho**", THETA_RHO_VARIABLES, "Rho", "call_rho", model_key="Rho_call_rho", option_type="Call")
 
-            if model_type == "Leland's Model":
-                if dt <= 0:
-                    st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
-                    st.stop()
-                call_price, put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
-            else:
-                call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
-
-            rho_call, rho_put = get_rho(T, K, S, v, r, q, k, dt, model_type)
-            # rho is often expressed per 1% change in interest rates, so we divide by 100
-            rho_call /= 100
-
-            with st.container(border=True):
-                col1_2, col2_2 = st.columns(2)
-                with col1_2:
-                    st.metric(f"{option_type} Option Model Price", f"${call_price:.2f}")
-                with col2_2:
-                    st.metric(f"{greek_model} for {option_type}", f"{rho_call:.3f}")
-                    
     with col3_page:
         st.header("Put")
+        greek_card(greeks_by_model, "Put Delta Calculation", "Calculate the Delta of a put option given its market price.",
+                   "View Variables that impact **Delta**", PUT_DELTA_VARIABLES, "Delta", "put_delta", model_key="Delta_put", option_type="Put")
+        greek_card(greeks_by_model, "Put Theta Calculation", "Calculate the Theta of a put option given its market price.",
+                   "View Variables that impact **Theta**", THETA_RHO_VARIABLES, "Theta", "put_theta", model_key="Theta_put_theta", option_type="Put")
+        greek_card(greeks_by_model, "Put Rho Calculation", "Calculate the Rho of a put option given its market price.",
+                   "View Variables that impact **Rho**", THETA_RHO_VARIABLES, "Rho", "put_rho", model_key="Rho_put_rho", option_type="Put")
 
-        with st.container(border=True):
-            st.subheader("Put Delta Calculation")
-            st.write("Calculate the Delta of a put option given its market price.")
-            with st.expander("View Variables that impact **Delta**"):
-                st.markdown(
-                    """
-                    - **$$$**: Money-ness of the option.
-                        - **In-the-money**: Strike price above the current stock price.
-                        - **At-the-money**: Strike price equal to the current stock price.
-                        - **Out-of-the-money**: Strike price below the current stock price.
-                    - **$T-t$**: Time to expiration (in years)
-                    - **$\\sigma$**: Volatility of the underlying asset's returns
-                    """
-            )
 
-            greek_model = "Delta"
-            option_type = "Put"
-        
-            model_type = st.selectbox(
-                f"Select Model for {greek_model} Calculation",
-                ["Black-Scholes", "Leland's Model"],
-                index=0,
-                key=f"{greek_model}_put"
-            )
+# --- TABS ---
+# tabs rerun the page when switched, so only the open tab's body runs on each rerun
+tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
+    ["Black-Scholes Model", "Leland's Model","BSM Vs BSML", "Option Surface Picker", "Implied Volatility & Greeks", "Implied Volatility & Greeks Picker"],
+    key="bsm_tab",
+    on_change="rerun"
+)
+plot_range = (strike_min, strike_max, maturity_min, maturity_max)
+surface_options = dict(resolution=resolution, adaptive=adaptive)
 
-            if model_type == "Leland's Model":
-                if dt <= 0:
-                    st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
-                    st.stop()
-                call_price, put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
-            else:
-                call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
-
-            Call_Delta, Put_Delta = get_delta(T, K, S, v, r, q, k, dt, model_type)
-
-            with st.container(border=True):
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric(f"{option_type} Option Model Price", f"${put_price:.2f}")
-                with col2:
-                    st.metric(f"{greek_model} for {option_type}", f"{Put_Delta:.3f}")
-        
-        with st.container(border=True):
-            st.subheader("Put Theta Calculation")
-            st.write("Calculate the Theta of a put option given its market price.")
-            with st.expander("View Variables that impact **Theta**"):
-                st.markdown(
-                    """
-                    - **$T-t$**: Time to expiration (in years)
-                    - **$K$**: Strike price of the option
-                    - **$\\sigma$**: Volatility of the underlying asset's returns
-                    - **$r$**: Risk-free interest rate
-                    - **$q$**: Dividend yield of the underlying asset
-                    - **$k$**: Transaction costs (For Leland's model)
-                    - **$dt$**: Time delta (For Leland's model)
-                    """
-                )
+with tab1:
+    if tab1.open:
+        with timed("Black-Scholes Model", "tab"):
+            bsm_tab(T, K, S, v, r, q, plot_range, surface_options)
 
-            greek_model = "Theta"
-            option_type = "Put"
-        
-            model_type = st.selectbox(
-                f"Select Model for {greek_model} Calculation",
-                ["Black-Scholes", "Leland's Model"],
-                index=0,
-                key=f"{greek_model}_put_theta"
-            )
+with tab2:
+    if tab2.open:
+        with timed("Leland's Model", "tab"):
+            leland_tab(T, K, S, v, r, q, k, dt, plot_range, surface_options)
 
-            if model_type == "Leland's Model":
-                if dt <= 0:
-                    st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
-                    st.stop()
-                call_price, put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
-            else:
-                call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
-
-            theta_call, theta_put = get_theta(T, K, S, v, r, q, k, dt, model_type)
-            # theta is often expressed per day, so we divide by 365
-            theta_put /= 365
-
-            with st.container(border=True):
-                col1_2, col2_2 = st.columns(2)
-                with col1_2:
-                    st.metric(f"{option_type} Option Model Price", f"${put_price:.2f}")
-                with col2_2:
-                    st.metric(f"{greek_model} for {option_type}", f"{theta_put:.3f}")
-                    
-        with st.container(border=True):
-            st.subheader("Put Rho Calculation")
-            st.write("Calculate the Rho of a put option given its market price.")
-            with st.expander("View Variables that impact **Rho**"):
-                st.markdown(
-                    """
-                    - **$T-t$**: Time to expiration (in years)
-                    - **$K$**: Strike price of the option
-                    - **$\\sigma$**: Volatility of the underlying asset's returns
-                    - **$r$**: Risk-free interest rate
-                    - **$q$**: Dividend yield of the underlying asset
-                    - **$k$**: Transaction costs (For Leland's model)
-                    - **$dt$**: Time delta (For Leland's model)
-                    """
-                )
+with tab3:
+    if tab3.open:
+        with timed("BSM Vs BSML", "tab"):
+            bsm_vs_leland_tab(T, K, S, v, r, q, k, dt, plot_range, surface_options)
 
-            greek_model = "Rho"
-            option_type = "Put"
-        
-            model_type = st.selectbox(
-                f"Select Model for {greek_model} Calculation",
-                ["Black-Scholes", "Leland's Model"],
-                index=0,
-                key=f"{greek_model}_put_rho"
-            )
+with tab4:
+    if tab4.open:
+        with timed("Option Surface Picker", "tab"):
+            surface_picker_tab(S, v, r, q, k, dt, plot_range, surface_options)
 
-            if model_type == "Leland's Model":
-                if dt <= 0:
-                    st.warning("Please enter a Δ Time (in the sidebar) greater than zero to use Leland's Model.")
-                    st.stop()
-                call_price, put_price = get_leland_prices(T, K, S, v, r, q, k, dt)
-            else:
-                call_price, put_price = get_bsm_prices(T, K, S, v, r, q)
-
-            rho_call, rho_put = get_rho(T, K, S, v, r, q, k, dt, model_type)
-            # rho is often expressed per 1% change in interest rates, so we divide by 100
-            rho_put /= 100
-            
-            with st.container(border=True):
-                col1_2, col2_2 = st.columns(2)
-                with col1_2:
-                    st.metric(f"{option_type} Option Model Price", f"${put_price:.2f}")
-                with col2_2:
-                    st.metric(f"{greek_model} for {option_type}", f"{rho_put:.3f}")
+with tab5:
+    if tab5.open:
+        with timed("Implied Volatility & Greeks", "tab"):
+            greeks_calculator_tab(T, K, S, v, r, q, k, dt)
+
+with tab6:
+    if tab6.open:
+        with timed("Implied Volatility & Greeks Picker", "tab"):
+            greeks_picker_tab(T, K, S, v, r, q, k, dt)
 
+display_instrumentation_panel()
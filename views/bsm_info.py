@@ -1,5 +1,5 @@
 import streamlit as st
-from functions.helper import get_image_as_base64
+from functions.assets import image_base64
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -9,8 +9,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-investopedia_logo_b64 = get_image_as_base64('assets/investopedia_logo.png')
-wikipedia_logo_b64 = get_image_as_base64('assets/wikipedia_logo.png')
+investopedia_logo_b64 = image_base64('investopedia')
+wikipedia_logo_b64 = image_base64('wikipedia')
 
 # --- Sidebar Styling ---
 st.markdown("""